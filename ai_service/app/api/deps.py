@@ -38,6 +38,9 @@ if TYPE_CHECKING:
     from app.services.patch_generator import PatchGenerator
     from app.services.prompt_engine import PromptEngine
     from app.services.rag_service import RAGService
+    from app.services.security.authentication_analyzer import AuthenticationAnalyzer
+    from app.services.security.authorization_analyzer import AuthorizationAnalyzer
+    from app.services.security.data_exposure_analyzer import DataExposureAnalyzer
     from app.services.security.security_workflow import SecurityAnalysisWorkflow
     from app.services.smart_fix_service import SmartFixService
     from app.services.test_case_generator import TestCaseGeneratorService
@@ -285,6 +288,30 @@ def get_prompt_engine() -> "PromptEngine":
 # =============================================================================
 
 
+@lru_cache()
+def get_authentication_analyzer() -> "AuthenticationAnalyzer":
+    """Get the shared (stateless) authentication analyzer."""
+    from app.services.security.authentication_analyzer import AuthenticationAnalyzer
+
+    return AuthenticationAnalyzer()
+
+
+@lru_cache()
+def get_authorization_analyzer() -> "AuthorizationAnalyzer":
+    """Get the shared (stateless) authorization analyzer."""
+    from app.services.security.authorization_analyzer import AuthorizationAnalyzer
+
+    return AuthorizationAnalyzer()
+
+
+@lru_cache()
+def get_data_exposure_analyzer() -> "DataExposureAnalyzer":
+    """Get the shared (stateless) data exposure analyzer."""
+    from app.services.security.data_exposure_analyzer import DataExposureAnalyzer
+
+    return DataExposureAnalyzer()
+
+
 async def get_security_workflow(
     llm_service: "LLMService" = Depends(get_llm_service),
 ) -> "SecurityAnalysisWorkflow":
@@ -394,6 +421,11 @@ async def cleanup_dependencies() -> None:
 
     logger.info("Cleaning up dependency singletons")
 
+    # Close the shared Ollama connection pool if the legacy service was created
+    if get_llm_service.cache_info().currsize:
+        await get_llm_service().close()
+        get_llm_service.cache_clear()
+
     # Reset all singletons
     _llm_provider = None
     _cache_repository = None
@@ -19,7 +19,7 @@ Architecture:
             ├── routers/test_generation.py - Test case generation
             ├── routers/mock_server.py     - Mock server management
             ├── routers/patch_operations.py - JSON patch operations
-            ├── routers/rag_knowledge.py   - RAG knowledge base (deprecated, use explanation.py)
+            ├── routers/rag_knowledge.py   - Deprecated alias of explanation.py (not included)
             ├── routers/cache_management.py - Cache statistics and management
             ├── endpoints.py               - Legacy endpoints (deprecated)
             └── repository_endpoints.py    - Repository/MCP client endpoints
@@ -68,7 +68,6 @@ from app.api.v1.routers.mock_server import router as mock_router
 from app.api.v1.routers.patch_operations import router as patch_router
 from app.api.v1.routers.patch_operations import smart_fix_router
 from app.api.v1.routers.prompt import router as prompt_router
-from app.api.v1.routers.rag_knowledge import router as rag_router
 from app.api.v1.routers.remediation import router as remediation_router
 from app.api.v1.routers.repomind_proxy import router as repomind_proxy_router
 from app.api.v1.routers.security_analysis import router as security_router
@@ -128,9 +127,6 @@ api_router.include_router(mock_router)
 api_router.include_router(patch_router)
 api_router.include_router(smart_fix_router)
 
-# RAG Knowledge Base
-api_router.include_router(rag_router)
-
 # Cache Management
 api_router.include_router(cache_router)
 
@@ -187,7 +183,12 @@ ROUTER_METADATA = {
     "explanation": {
         "description": "AI explanations with RAG context (authoritative)",
         "router": "routers/explanation.py",
-        "endpoints": ["/ai/explain", "/ai/rag/status"],
+        "endpoints": [
+            "/ai/explain",
+            "/ai/explain/batch",
+            "/ai/explain/stream",
+            "/ai/rag/status",
+        ],
     },
     "meta_analysis": {
         "description": "Meta-analysis and description quality assessment",
@@ -213,10 +214,12 @@ ROUTER_METADATA = {
         "router": "routers/spec_analysis.py",
         "endpoints": [
             "/ai/analyze/taint-analysis",
+            "/ai/analyze/taint-analysis/stream",
             "/ai/analyze/authz-matrix",
             "/ai/analyze/schema-similarity",
             "/ai/analyze/zombie-apis",
             "/ai/analyze/comprehensive-architecture",
+            "/ai/analyze/comprehensive-architecture/full",
         ],
     },
     "testing": {
@@ -225,6 +228,7 @@ ROUTER_METADATA = {
         "endpoints": [
             "/ai/test-cases/generate",
             "/ai/test-suite/generate",
+            "/ai/test-suite/generate/stream",
             "/tests/generate",
             "/tests/generate/all",
         ],
@@ -249,10 +253,10 @@ ROUTER_METADATA = {
         ],
     },
     "rag_knowledge": {
-        "description": "RAG knowledge base (DEPRECATED - use explanation router)",
+        "description": "Alias of the explanation router (DEPRECATED - use explanation router)",
         "router": "routers/rag_knowledge.py",
         "deprecated": True,
-        "endpoints": ["/ai/rag/status", "/ai/explain"],
+        "endpoints": [],
     },
     "cache": {
         "description": "Cache statistics and management",
@@ -25,6 +25,7 @@ from fastapi.responses import StreamingResponse
 
 from app.api.deps import get_agent_manager, get_context_manager, get_llm_service
 from app.core.logging import set_correlation_id
+from app.core.streaming import STREAM_HEADERS
 from app.schemas.ai_schemas import (
     AIRequest,
     AIResponse,
@@ -130,7 +131,7 @@ async def process_specification_legacy(
             return StreamingResponse(
                 stream_generator(),
                 media_type="text/plain",
-                headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
+                headers={**STREAM_HEADERS, "Connection": "keep-alive"},
             )
 
         # Add conversation turn to context
@@ -23,7 +23,7 @@ Available Routers:
     - test_generation: Test case and test suite generation
     - mock_server: Mock server management and data generation
     - patch_operations: JSON patch generation, application, and smart fixes
-    - rag_knowledge: RAG knowledge base status and explanations
+    - rag_knowledge: Deprecated alias of the explanation router
     - cache_management: Cache statistics and management operations
     - ai_processing: Core AI processing and generation
     - workflows: Workflow execution and context management
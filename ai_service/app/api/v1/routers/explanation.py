@@ -6,35 +6,53 @@ Uses RAG (Retrieval-Augmented Generation) to provide context-aware explanations
 with best practices from a knowledge base.
 """
 
+import asyncio
 import hashlib
-import json
-import logging
 import re
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.api.deps import get_cache_repository, get_llm_service, get_rag_service
 from app.core.config import settings
-from app.core.logging import set_correlation_id
+from app.core.logging import get_logger, set_correlation_id
+from app.core.streaming import (
+    JSON_HEADERS,
+    STREAM_HEADERS,
+    ndjson_line,
+    stream_chat_events,
+)
+from app.schemas.explanation_schemas import (
+    ExplanationBatchRequest,
+    ExplanationRequest,
+)
 
 if TYPE_CHECKING:
     from app.domain.interfaces.cache_repository import ICacheRepository
 
-logger = logging.getLogger(__name__)
+logger = get_logger("explanation")
 
-router = APIRouter(prefix="/ai", tags=["Explanation"])
+router = APIRouter(
+    prefix="/ai", tags=["Explanation"], default_response_class=ORJSONResponse
+)
 
 # Cache key prefix for explanation cache
 _CACHE_PREFIX = "explanation:"
 _EXPLANATION_CACHE_TTL = timedelta(hours=settings.explanation_cache_ttl_hours)
 
+# Knowledge base context budget, in characters at ~4 characters per token
+_KNOWLEDGE_CONTEXT_CHAR_CAP = settings.explanation_context_tokens * 4
+
 
 def _generate_cache_key(rule_id: str, message: str, category: str) -> str:
     """Generate cache key for explanation."""
     key_data = f"{rule_id}:{category}:{message}"
-    return f"{_CACHE_PREFIX}{hashlib.md5(key_data.encode()).hexdigest()}"
+    digest = hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
+    return f"{_CACHE_PREFIX}{digest}"
 
 
 async def _get_cached_explanation(
@@ -66,6 +84,145 @@ async def _cache_explanation(
     await cache.set(cache_key, data, ttl=_EXPLANATION_CACHE_TTL)
 
 
+# Second cache tier: per (rule, category) list of message embeddings pointing
+# at exact cache keys, so reworded messages can reuse an explanation
+_SEMANTIC_INDEX_PREFIX = "explanation:embed:"
+_SEMANTIC_MATCH_THRESHOLD = 0.92
+_SEMANTIC_INDEX_MAX_ENTRIES = 32
+
+
+def _generate_semantic_index_key(rule_id: str, category: str) -> str:
+    """Generate cache key for a rule's explanation embedding index."""
+    key_data = f"{rule_id}:{category}"
+    digest = hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
+    return f"{_SEMANTIC_INDEX_PREFIX}{digest}"
+
+
+async def _get_semantically_cached_explanation(
+    cache: "ICacheRepository",
+    rule_id: str,
+    category: str,
+    embedding: List[float],
+) -> Optional[Dict[str, Any]]:
+    """Get a cached explanation for a near-identical message of the same rule."""
+    index = await cache.get(_generate_semantic_index_key(rule_id, category))
+    if not index:
+        return None
+
+    # Embeddings are unit length, so the dot product is the cosine similarity
+    best_key, best_score = None, _SEMANTIC_MATCH_THRESHOLD
+    for entry in index:
+        score = sum(a * b for a, b in zip(embedding, entry["embedding"]))
+        if score >= best_score:
+            best_key, best_score = entry["cache_key"], score
+
+    if best_key is None:
+        return None
+
+    cached = await cache.get(best_key)
+    if cached:
+        logger.info(
+            f"Returning semantically cached explanation for rule {rule_id} "
+            f"(similarity {best_score:.3f})"
+        )
+    return cached
+
+
+async def _index_explanation_embedding(
+    cache: "ICacheRepository",
+    rule_id: str,
+    message: str,
+    category: str,
+    embedding: List[float],
+) -> None:
+    """Record a freshly cached explanation in its rule's embedding index."""
+    index_key = _generate_semantic_index_key(rule_id, category)
+    index = await cache.get(index_key) or []
+    index.append(
+        {
+            "cache_key": _generate_cache_key(rule_id, message, category),
+            # Four decimals keep the stored index small without moving scores
+            "embedding": [round(value, 4) for value in embedding],
+        }
+    )
+    await cache.set(
+        index_key, index[-_SEMANTIC_INDEX_MAX_ENTRIES:], ttl=_EXPLANATION_CACHE_TTL
+    )
+
+
+# Explanations currently being generated, keyed like the cache so concurrent
+# cold-cache requests for the same issue share a single LLM call
+_INFLIGHT_EXPLANATIONS: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+# Built once at import; per request only the issue fields are substituted.
+_EXPLANATION_PROMPT_TEMPLATE = """You are an OpenAPI expert. Explain this validation issue concisely and professionally.
+
+VALIDATION ISSUE:
+- Rule: {rule_id}
+- Category: {category}
+- Message: {message}
+- Context: {context_json}
+
+KNOWLEDGE BASE:
+{knowledge_context}
+
+SPEC EXCERPT:
+{spec_excerpt}
+
+INSTRUCTIONS:
+1. Provide a clear explanation of why this is an issue (2-3 sentences)
+2. List 2-3 related best practices
+3. Provide 1-2 specific example solutions
+4. Suggest relevant resources (optional)
+
+IMPORTANT: Respond ONLY with valid JSON. Do not include any text before or after the JSON.
+
+{{
+  "explanation": "Brief explanation of the issue and its impact",
+  "severity": "info",
+  "related_best_practices": [
+    "First best practice",
+    "Second best practice"
+  ],
+  "example_solutions": [
+    "First solution approach",
+    "Second solution approach"
+  ],
+  "additional_resources": [
+    "Resource 1",
+    "Resource 2"
+  ]
+}}"""
+
+
+def _format_explanation_context(context: Dict[str, Any]) -> str:
+    """Render the issue context for the explanation prompt."""
+    return orjson.dumps(context).decode() if context else "None"
+
+
+def _build_explanation_prompt(
+    rule_id: str,
+    category: str,
+    message: str,
+    context_json: str,
+    knowledge_context: str,
+    spec_text: str,
+) -> str:
+    """Fill the explanation prompt template for a validation issue."""
+    return _EXPLANATION_PROMPT_TEMPLATE.format_map(
+        {
+            "rule_id": rule_id,
+            "category": category,
+            "message": message,
+            "context_json": context_json,
+            "knowledge_context": knowledge_context,
+            "spec_excerpt": (
+                spec_text[:500] if spec_text else "No specification provided"
+            ),
+        }
+    )
+
+
 def _extract_json_from_response(llm_response: str) -> Optional[Dict[str, Any]]:
     """Extract and parse JSON from LLM response."""
     try:
@@ -80,7 +237,7 @@ def _extract_json_from_response(llm_response: str) -> Optional[Dict[str, Any]]:
             json_str = re.sub(r",\s*]", "]", json_str)
             json_str = re.sub(r",\s*}", "}", json_str)
 
-            result = json.loads(json_str)
+            result = orjson.loads(json_str)
             if isinstance(result, dict):
                 return result
 
@@ -141,9 +298,187 @@ def _manual_extraction(llm_response: str) -> Dict[str, Any]:
     return result
 
 
+async def _prepare_explanation_request(
+    rag_service,
+    rule_id: str,
+    category: str,
+    message: str,
+    spec_text: str,
+    context: Dict[str, Any],
+    stream: bool = False,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Retrieve knowledge base context and build the Ollama chat payload.
+
+    Returns:
+        Tuple of (chat payload, RAG context data).
+    """
+    # Create query for RAG knowledge base
+    rag_query = f"OpenAPI best practices validation {rule_id} {category} {message}"
+
+    # Retrieve knowledge base context while the issue context is serialized;
+    # neither depends on the other
+    context_data, context_json = await asyncio.gather(
+        rag_service.retrieve_security_context(rag_query, n_results=3),
+        run_in_threadpool(_format_explanation_context, context),
+    )
+
+    # Build comprehensive explanation prompt
+    knowledge_context = context_data.get("context", "No additional context available")
+    if len(knowledge_context) > _KNOWLEDGE_CONTEXT_CHAR_CAP:
+        knowledge_context = knowledge_context[:_KNOWLEDGE_CONTEXT_CHAR_CAP] + "..."
+
+    explanation_prompt = _build_explanation_prompt(
+        rule_id, category, message, context_json, knowledge_context, spec_text
+    )
+
+    payload = {
+        "model": settings.default_model,
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are an OpenAPI expert. Always respond with valid JSON only.",
+            },
+            {"role": "user", "content": explanation_prompt},
+        ],
+        "stream": stream,
+        "format": "json",
+        "options": {"temperature": 0.3, "num_predict": 2048},
+    }
+    return payload, context_data
+
+
+def _build_explanation_response(
+    llm_response: str,
+    rule_id: str,
+    category: str,
+    context_data: Dict[str, Any],
+    knowledge_base_available: bool,
+) -> Dict[str, Any]:
+    """Parse the LLM output into the explanation response payload."""
+    # Parse structured response
+    structured_response = _extract_json_from_response(llm_response)
+    if structured_response is None:
+        logger.warning("JSON extraction failed, attempting manual extraction")
+        structured_response = _manual_extraction(llm_response)
+
+    return {
+        "explanation": structured_response.get(
+            "explanation", "Unable to generate explanation"
+        ),
+        "severity": structured_response.get("severity", "info"),
+        "category": category,
+        "related_best_practices": structured_response.get("related_best_practices", []),
+        "example_solutions": structured_response.get("example_solutions", []),
+        "additional_resources": structured_response.get("additional_resources", []),
+        "metadata": {
+            "rule_id": rule_id,
+            "rag_sources": context_data.get("sources", []),
+            "knowledge_base_available": knowledge_base_available,
+            "generated_at": datetime.utcnow().isoformat(),
+        },
+    }
+
+
+# Top-level fields of the LLM's JSON answer, surfaced as soon as each is complete
+_STREAMED_FIELDS = (
+    "explanation",
+    "severity",
+    "related_best_practices",
+    "example_solutions",
+    "additional_resources",
+)
+
+
+async def _generate_explanation(
+    request_data: ExplanationRequest,
+    llm_service,
+    rag_service,
+    cache: "ICacheRepository",
+) -> Dict[str, Any]:
+    """Call the LLM for an explanation and cache the parsed result."""
+    rule_id = request_data.rule_id
+    message = request_data.message
+    category = request_data.category
+
+    # Reuse the explanation of a reworded message before paying for the LLM
+    embedding = await rag_service.embed_text(message)
+    if embedding is not None:
+        similar = await _get_semantically_cached_explanation(
+            cache, rule_id, category, embedding
+        )
+        if similar:
+            await _cache_explanation(cache, rule_id, message, category, similar)
+            return similar
+
+    payload, context_data = await _prepare_explanation_request(
+        rag_service,
+        rule_id,
+        category,
+        message,
+        request_data.spec_text,
+        request_data.context,
+    )
+
+    # Encode once with orjson rather than letting httpx json.dumps the body
+    response = await llm_service.client.post(
+        llm_service.chat_endpoint,
+        content=orjson.dumps(payload),
+        headers=JSON_HEADERS,
+    )
+
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=500,
+            detail=f"LLM request failed: {response.status_code}",
+        )
+
+    # Extract response text
+    response_data = orjson.loads(response.content)
+    llm_response = response_data.get("message", {}).get("content", "").strip()
+
+    explanation_response = _build_explanation_response(
+        llm_response, rule_id, category, context_data, rag_service.is_available()
+    )
+
+    # Cache the explanation
+    await _cache_explanation(cache, rule_id, message, category, explanation_response)
+    if embedding is not None:
+        await _index_explanation_embedding(cache, rule_id, message, category, embedding)
+    return explanation_response
+
+
+async def _generate_explanation_once(
+    request_data: ExplanationRequest,
+    llm_service,
+    rag_service,
+    cache: "ICacheRepository",
+) -> Dict[str, Any]:
+    """
+    Generate an explanation, joining an identical in-flight generation if any.
+
+    The work runs in its own task and callers await it through ``shield`` so a
+    disconnecting client does not cancel the generation for everyone else.
+    """
+    cache_key = _generate_cache_key(
+        request_data.rule_id, request_data.message, request_data.category
+    )
+    task = _INFLIGHT_EXPLANATIONS.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(
+            _generate_explanation(request_data, llm_service, rag_service, cache)
+        )
+        _INFLIGHT_EXPLANATIONS[cache_key] = task
+        task.add_done_callback(lambda _: _INFLIGHT_EXPLANATIONS.pop(cache_key, None))
+    else:
+        logger.info(f"Joining in-flight explanation for rule {request_data.rule_id}")
+
+    return await asyncio.shield(task)
+
+
 @router.post("/explain")
 async def explain_validation_issue(
-    request_data: Dict[str, Any],
+    request_data: ExplanationRequest,
     llm_service=Depends(get_llm_service),
     rag_service=Depends(get_rag_service),
     cache: "ICacheRepository" = Depends(get_cache_repository),
@@ -155,7 +490,7 @@ async def explain_validation_issue(
     Responses are cached for performance optimization.
 
     Args:
-        request_data: Dictionary containing rule_id, message, category, and optional context.
+        request_data: Validation issue with rule_id, message, category, and optional context.
         llm_service: Injected LLM service.
         rag_service: Injected RAG service for knowledge retrieval.
         cache: Injected cache repository for caching explanations.
@@ -168,14 +503,13 @@ async def explain_validation_issue(
     """
     correlation_id = set_correlation_id()
 
-    rule_id = request_data.get("rule_id", "")
-    message = request_data.get("message", "")
-    category = request_data.get("category", "general")
+    rule_id = request_data.rule_id
+    message = request_data.message
+    category = request_data.category
 
     logger.info(
         "Generating explanation for validation issue",
         extra={
-            "correlation_id": correlation_id,
             "rule_id": rule_id,
             "category": category,
         },
@@ -189,130 +523,147 @@ async def explain_validation_issue(
         if cached_explanation:
             return cached_explanation
 
-        spec_text = request_data.get("spec_text", "")
-        context = request_data.get("context", {})
+        explanation_response = await _generate_explanation_once(
+            request_data, llm_service, rag_service, cache
+        )
 
-        # Create query for RAG knowledge base
-        rag_query = f"OpenAPI best practices validation {rule_id} {category} {message}"
+        logger.info(f"Generated explanation for rule {rule_id}")
+        return explanation_response
 
-        # Retrieve relevant context from knowledge base
-        context_data = await rag_service.retrieve_security_context(
-            rag_query, n_results=3
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Explanation generation failed: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "EXPLANATION_FAILED",
+                "message": f"Failed to generate explanation: {str(e)}",
+                "correlation_id": correlation_id,
+            },
         )
 
-        # Build comprehensive explanation prompt
-        knowledge_context = context_data.get(
-            "context", "No additional context available"
-        )
-        if len(knowledge_context) > 800:
-            knowledge_context = knowledge_context[:800] + "..."
 
-        explanation_prompt = f"""You are an OpenAPI expert. Explain this validation issue concisely and professionally.
+@router.post("/explain/batch")
+async def explain_validation_issues_batch(
+    request_data: ExplanationBatchRequest,
+    llm_service=Depends(get_llm_service),
+    rag_service=Depends(get_rag_service),
+    cache: "ICacheRepository" = Depends(get_cache_repository),
+) -> Dict[str, Any]:
+    """
+    Explain several validation issues in one request.
 
-VALIDATION ISSUE:
-- Rule: {rule_id}
-- Category: {category}
-- Message: {message}
-- Context: {json.dumps(context, indent=2) if context else "None"}
+    Cached explanations are answered first; the remaining issues are sent to
+    the LLM concurrently (Ollama serves them up to OLLAMA_NUM_PARALLEL), and
+    duplicates within the batch share a single generation.
 
-KNOWLEDGE BASE:
-{knowledge_context}
+    Args:
+        request_data: The validation issues to explain.
+        llm_service: Injected LLM service.
+        rag_service: Injected RAG service for knowledge retrieval.
+        cache: Injected cache repository for caching explanations.
 
-SPEC EXCERPT:
-{spec_text[:500] if spec_text else "No specification provided"}
+    Returns:
+        Dictionary with one entry per issue, in request order. Issues whose
+        explanation failed carry an ``error`` object instead.
+    """
+    correlation_id = set_correlation_id()
+    issues = request_data.issues
 
-INSTRUCTIONS:
-1. Provide a clear explanation of why this is an issue (2-3 sentences)
-2. List 2-3 related best practices
-3. Provide 1-2 specific example solutions
-4. Suggest relevant resources (optional)
+    cached = await asyncio.gather(
+        *(
+            _get_cached_explanation(cache, i.rule_id, i.message, i.category)
+            for i in issues
+        )
+    )
+    misses = [index for index, hit in enumerate(cached) if not hit]
 
-IMPORTANT: Respond ONLY with valid JSON. Do not include any text before or after the JSON.
+    logger.info(f"Explaining batch of {len(issues)} issues ({len(misses)} uncached)")
 
-{{
-  "explanation": "Brief explanation of the issue and its impact",
-  "severity": "info",
-  "related_best_practices": [
-    "First best practice",
-    "Second best practice"
-  ],
-  "example_solutions": [
-    "First solution approach",
-    "Second solution approach"
-  ],
-  "additional_resources": [
-    "Resource 1",
-    "Resource 2"
-  ]
-}}"""
+    generated = await asyncio.gather(
+        *(
+            _generate_explanation_once(issues[index], llm_service, rag_service, cache)
+            for index in misses
+        ),
+        return_exceptions=True,
+    )
 
-        # Call LLM
-        payload = {
-            "model": settings.default_model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are an OpenAPI expert. Always respond with valid JSON only.",
-                },
-                {"role": "user", "content": explanation_prompt},
-            ],
-            "stream": False,
-            "format": "json",
-            "options": {"temperature": 0.3, "num_predict": 2048},
-        }
+    explanations: List[Dict[str, Any]] = list(cached)
+    for index, result in zip(misses, generated):
+        if isinstance(result, BaseException):
+            logger.error(
+                f"Explanation generation failed for rule {issues[index].rule_id}: "
+                f"{str(result)}"
+            )
+            result = {
+                "error": {
+                    "error": "EXPLANATION_FAILED",
+                    "message": f"Failed to generate explanation: {str(result)}",
+                    "rule_id": issues[index].rule_id,
+                }
+            }
+        explanations[index] = result
+
+    return {
+        "explanations": explanations,
+        "generated": len(misses),
+        "correlation_id": correlation_id,
+    }
 
-        response = await llm_service.client.post(
-            llm_service.chat_endpoint, json=payload
-        )
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=500,
-                detail=f"LLM request failed: {response.status_code}",
-            )
+@router.post("/explain/stream")
+async def stream_validation_issue_explanation(
+    request_data: ExplanationRequest,
+    llm_service=Depends(get_llm_service),
+    rag_service=Depends(get_rag_service),
+    cache: "ICacheRepository" = Depends(get_cache_repository),
+) -> StreamingResponse:
+    """
+    Stream an AI-powered explanation for a validation issue as NDJSON.
 
-        # Extract response text
-        response_data = response.json()
-        llm_response = response_data.get("message", {}).get("content", "").strip()
+    Emits ``{"type": "chunk", "content": ...}`` lines as the LLM generates
+    tokens, plus a ``{"type": "field", "name": ..., "value": ...}`` line as
+    soon as each top-level field of the answer (``explanation`` first) is
+    complete, then a single ``{"type": "result", "explanation": {...}}`` line
+    with the same payload /ai/explain returns. Cache hits emit only the
+    result line. Failures after streaming has started are reported as a
+    ``{"type": "error", ...}`` line.
 
-        # Parse structured response
-        structured_response = _extract_json_from_response(llm_response)
-        if structured_response is None:
-            logger.warning("JSON extraction failed, attempting manual extraction")
-            structured_response = _manual_extraction(llm_response)
+    Args:
+        request_data: Validation issue with rule_id, message, category, and optional context.
+        llm_service: Injected LLM service.
+        rag_service: Injected RAG service for knowledge retrieval.
+        cache: Injected cache repository for caching explanations.
 
-        # Build final response
-        explanation_response = {
-            "explanation": structured_response.get(
-                "explanation", "Unable to generate explanation"
-            ),
-            "severity": structured_response.get("severity", "info"),
-            "category": category,
-            "related_best_practices": structured_response.get(
-                "related_best_practices", []
-            ),
-            "example_solutions": structured_response.get("example_solutions", []),
-            "additional_resources": structured_response.get("additional_resources", []),
-            "metadata": {
-                "rule_id": rule_id,
-                "rag_sources": context_data.get("sources", []),
-                "knowledge_base_available": rag_service.is_available(),
-                "generated_at": datetime.utcnow().isoformat(),
-            },
-        }
+    Returns:
+        StreamingResponse with application/x-ndjson events.
 
-        # Cache the explanation
-        await _cache_explanation(
-            cache, rule_id, message, category, explanation_response
-        )
+    Raises:
+        HTTPException: If the explanation request cannot be prepared.
+    """
+    correlation_id = set_correlation_id()
 
-        logger.info(f"Generated explanation for rule {rule_id}")
-        return explanation_response
+    rule_id = request_data.rule_id
+    message = request_data.message
+    category = request_data.category
 
-    except HTTPException:
-        raise
+    try:
+        cached_explanation = await _get_cached_explanation(
+            cache, rule_id, message, category
+        )
+        if not cached_explanation:
+            payload, context_data = await _prepare_explanation_request(
+                rag_service,
+                rule_id,
+                category,
+                message,
+                request_data.spec_text,
+                request_data.context,
+                stream=True,
+            )
     except Exception as e:
-        logger.exception(f"Explanation generation failed: {str(e)}")
+        logger.exception(f"Explanation stream setup failed: {str(e)}")
         raise HTTPException(
             status_code=500,
             detail={
@@ -322,6 +673,51 @@ IMPORTANT: Respond ONLY with valid JSON. Do not include any text before or after
             },
         )
 
+    async def event_stream() -> AsyncIterator[bytes]:
+        if cached_explanation:
+            yield ndjson_line({"type": "result", "explanation": cached_explanation})
+            return
+
+        parts: List[str] = []
+        try:
+            async for event in stream_chat_events(
+                llm_service.client,
+                llm_service.chat_endpoint,
+                payload,
+                _STREAMED_FIELDS,
+                parts,
+            ):
+                yield event
+
+            explanation_response = _build_explanation_response(
+                "".join(parts).strip(),
+                rule_id,
+                category,
+                context_data,
+                rag_service.is_available(),
+            )
+            await _cache_explanation(
+                cache, rule_id, message, category, explanation_response
+            )
+            yield ndjson_line({"type": "result", "explanation": explanation_response})
+
+        except Exception as e:
+            logger.exception(f"Explanation streaming failed: {str(e)}")
+            yield ndjson_line(
+                {
+                    "type": "error",
+                    "error": "EXPLANATION_FAILED",
+                    "message": f"Failed to generate explanation: {str(e)}",
+                    "correlation_id": correlation_id,
+                }
+            )
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="application/x-ndjson",
+        headers=STREAM_HEADERS,
+    )
+
 
 @router.get("/rag/status")
 async def get_rag_status(
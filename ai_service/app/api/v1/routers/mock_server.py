@@ -23,11 +23,12 @@ import asyncio
 import logging
 import random
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from prance import ResolvingParser
 
 from app.api.deps import get_mock_data_service
@@ -44,6 +45,28 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Mock Server"])
 
+# Pre-serialized bodies for the schema-less / fallback responses. Only the
+# mock_id varies, and it is always a UUID we issued, so no escaping is needed.
+_OK_TEMPLATE = b'{"message":"OK","mock_id":"%s"}'
+_OK_FALLBACK_TEMPLATE = b'{"message":"OK","mock_id":"%s","fallback":true}'
+
+
+@dataclass(slots=True)
+class MockEntry:
+    """
+    State of a single running mock server.
+
+    Slotted so the per-request hot path reads fields by attribute offset
+    instead of string-keyed dict lookups.
+    """
+
+    specification: Dict[str, Any]
+    config: MockStartRequest
+    created_at: datetime
+    request_count: int = 0
+    correlation_id: str = ""
+    updated_at: datetime | None = None
+
 
 class AsyncMockStorage:
     """
@@ -59,10 +82,10 @@ class AsyncMockStorage:
     """
 
     def __init__(self) -> None:
-        self._data: Dict[str, Dict[str, Any]] = {}
+        self._data: Dict[str, MockEntry] = {}
         self._lock = asyncio.Lock()
 
-    async def get(self, mock_id: str) -> Dict[str, Any] | None:
+    async def get(self, mock_id: str) -> MockEntry | None:
         """Get mock server data by ID."""
         async with self._lock:
             return self._data.get(mock_id)
@@ -72,7 +95,7 @@ class AsyncMockStorage:
         async with self._lock:
             return mock_id in self._data
 
-    async def set(self, mock_id: str, data: Dict[str, Any]) -> None:
+    async def set(self, mock_id: str, data: MockEntry) -> None:
         """Store mock server data."""
         async with self._lock:
             self._data[mock_id] = data
@@ -82,10 +105,12 @@ class AsyncMockStorage:
         async with self._lock:
             if mock_id not in self._data:
                 return False
-            self._data[mock_id].update(updates)
+            entry = self._data[mock_id]
+            for field_name, value in updates.items():
+                setattr(entry, field_name, value)
             return True
 
-    async def delete(self, mock_id: str) -> Dict[str, Any] | None:
+    async def delete(self, mock_id: str) -> MockEntry | None:
         """Delete and return mock server data. Returns None if not found."""
         async with self._lock:
             return self._data.pop(mock_id, None)
@@ -93,10 +118,10 @@ class AsyncMockStorage:
     async def increment_request_count(self, mock_id: str) -> int:
         """Atomically increment request count. Returns new count or 0 if not found."""
         async with self._lock:
-            if mock_id in self._data:
-                current_count = self._data[mock_id].get("request_count", 0)
-                self._data[mock_id]["request_count"] = current_count + 1
-                return self._data[mock_id]["request_count"]
+            entry = self._data.get(mock_id)
+            if entry is not None:
+                entry.request_count += 1
+                return entry.request_count
             return 0
 
 
@@ -146,13 +171,12 @@ async def start_mock_server(request: MockStartRequest) -> MockStartResponse:
         # Store mock server configuration using async-safe storage
         await mock_storage.set(
             mock_id,
-            {
-                "specification": parser.specification,
-                "config": request.model_dump(),
-                "created_at": created_at,
-                "request_count": 0,
-                "correlation_id": correlation_id,
-            },
+            MockEntry(
+                specification=parser.specification,
+                config=request,
+                created_at=created_at,
+                correlation_id=correlation_id,
+            ),
         )
 
         spec_info = parser.specification.get("info", {})
@@ -234,14 +258,14 @@ async def update_mock_server(mock_id: str, request: MockStartRequest) -> Dict[st
         )
 
         # Preserve request count from previous configuration
-        previous_request_count = mock_data.get("request_count", 0)
+        previous_request_count = mock_data.request_count
         updated_at = datetime.utcnow()
 
         await mock_storage.update(
             mock_id,
             {
                 "specification": parser.specification,
-                "config": request.model_dump(),
+                "config": request,
                 "updated_at": updated_at,
             },
         )
@@ -301,8 +325,8 @@ async def get_mock_server_info(mock_id: str) -> Dict[str, Any]:
             },
         )
 
-    spec_info = mock_data["specification"].get("info", {})
-    paths = mock_data["specification"].get("paths", {})
+    spec_info = mock_data.specification.get("info", {})
+    paths = mock_data.specification.get("paths", {})
 
     return {
         "mock_id": mock_id,
@@ -311,10 +335,10 @@ async def get_mock_server_info(mock_id: str) -> Dict[str, Any]:
         "description": spec_info.get("description", "No description"),
         "total_endpoints": len(paths),
         "available_endpoints": list(paths.keys()),
-        "created_at": mock_data.get("created_at"),
-        "updated_at": mock_data.get("updated_at"),
-        "request_count": mock_data.get("request_count", 0),
-        "config": mock_data.get("config", {}),
+        "created_at": mock_data.created_at,
+        "updated_at": mock_data.updated_at,
+        "request_count": mock_data.request_count,
+        "config": mock_data.config.model_dump(),
         "message": "Mock server is running",
         "docs": "Append a valid path from your specification to this URL to get mock responses",
     }
@@ -351,13 +375,13 @@ async def delete_mock_server(mock_id: str) -> Dict[str, Any]:
         extra={
             "correlation_id": correlation_id,
             "mock_id": mock_id,
-            "total_requests_served": mock_data.get("request_count", 0),
+            "total_requests_served": mock_data.request_count,
         },
     )
 
     return {
         "message": f"Mock server {mock_id} deleted successfully",
-        "total_requests_served": mock_data.get("request_count", 0),
+        "total_requests_served": mock_data.request_count,
         "correlation_id": correlation_id,
     }
 
@@ -371,7 +395,7 @@ async def handle_mock_request(
     full_path: str,
     request: Request,
     mock_data_service: MockDataService = Depends(get_mock_data_service),
-) -> JSONResponse:
+) -> Response:
     """
     Enhanced mock request handler with AI-powered response generation.
 
@@ -391,7 +415,7 @@ async def handle_mock_request(
         mock_data_service: Injected mock data service for response generation.
 
     Returns:
-        JSONResponse with mock data or error response.
+        JSON response with mock data or error response.
 
     Raises:
         HTTPException 404: If mock server or endpoint not found.
@@ -407,20 +431,20 @@ async def handle_mock_request(
             },
         )
 
-    spec = mock_data["specification"]
-    config = mock_data.get("config", {})
+    spec = mock_data.specification
+    config = mock_data.config
     http_method = request.method.lower()
 
     # Increment request counter atomically
     await mock_storage.increment_request_count(mock_id)
 
     # Add artificial delay if configured
-    response_delay_ms = config.get("response_delay_ms", 0)
+    response_delay_ms = config.response_delay_ms
     if response_delay_ms > 0:
         await asyncio.sleep(response_delay_ms / 1000)
 
     # Simulate error rate if configured
-    error_rate = config.get("error_rate", 0.0)
+    error_rate = config.error_rate
     if random.random() < error_rate:
         raise HTTPException(
             status_code=500,
@@ -462,20 +486,17 @@ async def handle_mock_request(
         ]["schema"]
     except KeyError:
         # No schema defined, return simple OK response
-        return JSONResponse(
-            content={"message": "OK", "mock_id": mock_id},
-            status_code=200,
-        )
+        return _ok_response(_OK_TEMPLATE, mock_id)
 
     # Generate AI-powered response if enabled
-    use_ai_responses = config.get("use_ai_responses", True)
+    use_ai_responses = config.use_ai_responses
     if use_ai_responses:
         try:
             mock_response = await mock_data_service.generate_mock_response(
                 operation_spec=operation_spec,
                 response_schema=response_schema,
                 spec_context=spec,
-                variation=random.randint(1, config.get("response_variety", 3)),
+                variation=random.randint(1, config.response_variety),
                 use_ai=True,
             )
             return JSONResponse(content=mock_response)
@@ -484,11 +505,9 @@ async def handle_mock_request(
             logger.warning(
                 f"AI response generation failed: {str(e)}, falling back to simple response"
             )
-            return JSONResponse(
-                content={"message": "OK", "mock_id": mock_id, "fallback": True}
-            )
+            return _ok_response(_OK_FALLBACK_TEMPLATE, mock_id)
 
-    return JSONResponse(content={"message": "OK", "mock_id": mock_id})
+    return _ok_response(_OK_TEMPLATE, mock_id)
 
 
 @router.post("/mock/generate-data")
@@ -508,7 +527,7 @@ async def generate_mock_data(
     Returns:
         Generated mock data with metadata.
     """
-    correlation_id = str(uuid.uuid4())
+    correlation_id = uuid.uuid4().hex
     set_correlation_id(correlation_id)
 
     logger.info("Generating mock data", extra={"correlation_id": correlation_id})
@@ -626,7 +645,7 @@ async def generate_mock_variations(
     Returns:
         List of mock data variations with metadata.
     """
-    correlation_id = str(uuid.uuid4())
+    correlation_id = uuid.uuid4().hex
     set_correlation_id(correlation_id)
 
     logger.info(
@@ -640,9 +659,11 @@ async def generate_mock_variations(
         response_code = request.response_code
         count = request.count  # Already validated by Pydantic (max 10)
 
+        spec_key = cache_service.spec_key(spec_text)
+
         # Check cache first
         cached_mock_data = cache_service.get_mock_data(
-            spec_text, path, method, response_code, count
+            spec_key, path, method, response_code, count
         )
         if cached_mock_data:
             logger.info(f"Returning cached mock data for {method} {path}")
@@ -657,13 +678,13 @@ async def generate_mock_variations(
             }
 
         # Parse specification (with caching)
-        spec = cache_service.get_parsed_spec(spec_text)
+        spec = cache_service.get_parsed_spec(spec_key)
         if not spec:
             parser = ResolvingParser(
                 spec_string=spec_text, backend="openapi-spec-validator"
             )
             spec = parser.specification
-            cache_service.cache_parsed_spec(spec_text, spec)
+            cache_service.cache_parsed_spec(spec_key, spec)
 
         # Get operation and response schema
         operation = spec["paths"][path][method]
@@ -691,7 +712,7 @@ async def generate_mock_variations(
 
         # Cache the results
         cache_service.cache_mock_data(
-            spec_text, path, method, response_code, count, variations
+            spec_key, path, method, response_code, count, variations
         )
 
         logger.info(
@@ -723,6 +744,11 @@ async def generate_mock_variations(
         )
 
 
+def _ok_response(template: bytes, mock_id: str) -> Response:
+    """Render a pre-serialized OK body without a JSON encoding round-trip."""
+    return Response(content=template % mock_id.encode(), media_type="application/json")
+
+
 def _match_parameterized_path(
     request_path: str, paths: Dict[str, Any]
 ) -> tuple[Dict[str, Any] | None, str | None]:
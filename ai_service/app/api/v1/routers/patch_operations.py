@@ -12,14 +12,16 @@ Key features:
 """
 
 import json
-import logging
-import uuid
+from secrets import token_hex
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
-from prance import ResolvingParser
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 
 from app.api.deps import get_patch_generator, get_smart_fix_service
-from app.core.logging import set_correlation_id
+from app.core.logging import get_logger, set_correlation_id
 from app.schemas.patch_schemas import (
     PatchApplicationRequest,
     PatchApplicationResponse,
@@ -31,16 +33,24 @@ from app.schemas.patch_schemas import (
 from app.services.patch_generator import PatchGenerator, apply_json_patch
 from app.services.smart_fix_service import SmartFixService
 
-logger = logging.getLogger(__name__)
+logger = get_logger("patch_operations")
 
-router = APIRouter(prefix="/ai/patch", tags=["Patch Operations"])
+router = APIRouter(
+    prefix="/ai/patch",
+    tags=["Patch Operations"],
+    default_response_class=ORJSONResponse,
+)
 
 
-@router.post("/generate", response_model=PatchGenerationResponse)
+@router.post(
+    "/generate",
+    response_model=None,
+    responses={200: {"model": PatchGenerationResponse}},
+)
 async def generate_json_patch(
     request: PatchGenerationRequest,
     patch_generator: PatchGenerator = Depends(get_patch_generator),
-) -> PatchGenerationResponse:
+) -> ORJSONResponse:
     """
     Generate JSON Patch (RFC 6902) operations for a specific fix.
 
@@ -56,17 +66,12 @@ async def generate_json_patch(
     Returns:
         PatchGenerationResponse with patch operations and confidence score.
     """
-    correlation_id = str(uuid.uuid4())
-    set_correlation_id(correlation_id)
+    set_correlation_id(token_hex(16))
 
-    logger.info(
-        f"Generating JSON Patch for rule: {request.rule_id}",
-        extra={"correlation_id": correlation_id},
-    )
+    logger.info(f"Generating JSON Patch for rule: {request.rule_id}")
 
     try:
-        # Parse the spec
-        spec_dict = json.loads(request.spec_text)
+        spec_dict = await _load_spec(request)
 
         # Generate patch using LLM
         patch_response = await patch_generator.generate_patch(
@@ -78,11 +83,10 @@ async def generate_json_patch(
 
         logger.info(
             f"Generated {len(patch_response.patches)} patch operations "
-            f"with confidence {patch_response.confidence}",
-            extra={"correlation_id": correlation_id},
+            f"with confidence {patch_response.confidence}"
         )
 
-        return patch_response
+        return _model_response(patch_response)
 
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON spec: {str(e)}")
@@ -104,10 +108,14 @@ async def generate_json_patch(
         )
 
 
-@router.post("/apply", response_model=PatchApplicationResponse)
+@router.post(
+    "/apply",
+    response_model=None,
+    responses={200: {"model": PatchApplicationResponse}},
+)
 async def apply_patch(
     request: PatchApplicationRequest,
-) -> PatchApplicationResponse:
+) -> ORJSONResponse:
     """
     Apply JSON Patch operations to a specification.
 
@@ -120,17 +128,12 @@ async def apply_patch(
     Returns:
         PatchApplicationResponse with updated spec and validation results.
     """
-    correlation_id = str(uuid.uuid4())
-    set_correlation_id(correlation_id)
+    set_correlation_id(token_hex(16))
 
-    logger.info(
-        f"Applying {len(request.patches)} patch operations",
-        extra={"correlation_id": correlation_id},
-    )
+    logger.info(f"Applying {len(request.patches)} patch operations")
 
     try:
-        # Parse the spec
-        spec_dict = json.loads(request.spec_text)
+        spec_dict = await _load_spec(request)
 
         # Apply patches
         result = await apply_json_patch(spec_dict, request.patches)
@@ -139,17 +142,18 @@ async def apply_patch(
         if request.validate_after and result["success"]:
             # Validate the patched spec
             try:
-                spec_json = json.dumps(result["result"])
-                _ = ResolvingParser(spec_string=spec_json)
+                await run_in_threadpool(_validate_spec, result["result"])
                 logger.info("Patched spec is valid")
             except Exception as e:
                 validation_errors.append(f"Validation failed: {str(e)}")
 
-        return PatchApplicationResponse(
-            success=result["success"],
-            updated_spec=result["result"] if result["success"] else None,
-            errors=result["errors"],
-            validation_errors=validation_errors,
+        return _model_response(
+            PatchApplicationResponse(
+                success=result["success"],
+                updated_spec=result["result"] if result["success"] else None,
+                errors=result["errors"],
+                validation_errors=validation_errors,
+            )
         )
 
     except json.JSONDecodeError as e:
@@ -172,15 +176,57 @@ async def apply_patch(
         )
 
 
+async def _load_spec(
+    request: PatchGenerationRequest | PatchApplicationRequest,
+) -> dict:
+    """
+    Return the request's spec as a dict.
+
+    A structured ``spec`` was already decoded with the request body, so only
+    ``spec_text`` needs parsing - off the event loop, as large specs take
+    tens of ms.
+    """
+    if request.spec is not None:
+        return request.spec
+    return await run_in_threadpool(orjson.loads, request.spec_text)
+
+
+def _model_response(model: BaseModel) -> ORJSONResponse:
+    """
+    Serialize a service-built response model directly.
+
+    The models returned by the patch services are already validated, so this
+    skips FastAPI's response_model re-validation pass over large specs.
+    """
+    return ORJSONResponse(model.model_dump(mode="json", by_alias=True))
+
+
+def _validate_spec(spec: dict) -> None:
+    """Serialize and resolve a spec with prance, raising if it is invalid."""
+    # Imported on first use: prance pulls in openapi-spec-validator and
+    # friends, which only the optional validate_after path needs
+    from prance import ResolvingParser
+
+    ResolvingParser(spec_string=orjson.dumps(spec).decode())
+
+
 # Create a separate router for the smart fix endpoint (different prefix)
-smart_fix_router = APIRouter(prefix="/ai/fix", tags=["Patch Operations"])
+smart_fix_router = APIRouter(
+    prefix="/ai/fix",
+    tags=["Patch Operations"],
+    default_response_class=ORJSONResponse,
+)
 
 
-@smart_fix_router.post("/smart", response_model=SmartAIFixResponse)
+@smart_fix_router.post(
+    "/smart",
+    response_model=None,
+    responses={200: {"model": SmartAIFixResponse}},
+)
 async def smart_ai_fix(
     request: SmartAIFixRequest,
     smart_fix_service: SmartFixService = Depends(get_smart_fix_service),
-) -> SmartAIFixResponse:
+) -> ORJSONResponse:
     """
     Smart AI fix that intelligently chooses between JSON patches and full spec regeneration.
 
@@ -205,24 +251,19 @@ async def smart_ai_fix(
     Returns:
         SmartAIFixResponse with updated spec and method used.
     """
-    correlation_id = str(uuid.uuid4())
-    set_correlation_id(correlation_id)
+    set_correlation_id(token_hex(16))
 
-    logger.info(
-        f"Smart AI fix request: {request.prompt[:100]}...",
-        extra={"correlation_id": correlation_id},
-    )
+    logger.info(f"Smart AI fix request: {request.prompt[:100]}...")
 
     try:
         response = await smart_fix_service.process_smart_fix(request)
 
         logger.info(
             f"Smart fix completed using {response.method_used} method in "
-            f"{response.processing_time_ms:.0f}ms ({response.token_count} tokens)",
-            extra={"correlation_id": correlation_id},
+            f"{response.processing_time_ms:.0f}ms ({response.token_count} tokens)"
         )
 
-        return response
+        return _model_response(response)
 
     except ValueError as e:
         logger.error(f"Invalid request: {str(e)}")
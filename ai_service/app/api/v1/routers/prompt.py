@@ -10,21 +10,26 @@ import logging
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.api.deps import get_prompt_engine
-from app.schemas.ai_schemas import AIRequest, OperationType
+from app.schemas.ai_schemas import AIRequest
 
 if TYPE_CHECKING:
     from app.services.prompt_engine import PromptEngine
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/ai/prompt", tags=["Prompt Engine"])
+router = APIRouter(
+    prefix="/ai/prompt",
+    tags=["Prompt Engine"],
+    default_response_class=ORJSONResponse,
+)
 
 
 @router.post("/generate")
 async def generate_intelligent_prompt(
-    request_data: Dict[str, Any],
+    request_data: AIRequest,
     context_id: Optional[str] = None,
     prompt_engine: "PromptEngine" = Depends(get_prompt_engine),
 ) -> Dict[str, Any]:
@@ -35,7 +40,7 @@ async def generate_intelligent_prompt(
     tailored to the operation type and context.
 
     Args:
-        request_data: Dictionary containing spec_text, prompt, and operation_type.
+        request_data: AI request with spec_text, prompt, and operation_type.
         context_id: Optional context ID for context-aware prompt generation.
         prompt_engine: Injected prompt engine.
 
@@ -46,15 +51,8 @@ async def generate_intelligent_prompt(
         HTTPException: 400 if prompt generation fails.
     """
     try:
-        # Create a mock AIRequest for prompt generation
-        ai_request = AIRequest(
-            spec_text=request_data.get("spec_text", ""),
-            prompt=request_data.get("prompt", ""),
-            operation_type=OperationType(request_data.get("operation_type", "modify")),
-        )
-
         system_prompt, user_prompt = prompt_engine.generate_intelligent_prompt(
-            ai_request, context_id
+            request_data, context_id
         )
 
         return {
@@ -2,6 +2,7 @@ import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.api.deps import get_llm_service
 from app.schemas.remediation_schemas import SuggestFixRequest, SuggestFixResponse
@@ -9,7 +10,9 @@ from app.services.agents.remediation_agent import RemediationAgent
 from app.services.llm_service import LLMService
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/ai/remediate", tags=["Remediation"])
+router = APIRouter(
+    prefix="/ai/remediate", tags=["Remediation"], default_response_class=ORJSONResponse
+)
 
 
 @router.post("/suggest-fix", response_model=SuggestFixResponse)
@@ -13,16 +13,31 @@ This router handles the "Wow" features that differentiate SchemaSculpt:
 - Intelligent attack chain detection
 """
 
+import asyncio
 import hashlib
-import json
 import logging
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from collections import OrderedDict
+from datetime import timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+)
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.api.deps import (
+    get_authentication_analyzer,
+    get_authorization_analyzer,
     get_cache_repository,
+    get_data_exposure_analyzer,
     get_llm_service,
     get_rag_service,
     get_security_workflow,
@@ -33,6 +48,9 @@ from app.schemas.attack_path_schemas import EnrichedSecurityFindingsRequest
 from app.schemas.security_schemas import SecurityAnalysisRequest
 from app.services.llm_service import LLMService
 from app.services.rag_service import RAGService
+from app.services.security.authentication_analyzer import AuthenticationAnalyzer
+from app.services.security.authorization_analyzer import AuthorizationAnalyzer
+from app.services.security.data_exposure_analyzer import DataExposureAnalyzer
 from app.services.security.security_workflow import SecurityAnalysisWorkflow
 
 if TYPE_CHECKING:
@@ -40,13 +58,31 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/ai/security", tags=["Security Analysis"])
+router = APIRouter(
+    prefix="/ai/security",
+    tags=["Security Analysis"],
+    default_response_class=ORJSONResponse,
+)
 
 # Cache key prefix and TTL for security analysis
-_SECURITY_CACHE_PREFIX = "security:"
+_SECURITY_CACHE_PREFIX = "security:report:"
 _ATTACK_PATH_CACHE_PREFIX = "attack_path:"
 SECURITY_CACHE_TTL = timedelta(hours=24)
 
+# Specs larger than this are hashed off the event loop
+_INLINE_HASH_MAX_CHARS = 256 * 1024
+
+# Recently parsed specs keyed by spec hash. The UI runs the individual
+# analyzers back to back on the same spec, and the analyzers only read it.
+_PARSED_SPEC_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_PARSED_SPEC_CACHE_MAX_ENTRIES = 16
+
+# Clients may reuse a report for an hour before revalidating with its ETag
+_REPORT_CACHE_CONTROL = "private, max-age=3600"
+
+# Report generations currently running, keyed by their cache key
+_INFLIGHT_REPORTS: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
 
 # =============================================================================
 # Comprehensive Security Analysis
@@ -56,9 +92,10 @@ SECURITY_CACHE_TTL = timedelta(hours=24)
 @router.post("/analyze")
 async def run_comprehensive_security_analysis(
     request: SecurityAnalysisRequest,
+    http_request: Request,
     security_workflow: SecurityAnalysisWorkflow = Depends(get_security_workflow),
     cache: "ICacheRepository" = Depends(get_cache_repository),
-) -> Dict[str, Any]:
+) -> Response:
     """
     Run comprehensive security analysis on an OpenAPI specification.
 
@@ -71,11 +108,13 @@ async def run_comprehensive_security_analysis(
 
     Args:
         request: Security analysis request containing the spec and options.
+        http_request: The raw request, for If-None-Match revalidation.
         security_workflow: Injected security analysis workflow service.
         cache: Injected cache repository for caching results.
 
     Returns:
-        Comprehensive security report with findings, scores, and recommendations.
+        Comprehensive security report with findings, scores, and recommendations,
+        or 304 Not Modified if the client already holds the cached report.
 
     Note:
         Results are cached for 24 hours unless force_refresh is True.
@@ -89,64 +128,62 @@ async def run_comprehensive_security_analysis(
 
     try:
         # Check cache first (unless force refresh requested)
-        cache_key = _generate_cache_key_for_spec(request.spec_text)
+        spec_hash = await _compute_spec_hash(request.spec_text)
+        cache_key = _generate_cache_key_for_spec(spec_hash)
 
         if not request.force_refresh:
             cached_report = await _get_cached_security_report(cache, cache_key)
             if cached_report:
+                etag = _report_etag(spec_hash, cached_report)
+                if _etag_matches(http_request, etag):
+                    return _not_modified_response(etag)
+
                 logger.info(
                     f"Returning cached security report for key: {cache_key[:32]}..."
                 )
-                return {
-                    "cached": True,
-                    "report": cached_report,
-                    "correlation_id": correlation_id,
-                }
+                return _with_report_cache_headers(
+                    _stream_report_response(
+                        cached_report, cached=True, correlation_id=correlation_id
+                    ),
+                    etag,
+                )
 
-        # Convert validation suggestions to dictionary format
-        validation_suggestions_as_dicts = None
-        if request.validation_suggestions:
-            validation_suggestions_as_dicts = [
-                {
-                    "rule_id": suggestion.rule_id,
-                    "message": suggestion.message,
-                    "severity": suggestion.severity,
-                    "path": suggestion.path,
-                    "category": suggestion.category,
-                }
-                for suggestion in request.validation_suggestions
-            ]
+        async def analyze_and_cache() -> Dict[str, Any]:
+            # Run the security analysis workflow
+            security_report = await security_workflow.analyze(
+                request.spec_text,
+                validation_suggestions=request.validation_suggestions,
+            )
 
-        # Run the security analysis workflow
-        security_report = await security_workflow.analyze(
-            request.spec_text,
-            validation_suggestions=validation_suggestions_as_dicts,
-        )
+            # Convert report to dictionary for response
+            report_as_dict = security_report.model_dump()
 
-        # Convert report to dictionary for response
-        report_as_dict = security_report.model_dump()
+            # Cache the report for future requests
+            await _cache_security_report(cache, cache_key, report_as_dict)
+
+            logger.info(
+                f"Security analysis complete. Score: {security_report.overall_score:.1f}, "
+                f"Risk: {security_report.risk_level.value}",
+                extra={
+                    "correlation_id": correlation_id,
+                    "overall_score": security_report.overall_score,
+                    "risk_level": security_report.risk_level.value,
+                    "total_issues": len(security_report.all_issues),
+                },
+            )
+            return report_as_dict
 
-        # Cache the report for future requests
-        await _cache_security_report(cache, cache_key, report_as_dict)
+        # Concurrent requests for the same spec share one workflow run
+        report_as_dict = await _run_once(cache_key, analyze_and_cache)
 
-        logger.info(
-            f"Security analysis complete. Score: {security_report.overall_score:.1f}, "
-            f"Risk: {security_report.risk_level.value}",
-            extra={
-                "correlation_id": correlation_id,
-                "overall_score": security_report.overall_score,
-                "risk_level": security_report.risk_level.value,
-                "total_issues": len(security_report.all_issues),
-            },
+        return _with_report_cache_headers(
+            _stream_report_response(
+                report_as_dict, cached=False, correlation_id=correlation_id
+            ),
+            _report_etag(spec_hash, report_as_dict),
         )
 
-        return {
-            "cached": False,
-            "report": report_as_dict,
-            "correlation_id": correlation_id,
-        }
-
-    except json.JSONDecodeError as json_error:
+    except orjson.JSONDecodeError as json_error:
         logger.error(f"Invalid JSON in specification: {str(json_error)}")
         raise HTTPException(
             status_code=400,
@@ -175,6 +212,7 @@ async def run_comprehensive_security_analysis(
 @router.post("/analyze/authentication")
 async def analyze_authentication_mechanisms(
     request: SecurityAnalysisRequest,
+    analyzer: AuthenticationAnalyzer = Depends(get_authentication_analyzer),
 ) -> Dict[str, Any]:
     """
     Analyze authentication mechanisms in an OpenAPI specification.
@@ -187,6 +225,7 @@ async def analyze_authentication_mechanisms(
 
     Args:
         request: Security analysis request containing the spec.
+        analyzer: Injected shared authentication analyzer.
 
     Returns:
         Authentication-specific analysis results.
@@ -199,19 +238,18 @@ async def analyze_authentication_mechanisms(
     )
 
     try:
-        spec_as_dict = json.loads(request.spec_text)
+        spec_as_dict = await _load_spec_dict(request.spec_text)
 
-        from app.services.security.authentication_analyzer import AuthenticationAnalyzer
-
-        analyzer = AuthenticationAnalyzer()
         analysis_result = await analyzer.analyze(spec_as_dict)
 
-        return {
-            "analysis": analysis_result.model_dump(),
-            "correlation_id": correlation_id,
-        }
+        return ORJSONResponse(
+            {
+                "analysis": analysis_result.model_dump(),
+                "correlation_id": correlation_id,
+            }
+        )
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=400,
             detail={
@@ -233,6 +271,7 @@ async def analyze_authentication_mechanisms(
 @router.post("/analyze/authorization")
 async def analyze_authorization_controls(
     request: SecurityAnalysisRequest,
+    analyzer: AuthorizationAnalyzer = Depends(get_authorization_analyzer),
 ) -> Dict[str, Any]:
     """
     Analyze authorization controls in an OpenAPI specification.
@@ -245,6 +284,7 @@ async def analyze_authorization_controls(
 
     Args:
         request: Security analysis request containing the spec.
+        analyzer: Injected shared authorization analyzer.
 
     Returns:
         Authorization-specific analysis results.
@@ -257,17 +297,16 @@ async def analyze_authorization_controls(
     )
 
     try:
-        spec_as_dict = json.loads(request.spec_text)
-
-        from app.services.security.authorization_analyzer import AuthorizationAnalyzer
+        spec_as_dict = await _load_spec_dict(request.spec_text)
 
-        analyzer = AuthorizationAnalyzer()
         analysis_result = await analyzer.analyze(spec_as_dict)
 
-        return {
-            "analysis": analysis_result.model_dump(),
-            "correlation_id": correlation_id,
-        }
+        return ORJSONResponse(
+            {
+                "analysis": analysis_result.model_dump(),
+                "correlation_id": correlation_id,
+            }
+        )
 
     except Exception as error:
         logger.error(f"Authorization analysis failed: {str(error)}")
@@ -283,6 +322,7 @@ async def analyze_authorization_controls(
 @router.post("/analyze/data-exposure")
 async def analyze_data_exposure_risks(
     request: SecurityAnalysisRequest,
+    analyzer: DataExposureAnalyzer = Depends(get_data_exposure_analyzer),
 ) -> Dict[str, Any]:
     """
     Analyze data exposure and PII protection in an OpenAPI specification.
@@ -296,6 +336,7 @@ async def analyze_data_exposure_risks(
 
     Args:
         request: Security analysis request containing the spec.
+        analyzer: Injected shared data exposure analyzer.
 
     Returns:
         Data exposure analysis results.
@@ -308,17 +349,16 @@ async def analyze_data_exposure_risks(
     )
 
     try:
-        spec_as_dict = json.loads(request.spec_text)
+        spec_as_dict = await _load_spec_dict(request.spec_text)
 
-        from app.services.security.data_exposure_analyzer import DataExposureAnalyzer
-
-        analyzer = DataExposureAnalyzer()
         analysis_result = await analyzer.analyze(spec_as_dict)
 
-        return {
-            "analysis": analysis_result.model_dump(),
-            "correlation_id": correlation_id,
-        }
+        return ORJSONResponse(
+            {
+                "analysis": analysis_result.model_dump(),
+                "correlation_id": correlation_id,
+            }
+        )
 
     except Exception as error:
         logger.error(f"Data exposure analysis failed: {str(error)}")
@@ -339,33 +379,38 @@ async def analyze_data_exposure_risks(
 @router.get("/report/{spec_hash}")
 async def get_cached_security_report_by_hash(
     spec_hash: str,
+    http_request: Request,
     cache: "ICacheRepository" = Depends(get_cache_repository),
-) -> Dict[str, Any]:
+) -> Response:
     """
     Retrieve a cached security analysis report by its specification hash.
 
     Args:
-        spec_hash: The SHA-256 hash of the specification text.
+        spec_hash: The BLAKE2b-256 hash of the specification text.
+        http_request: The raw request, for If-None-Match revalidation.
         cache: Injected cache repository.
 
     Returns:
-        The cached security report if found.
+        The cached security report if found, or 304 Not Modified if the
+        client already holds it.
 
     Raises:
         HTTPException: 404 if no cached report exists for the given hash.
     """
     logger.info(f"Retrieving cached security report for hash: {spec_hash[:16]}...")
 
-    # Build the cache key with prefix
-    cache_key = f"{_SECURITY_CACHE_PREFIX}{spec_hash}"
+    cache_key = _generate_cache_key_for_spec(spec_hash)
     cached_report = await _get_cached_security_report(cache, cache_key)
 
     if cached_report:
-        return {
-            "cached": True,
-            "report": cached_report,
-            "spec_hash": spec_hash,
-        }
+        etag = _report_etag(spec_hash, cached_report)
+        if _etag_matches(http_request, etag):
+            return _not_modified_response(etag)
+
+        return _with_report_cache_headers(
+            _stream_report_response(cached_report, cached=True, spec_hash=spec_hash),
+            etag,
+        )
 
     raise HTTPException(
         status_code=404,
@@ -387,7 +432,7 @@ async def run_attack_path_simulation(
     request: Dict[str, Any],
     llm_service: LLMService = Depends(get_llm_service),
     cache: "ICacheRepository" = Depends(get_cache_repository),
-) -> Dict[str, Any]:
+) -> StreamingResponse:
     """
     AI-powered attack path simulation - discovers multi-step attack chains.
 
@@ -454,29 +499,35 @@ async def run_attack_path_simulation(
         )
 
         # Check cache first
+        spec_hash = await _compute_spec_hash(spec_text)
         cache_key = _generate_attack_path_cache_key(
-            spec_text, analysis_request.analysis_depth
+            spec_hash, analysis_request.analysis_depth
         )
 
         cached_report = await _get_cached_security_report(cache, cache_key)
         if cached_report:
             logger.info(f"Returning cached attack path report: {cache_key[:32]}...")
-            return cached_report
+            return _stream_report_response(cached_report)
 
-        # Run the attack path simulation
-        orchestrator = AttackPathOrchestrator(llm_service)
-        attack_path_report = await orchestrator.run_attack_path_analysis(
-            analysis_request
-        )
+        async def simulate_and_cache() -> Dict[str, Any]:
+            # Run the attack path simulation
+            orchestrator = AttackPathOrchestrator(llm_service)
+            attack_path_report = await orchestrator.run_attack_path_analysis(
+                analysis_request
+            )
 
-        # Convert to dictionary for response
-        report_as_dict = attack_path_report.model_dump()
+            # Convert to dictionary for response
+            report_as_dict = attack_path_report.model_dump()
 
-        # Cache the report
-        await _cache_security_report(cache, cache_key, report_as_dict)
-        logger.info(f"Cached attack path report: {cache_key[:32]}...")
+            # Cache the report
+            await _cache_security_report(cache, cache_key, report_as_dict)
+            logger.info(f"Cached attack path report: {cache_key[:32]}...")
+            return report_as_dict
 
-        return report_as_dict
+        # Concurrent requests for the same spec and depth share one simulation
+        report_as_dict = await _run_once(cache_key, simulate_and_cache)
+
+        return _stream_report_response(report_as_dict)
 
     except HTTPException:
         raise
@@ -564,7 +615,7 @@ async def analyze_attack_chains_from_linter_findings(
         report_as_dict = attack_path_report.model_dump()
         report_as_dict["findings_analyzed"] = len(findings)
         report_as_dict["correlation_id"] = correlation_id
-        return report_as_dict
+        return ORJSONResponse(report_as_dict)
 
     except HTTPException:
         raise
@@ -610,8 +661,7 @@ async def analyze_attack_chains_from_enriched_findings(
             request
         )
 
-        report_as_dict = attack_path_report.model_dump()
-        return report_as_dict
+        return ORJSONResponse(attack_path_report.model_dump())
 
     except Exception as error:
         logger.error(
@@ -630,6 +680,30 @@ async def analyze_attack_chains_from_enriched_findings(
 # RAG-Enhanced Security Analysis
 # =============================================================================
 
+# Prompt budget for the spec preview in the RAG query and the retrieved context
+_RAG_QUERY_SPEC_PREVIEW_CHARS = 300
+_RAG_CONTEXT_CHAR_CAP = 1000
+
+# Built once at import; per request only the context and prompt are substituted.
+_RAG_SECURITY_PROMPT_TEMPLATE = """Analyze this OpenAPI spec for security vulnerabilities:
+
+SECURITY CONTEXT FROM KNOWLEDGE BASE:
+{context_summary}
+
+USER REQUEST:
+{user_prompt}
+
+FOCUS AREAS:
+- Authentication and authorization
+- Input validation
+- Data exposure
+- Rate limiting
+- HTTPS/TLS enforcement
+- CORS configuration
+- Error handling
+
+Provide specific, actionable recommendations."""
+
 
 @router.post("/analyze-with-knowledge-base", response_model=AIResponse)
 async def analyze_security_with_rag_context(
@@ -663,41 +737,31 @@ async def analyze_security_with_rag_context(
     )
 
     try:
-        # Build security query for knowledge base
-        spec_preview = request.spec_text[:300] if request.spec_text else ""
-        security_query = (
-            f"Security analysis OpenAPI specification vulnerabilities "
-            f"authentication authorization: {spec_preview}"
-        )
+        if rag_service.is_available():
+            # Build security query for knowledge base
+            spec_preview = request.spec_text[:_RAG_QUERY_SPEC_PREVIEW_CHARS]
+            security_query = (
+                f"Security analysis OpenAPI specification vulnerabilities "
+                f"authentication authorization: {spec_preview}"
+            )
 
-        # Retrieve relevant context from knowledge base
-        context_data = await rag_service.retrieve_security_context(
-            security_query, n_results=3
-        )
+            # Retrieve relevant context from knowledge base
+            context_data = await rag_service.retrieve_security_context(
+                security_query, n_results=3
+            )
+        else:
+            # Nothing to retrieve; skip building the query and the KB call
+            context_data = {"sources": [], "relevance_scores": []}
 
         # Build enhanced prompt with context
-        context_summary = context_data.get("context", "No additional context available")
-        if len(context_summary) > 1000:
-            context_summary = context_summary[:1000] + "..."
-
-        enhanced_prompt = f"""Analyze this OpenAPI spec for security vulnerabilities:
-
-SECURITY CONTEXT FROM KNOWLEDGE BASE:
-{context_summary}
-
-USER REQUEST:
-{request.prompt}
-
-FOCUS AREAS:
-- Authentication and authorization
-- Input validation
-- Data exposure
-- Rate limiting
-- HTTPS/TLS enforcement
-- CORS configuration
-- Error handling
+        context_summary = _truncate(
+            context_data.get("context", "No additional context available"),
+            _RAG_CONTEXT_CHAR_CAP,
+        )
 
-Provide specific, actionable recommendations."""
+        enhanced_prompt = _RAG_SECURITY_PROMPT_TEMPLATE.format_map(
+            {"context_summary": context_summary, "user_prompt": request.prompt}
+        )
 
         # Create enhanced request for LLM processing
         enhanced_request = AIRequest(
@@ -751,16 +815,159 @@ Provide specific, actionable recommendations."""
 # =============================================================================
 
 
-def _generate_cache_key_for_spec(spec_text: str) -> str:
-    """Generate a cache key from the specification text."""
-    spec_hash = hashlib.sha256(spec_text.encode()).hexdigest()
+def _hash_spec_text(spec_text: str) -> str:
+    """Hash specification text for cache keying (BLAKE2b outpaces SHA-256)."""
+    return hashlib.blake2b(spec_text.encode(), digest_size=32).hexdigest()
+
+
+async def _compute_spec_hash(spec_text: str) -> str:
+    """
+    Hash specification text without stalling the event loop on large specs.
+
+    hashlib releases the GIL on large buffers, so multi-megabyte specs are
+    hashed in the threadpool while other requests keep being served.
+    """
+    if len(spec_text) > _INLINE_HASH_MAX_CHARS:
+        return await run_in_threadpool(_hash_spec_text, spec_text)
+    return _hash_spec_text(spec_text)
+
+
+async def _load_spec_dict(spec_text: str) -> Dict[str, Any]:
+    """
+    Parse specification JSON, reusing the result for a recently seen spec.
+
+    Raises:
+        orjson.JSONDecodeError: If the specification is not valid JSON.
+    """
+    spec_hash = await _compute_spec_hash(spec_text)
+    spec_as_dict = _PARSED_SPEC_CACHE.get(spec_hash)
+    if spec_as_dict is not None:
+        _PARSED_SPEC_CACHE.move_to_end(spec_hash)
+        return spec_as_dict
+
+    spec_as_dict = orjson.loads(spec_text)
+    _PARSED_SPEC_CACHE[spec_hash] = spec_as_dict
+    if len(_PARSED_SPEC_CACHE) > _PARSED_SPEC_CACHE_MAX_ENTRIES:
+        _PARSED_SPEC_CACHE.popitem(last=False)
+    return spec_as_dict
+
+
+async def _run_once(
+    cache_key: str, produce_report: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    Produce a report, joining an identical in-flight run if there is one.
+
+    Without this, N simultaneous cold-cache requests for one spec would each
+    run the full (LLM-backed) workflow. The run is awaited through ``shield``
+    so a disconnecting client does not cancel it for the others.
+    """
+    task = _INFLIGHT_REPORTS.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(produce_report())
+        _INFLIGHT_REPORTS[cache_key] = task
+        task.add_done_callback(lambda _: _INFLIGHT_REPORTS.pop(cache_key, None))
+    else:
+        logger.info(f"Joining in-flight report generation: {cache_key[:32]}...")
+
+    return await asyncio.shield(task)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cap text at ``limit`` characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def _report_etag(spec_hash: str, report: Dict[str, Any]) -> str:
+    """
+    Build the ETag for a spec's security report.
+
+    Includes the report's generation time so a force_refresh regeneration
+    under the same spec hash gets a new validator. Weak, because the
+    envelope (correlation_id) differs between responses while the report
+    itself is the same cached entry.
+    """
+    generated_at = str(report.get("generated_at", ""))
+    version = hashlib.blake2b(generated_at.encode(), digest_size=8).hexdigest()
+    return f'W/"{spec_hash}-{version}"'
+
+
+def _etag_matches(http_request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match already names this report."""
+    if_none_match = http_request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    # "*" on an unsafe method means "only if nothing exists yet", which is a
+    # precondition for the POST, not a request for 304
+    if "*" in candidates and http_request.method in ("GET", "HEAD"):
+        return True
+    return etag in candidates
+
+
+def _with_report_cache_headers(response: Response, etag: str) -> Response:
+    """Let browsers and proxies revalidate a report instead of refetching it."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _REPORT_CACHE_CONTROL
+    return response
+
+
+def _not_modified_response(etag: str) -> Response:
+    """Answer a matching revalidation without re-sending the report."""
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": _REPORT_CACHE_CONTROL},
+    )
+
+
+def _stream_report_response(
+    report: Dict[str, Any], **envelope: Any
+) -> StreamingResponse:
+    """
+    Stream a report as JSON one top-level section at a time.
+
+    Reports can run to megabytes of findings; encoding section by section
+    lets the first bytes go out before the whole report is serialized and
+    avoids holding a second full copy of it as one buffer.
+
+    Args:
+        report: The report dictionary.
+        **envelope: Fields to wrap around the report, which is then nested
+            under "report". Without them the report itself is the body.
+
+    Returns:
+        StreamingResponse producing a single JSON object.
+    """
+
+    async def encode_report() -> AsyncIterator[bytes]:
+        if envelope:
+            yield b'{"report":'
+        separator = b"{"
+        for key, value in report.items():
+            yield separator + orjson.dumps(key) + b":" + _dump_json(value)
+            separator = b","
+        yield b"{}" if separator == b"{" else b"}"
+        if envelope:
+            for key, value in envelope.items():
+                yield b"," + orjson.dumps(key) + b":" + _dump_json(value)
+            yield b"}"
+
+    return StreamingResponse(encode_report(), media_type="application/json")
+
+
+def _dump_json(value: Any) -> bytes:
+    """Encode a report section, allowing non-string (e.g. enum) dict keys."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _generate_cache_key_for_spec(spec_hash: str) -> str:
+    """Generate a cache key from the specification hash."""
     return f"{_SECURITY_CACHE_PREFIX}{spec_hash}"
 
 
-def _generate_attack_path_cache_key(spec_text: str, analysis_depth: str) -> str:
+def _generate_attack_path_cache_key(spec_hash: str, analysis_depth: str) -> str:
     """Generate a cache key for attack path analysis."""
-    spec_hash = hashlib.sha256(spec_text.encode()).hexdigest()
-    return f"{_ATTACK_PATH_CACHE_PREFIX}{spec_hash}_{analysis_depth}"
+    return f"{_ATTACK_PATH_CACHE_PREFIX}{spec_hash}:{analysis_depth}"
 
 
 async def _get_cached_security_report(
@@ -777,10 +984,10 @@ async def _get_cached_security_report(
     Returns:
         The cached report dictionary if found, None otherwise.
     """
-    cached_data = await cache.get(cache_key)
+    cached_report = await cache.get(cache_key)
 
-    if cached_data and isinstance(cached_data, dict):
-        return cached_data.get("report")
+    if cached_report and isinstance(cached_report, dict):
+        return cached_report
 
     return None
 
@@ -798,8 +1005,5 @@ async def _cache_security_report(
         cache_key: The cache key to store under.
         report: The report dictionary to cache.
     """
-    cache_data = {
-        "report": report,
-        "cached_at": datetime.utcnow().isoformat(),
-    }
-    await cache.set(cache_key, cache_data, ttl=SECURITY_CACHE_TTL)
+    # The cache backend owns expiry, so the report is stored as-is
+    await cache.set(cache_key, report, ttl=SECURITY_CACHE_TTL)
@@ -23,38 +23,98 @@ Security Note:
 - JSON parsing is wrapped in try-catch for security
 """
 
+import asyncio
+import hashlib
 import json
-import logging
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
+import httpx
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
-from app.api.deps import get_llm_service
+from app.api.deps import get_cache_repository, get_llm_service
 from app.core.config import settings
-from app.core.logging import set_correlation_id
+from app.core.logging import get_logger, set_correlation_id
+from app.core.streaming import (
+    JSON_HEADERS,
+    STREAM_HEADERS,
+    ndjson_line,
+    stream_chat_events,
+)
 from app.schemas.spec_analysis_schemas import (
     AuthorizationMatrixRequest,
     ComprehensiveAnalysisRequest,
+    FullArchitectureAnalysisRequest,
     SchemaSimilarityRequest,
     TaintAnalysisRequest,
     ZombieApiRequest,
 )
 from app.services.llm_service import LLMService
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from app.domain.interfaces.cache_repository import ICacheRepository
+
+# Under the schemasculpt_ai logger so CorrelationIdFilter stamps every record
+# with the correlation ID set_correlation_id() stored in the request context
+logger = get_logger("spec_analysis")
 
 router = APIRouter(prefix="/ai/analyze", tags=["OpenAPI Specification Analysis"])
 
+# Byte-identical system prompt for every interpretation call so the LLM
+# backend can reuse its prefix cache; personas live in the user prompts
+_SHARED_SYSTEM_PROMPT = (
+    "You are a senior API architect. "
+    "Respond only with valid JSON matching the requested schema."
+)
+
+# Generation caps per response schema: taint nests several arrays, the
+# synthesis report is the largest, the rest are single-topic reports
+_TAINT_MAX_TOKENS = 1500
+_REPORT_MAX_TOKENS = 1200
+_COMPREHENSIVE_MAX_TOKENS = 2500
+
+# LLM replies larger than this are parsed off the event loop; below it the
+# threadpool hop costs more than orjson takes to parse
+_INLINE_PARSE_MAX_CHARS = 256 * 1024
+
+_REPAIR_PROMPT_TEMPLATE = (
+    "Your previous JSON was invalid: {problem}. "
+    "Return only valid JSON matching the requested schema."
+)
+
 # Maximum characters to send to LLM for context
 MAX_CONTEXT_CHARS = 3000
 
+# Shared encoder for prompt context; iterencode lets truncation stop early.
+# The output is only read by the LLM, so it is compact: whitespace is tokens.
+_CONTEXT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
 
 def _safe_json_truncate(data: Any, max_chars: int = MAX_CONTEXT_CHARS) -> str:
     """
     Safely convert data to JSON string with truncation.
 
-    Prevents excessive token usage while preserving valid JSON structure.
+    Payloads that may fit are encoded in one orjson call. Anything larger is
+    encoded incrementally and stops as soon as the budget is reached, so the
+    work done is bounded by max_chars rather than by the size of the data.
 
     Args:
         data: Data to convert to JSON
@@ -63,31 +123,240 @@ def _safe_json_truncate(data: Any, max_chars: int = MAX_CONTEXT_CHARS) -> str:
     Returns:
         Truncated JSON string
     """
+    # Every entry of a container costs at least two characters, so one with
+    # more entries than that cannot fit and is never encoded in full
+    oversized = isinstance(data, (list, dict)) and len(data) * 2 > max_chars
+    if not oversized:
+        try:
+            encoded = orjson.dumps(data)
+            if len(encoded) <= max_chars:
+                return encoded.decode()
+        except TypeError:
+            pass
+
     try:
-        json_str = json.dumps(data, indent=2)
-        if len(json_str) > max_chars:
-            return json_str[:max_chars] + "\n... (truncated)"
-        return json_str
+        parts: List[str] = []
+        length = 0
+        for chunk in _CONTEXT_ENCODER.iterencode(data):
+            parts.append(chunk)
+            length += len(chunk)
+            if length > max_chars:
+                return "".join(parts)[:max_chars] + "\n... (truncated)"
+        return "".join(parts)
     except (TypeError, ValueError):
         return str(data)[:max_chars]
 
 
+def _utc_now_iso() -> str:
+    """Timezone-aware UTC timestamp for generated_at fields."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _build_interpretation_payload(
+    user_prompt: str, max_tokens: int, stream: bool = False
+) -> Dict[str, Any]:
+    """Build the Ollama chat payload for an interpretation prompt."""
+    return {
+        "model": settings.default_model,
+        "messages": [
+            {"role": "system", "content": _SHARED_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ],
+        "stream": stream,
+        "format": "json",
+        "options": {
+            "temperature": 0.1,
+            "num_predict": max_tokens,
+            "stop": ["\n\n\n"],
+        },
+    }
+
+
+class _CircuitBreaker:
+    """
+    Fail fast while the LLM backend is down.
+
+    After fail_max consecutive failures the breaker opens and calls are
+    refused until reset_timeout seconds pass. It is then half-open: a single
+    trial call is let through while every other caller is still refused,
+    and the trial's result closes or reopens the breaker. A trial that never
+    reports back (cancelled, or answered with a 4xx) stops blocking others
+    after another reset_timeout.
+    """
+
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        """Whether a call may be attempted now."""
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            return False
+        if (
+            self._trial_started_at is not None
+            and now - self._trial_started_at < self.reset_timeout
+        ):
+            # A trial call is already in flight
+            return False
+        self._trial_started_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a healthy reply."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        """Count a backend failure, opening the breaker at fail_max."""
+        self._failures += 1
+        self._trial_started_at = None
+        if self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
+
+
+_llm_breaker = _CircuitBreaker(fail_max=5, reset_timeout=30.0)
+
+
+def _record_llm_status(status_code: int) -> None:
+    """Feed an LLM response status to the breaker; 4xx says nothing about health."""
+    if status_code == 200:
+        _llm_breaker.record_success()
+    elif status_code >= 500:
+        _llm_breaker.record_failure()
+
+
+_LLM_UNAVAILABLE_DETAIL = {
+    "error": "LLM_REQUEST_FAILED",
+    "message": "AI interpretation service unavailable",
+}
+
+
+async def _post_hedged(
+    llm_service: LLMService, payload: Dict[str, Any]
+) -> httpx.Response:
+    """
+    POST an interpretation request, hedged when settings.hedge_requests > 1.
+
+    Interpretations are idempotent, so identical requests are raced and the
+    first to complete wins; the rest are cancelled, which makes httpx close
+    their responses and release the pooled connections.
+    """
+    # Encode once with orjson rather than letting httpx json.dumps the body
+    # for every hedged copy
+    body = orjson.dumps(payload)
+    if settings.hedge_requests <= 1:
+        return await llm_service.client.post(
+            llm_service.chat_endpoint, content=body, headers=JSON_HEADERS
+        )
+
+    pending = {
+        asyncio.create_task(
+            llm_service.client.post(
+                llm_service.chat_endpoint, content=body, headers=JSON_HEADERS
+            )
+        )
+        for _ in range(settings.hedge_requests)
+    }
+    try:
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            failed = None
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                failed = task
+            if not pending:
+                return failed.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _request_interpretation_json(
+    llm_service: LLMService, payload: Dict[str, Any]
+) -> Tuple[Any, str]:
+    """
+    POST a chat payload and parse the JSON answer.
+
+    Returns:
+        Tuple of (parsed answer or None if it is not valid JSON, raw answer).
+
+    Raises:
+        HTTPException: If the breaker is open or the LLM call fails
+    """
+    if not _llm_breaker.allow():
+        logger.warning("LLM circuit breaker open, failing fast")
+        raise HTTPException(status_code=500, detail=_LLM_UNAVAILABLE_DETAIL)
+
+    try:
+        response = await _post_hedged(llm_service, payload)
+    except httpx.HTTPError:
+        _llm_breaker.record_failure()
+        raise
+
+    _record_llm_status(response.status_code)
+    if response.status_code != 200:
+        logger.error(f"LLM request failed with status {response.status_code}")
+        raise HTTPException(status_code=500, detail=_LLM_UNAVAILABLE_DETAIL)
+
+    # One orjson pass over the raw envelope bytes; only the answer string
+    # inside it is decoded a second time
+    envelope = orjson.loads(response.content)
+    llm_response = envelope.get("message", {}).get("content", "{}")
+    try:
+        if len(llm_response) > _INLINE_PARSE_MAX_CHARS:
+            return await run_in_threadpool(orjson.loads, llm_response), llm_response
+        return orjson.loads(llm_response), llm_response
+    except json.JSONDecodeError as e:
+        logger.warning(f"Failed to parse LLM JSON response: {str(e)}")
+        return None, llm_response
+
+
+def _find_schema_problem(
+    interpretation: Any, required_fields: Dict[str, Any]
+) -> Optional[str]:
+    """Describe the first way the answer deviates from the schema, if any."""
+    if interpretation is None:
+        return "the response was not valid JSON"
+    if not isinstance(interpretation, dict):
+        return "the top-level value must be a JSON object"
+    for name, expected_type in required_fields.items():
+        if name not in interpretation:
+            return f'the required field "{name}" is missing'
+        if not isinstance(interpretation[name], expected_type):
+            return f'the field "{name}" has the wrong type'
+    return None
+
+
 async def _call_llm_for_interpretation(
     llm_service: LLMService,
-    system_prompt: str,
     user_prompt: str,
     correlation_id: str,
+    max_tokens: int,
+    required_fields: Dict[str, Any],
 ) -> Dict[str, Any]:
     """
     Call LLM for JSON interpretation of analysis results.
 
     Centralizes LLM call logic with consistent error handling and logging.
+    An answer that is not valid JSON or misses required fields gets one
+    repair round on the same conversation before giving up.
 
     Args:
         llm_service: The LLM service instance
-        system_prompt: System context for the LLM
         user_prompt: The actual analysis prompt
         correlation_id: Request correlation ID for tracing
+        max_tokens: Generation cap sized to the endpoint's response schema
+        required_fields: Top-level fields the answer must have, with their types
 
     Returns:
         Parsed JSON response from LLM
@@ -95,58 +364,243 @@ async def _call_llm_for_interpretation(
     Raises:
         HTTPException: If LLM call fails or response is invalid
     """
-    payload = {
-        "model": settings.default_model,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        "stream": False,
-        "format": "json",
-        "options": {"temperature": 0.2, "num_predict": 3000},
+    payload = _build_interpretation_payload(user_prompt, max_tokens)
+    interpretation, llm_response = await _request_interpretation_json(
+        llm_service, payload
+    )
+
+    problem = _find_schema_problem(interpretation, required_fields)
+    if problem is None:
+        return interpretation
+
+    logger.warning(f"LLM interpretation invalid ({problem}), requesting repair")
+    payload["messages"] = [
+        *payload["messages"],
+        {"role": "assistant", "content": llm_response},
+        {"role": "user", "content": _REPAIR_PROMPT_TEMPLATE.format(problem=problem)},
+    ]
+    repaired, repaired_response = await _request_interpretation_json(
+        llm_service, payload
+    )
+    if _find_schema_problem(repaired, required_fields) is None:
+        return repaired
+
+    # Fall back to whatever parsed, even if incomplete
+    for candidate in (repaired, interpretation):
+        if isinstance(candidate, dict):
+            return candidate
+
+    # Return a structured error response instead of failing
+    return {
+        "error": "PARSE_ERROR",
+        "message": "AI response was not valid JSON",
+        "raw_response_preview": (repaired_response or llm_response)[:500] or None,
     }
 
-    # Initialize before try block to avoid UnboundLocalError in exception handler
-    llm_response: Optional[str] = None
 
-    try:
-        response = await llm_service.client.post(
-            llm_service.chat_endpoint, json=payload
-        )
+# Interpretations are pure functions of the analyzer payload, so repeat
+# requests for an unchanged spec are answered without an LLM call
+_CACHE_PREFIX = "spec_analysis:"
+_INTERPRETATION_CACHE_TTL = timedelta(seconds=settings.cache_ttl)
 
-        if response.status_code != 200:
-            logger.error(
-                f"LLM request failed with status {response.status_code}",
-                extra={"correlation_id": correlation_id},
-            )
-            raise HTTPException(
-                status_code=500,
-                detail={
-                    "error": "LLM_REQUEST_FAILED",
-                    "message": "AI interpretation service unavailable",
-                },
-            )
 
-        llm_response = response.json().get("message", {}).get("content", "{}")
-        return json.loads(llm_response)
+# The optional spec_text never reaches the prompts, so it is left out of the
+# cache key: hashing a multi-hundred-KB spec on every request buys nothing
+_CACHE_KEY_EXCLUDE = {
+    "spec_text": True,
+    "taint_analysis": {"spec_text"},
+    "authz_matrix": {"spec_text"},
+    "schema_similarity": {"spec_text"},
+    "zombie_apis": {"spec_text"},
+}
 
-    except json.JSONDecodeError as e:
-        logger.warning(
-            f"Failed to parse LLM JSON response: {str(e)}",
-            extra={"correlation_id": correlation_id},
-        )
-        # Return a structured error response instead of failing
+
+def _generate_cache_key(kind: str, request: "BaseModel") -> str:
+    """Generate cache key for an interpretation from its canonical payload."""
+    payload = orjson.dumps(
+        request.model_dump(exclude=_CACHE_KEY_EXCLUDE), option=orjson.OPT_SORT_KEYS
+    )
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return f"{_CACHE_PREFIX}{kind}:{digest}"
+
+
+async def _cached_interpretation(
+    cache: "ICacheRepository",
+    kind: str,
+    request: Any,
+    llm_service: LLMService,
+    correlation_id: str,
+    interpret: Callable[[Any, LLMService, str], Awaitable[Dict[str, Any]]],
+    required_fields: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Return a cached interpretation for the payload or produce and cache it.
+
+    The per-request correlation_id and generated_at are not stored; cache hits
+    are stamped with fresh values and flagged with "cached": True. Only
+    interpretations that match required_fields are cached.
+    """
+    cache_key = _generate_cache_key(kind, request)
+    cached = await cache.get(cache_key)
+    if cached:
+        logger.info(f"Returning cached {kind} interpretation")
         return {
-            "error": "PARSE_ERROR",
-            "message": "AI response was not valid JSON",
-            "raw_response_preview": llm_response[:500] if llm_response else None,
+            **cached,
+            "cached": True,
+            "correlation_id": correlation_id,
+            "generated_at": _utc_now_iso(),
         }
 
+    interpretation = await interpret(request, llm_service, correlation_id)
+    await _cache_interpretation(cache, cache_key, interpretation, required_fields)
+    return interpretation
+
+
+async def _cache_interpretation(
+    cache: "ICacheRepository",
+    cache_key: str,
+    interpretation: Dict[str, Any],
+    required_fields: Dict[str, Any],
+) -> None:
+    """Store an interpretation without its per-request fields."""
+    # Error payloads and schema-invalid fallbacks are not worth replaying
+    if _find_schema_problem(interpretation, required_fields) is not None:
+        return
+    await cache.set(
+        cache_key,
+        {
+            key: value
+            for key, value in interpretation.items()
+            if key not in ("correlation_id", "generated_at")
+        },
+        ttl=_INTERPRETATION_CACHE_TTL,
+    )
+
+
+# Built once at import; per request only the counts and findings are substituted.
+_TAINT_PROMPT_TEMPLATE = """You are an API security analyst specializing in data protection and compliance, analyzing taint analysis results.
+
+TAINT ANALYSIS FINDINGS:
+Total Vulnerabilities: {total}
+- CRITICAL (Public data leakage): {critical_count}
+- WARNING (Secured but needs review): {warning_count}
+
+CRITICAL VULNERABILITIES:
+{critical_json}
+
+WARNING VULNERABILITIES:
+{warning_json}
+
+Provide a comprehensive security analysis in JSON format:
+{{
+  "executive_summary": "Brief executive summary of the data leakage risks",
+  "risk_level": "CRITICAL|HIGH|MEDIUM|LOW",
+  "business_impact": "Explanation of business/compliance impact",
+  "top_issues": [
+    {{
+      "endpoint": "endpoint path",
+      "issue": "description",
+      "severity": "CRITICAL|WARNING",
+      "leaked_data": "what sensitive data is exposed",
+      "attack_scenario": "how an attacker could exploit this",
+      "compliance_impact": "GDPR/PCI-DSS/HIPAA violations"
+    }}
+  ],
+  "remediation_priorities": [
+    {{
+      "priority": "IMMEDIATE|HIGH|MEDIUM",
+      "action": "specific fix to implement",
+      "endpoints_affected": ["list of endpoints"],
+      "estimated_effort": "hours/days"
+    }}
+  ],
+  "compliance_recommendations": {{
+    "gdpr": "GDPR-specific recommendations",
+    "pci_dss": "PCI-DSS recommendations if credit card data involved",
+    "hipaa": "HIPAA recommendations if health data involved"
+  }}
+}}"""
+
+# Top-level fields an answer must have before it is accepted
+_TAINT_REQUIRED_FIELDS = {
+    "executive_summary": str,
+    "risk_level": str,
+    "top_issues": list,
+    "remediation_priorities": list,
+}
+
+
+def _empty_taint_interpretation(correlation_id: str) -> Dict[str, Any]:
+    """Interpretation returned when the analyzer found no taint paths."""
+    return {
+        "summary": "No taint vulnerabilities detected. Your API appears to have proper data flow controls.",
+        "risk_level": "LOW",
+        "recommendations": [],
+        "correlation_id": correlation_id,
+    }
+
+
+def _build_taint_prompt(
+    request: TaintAnalysisRequest,
+) -> Tuple[str, Dict[str, int]]:
+    """Build the taint prompt and the finding counts reported alongside it."""
+    vulnerabilities = request.vulnerabilities
+
+    # Dump and categorize vulnerabilities by severity in a single pass
+    critical_vulns: List[Dict[str, Any]] = []
+    warning_vulns: List[Dict[str, Any]] = []
+    for vuln in vulnerabilities:
+        if vuln.severity == "CRITICAL":
+            critical_vulns.append(vuln.model_dump())
+        elif vuln.severity == "WARNING":
+            warning_vulns.append(vuln.model_dump())
+
+    taint_prompt = _TAINT_PROMPT_TEMPLATE.format(
+        total=len(vulnerabilities),
+        critical_count=len(critical_vulns),
+        warning_count=len(warning_vulns),
+        critical_json=_safe_json_truncate(critical_vulns, 1500),
+        warning_json=_safe_json_truncate(warning_vulns, 1000),
+    )
+    counts = {
+        "total_vulnerabilities": len(vulnerabilities),
+        "critical_count": len(critical_vulns),
+        "warning_count": len(warning_vulns),
+    }
+    return taint_prompt, counts
+
+
+async def _interpret_taint(
+    request: TaintAnalysisRequest,
+    llm_service: LLMService,
+    correlation_id: str,
+) -> Dict[str, Any]:
+    """Interpret taint analysis findings with the LLM."""
+    if not request.vulnerabilities:
+        return _empty_taint_interpretation(correlation_id)
+
+    taint_prompt, counts = _build_taint_prompt(request)
+    interpretation = await _call_llm_for_interpretation(
+        llm_service,
+        taint_prompt,
+        correlation_id,
+        _TAINT_MAX_TOKENS,
+        _TAINT_REQUIRED_FIELDS,
+    )
+
+    return {
+        **interpretation,
+        **counts,
+        "correlation_id": correlation_id,
+        "generated_at": _utc_now_iso(),
+    }
+
 
 @router.post("/taint-analysis")
 async def interpret_taint_analysis(
     request: TaintAnalysisRequest,
     llm_service: LLMService = Depends(get_llm_service),
+    cache: "ICacheRepository" = Depends(get_cache_repository),
 ) -> Dict[str, Any]:
     """
     AI-powered interpretation of Taint Analysis results.
@@ -191,92 +645,23 @@ async def interpret_taint_analysis(
     """
     correlation_id = set_correlation_id()
 
-    logger.info(
-        "Interpreting taint analysis results",
-        extra={"correlation_id": correlation_id},
-    )
+    logger.info("Interpreting taint analysis results")
 
     try:
-        # Convert Pydantic models to dicts for processing
-        vulnerabilities = [v.model_dump() for v in request.vulnerabilities]
-
-        if not vulnerabilities:
-            return {
-                "summary": "No taint vulnerabilities detected. Your API appears to have proper data flow controls.",
-                "risk_level": "LOW",
-                "recommendations": [],
-                "correlation_id": correlation_id,
-            }
-
-        # Categorize vulnerabilities by severity
-        critical_vulns = [v for v in vulnerabilities if v.get("severity") == "CRITICAL"]
-        warning_vulns = [v for v in vulnerabilities if v.get("severity") == "WARNING"]
-
-        taint_prompt = f"""You are an API security expert analyzing taint analysis results.
-
-TAINT ANALYSIS FINDINGS:
-Total Vulnerabilities: {len(vulnerabilities)}
-- CRITICAL (Public data leakage): {len(critical_vulns)}
-- WARNING (Secured but needs review): {len(warning_vulns)}
-
-CRITICAL VULNERABILITIES:
-{_safe_json_truncate(critical_vulns, 1500)}
-
-WARNING VULNERABILITIES:
-{_safe_json_truncate(warning_vulns, 1000)}
-
-Provide a comprehensive security analysis in JSON format:
-{{
-  "executive_summary": "Brief executive summary of the data leakage risks",
-  "risk_level": "CRITICAL|HIGH|MEDIUM|LOW",
-  "business_impact": "Explanation of business/compliance impact",
-  "top_issues": [
-    {{
-      "endpoint": "endpoint path",
-      "issue": "description",
-      "severity": "CRITICAL|WARNING",
-      "leaked_data": "what sensitive data is exposed",
-      "attack_scenario": "how an attacker could exploit this",
-      "compliance_impact": "GDPR/PCI-DSS/HIPAA violations"
-    }}
-  ],
-  "remediation_priorities": [
-    {{
-      "priority": "IMMEDIATE|HIGH|MEDIUM",
-      "action": "specific fix to implement",
-      "endpoints_affected": ["list of endpoints"],
-      "estimated_effort": "hours/days"
-    }}
-  ],
-  "compliance_recommendations": {{
-    "gdpr": "GDPR-specific recommendations",
-    "pci_dss": "PCI-DSS recommendations if credit card data involved",
-    "hipaa": "HIPAA recommendations if health data involved"
-  }}
-}}"""
-
-        interpretation = await _call_llm_for_interpretation(
+        return await _cached_interpretation(
+            cache,
+            "taint",
+            request,
             llm_service,
-            "You are an expert API security analyst specializing in data protection and compliance. Respond only with valid JSON.",
-            taint_prompt,
             correlation_id,
+            _interpret_taint,
+            _TAINT_REQUIRED_FIELDS,
         )
-
-        return {
-            **interpretation,
-            "total_vulnerabilities": len(vulnerabilities),
-            "critical_count": len(critical_vulns),
-            "warning_count": len(warning_vulns),
-            "correlation_id": correlation_id,
-            "generated_at": datetime.utcnow().isoformat(),
-        }
-
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
             f"Taint analysis interpretation failed: {str(e)}",
-            extra={"correlation_id": correlation_id},
             exc_info=True,
         )
         raise HTTPException(
@@ -289,67 +674,139 @@ Provide a comprehensive security analysis in JSON format:
         )
 
 
-@router.post("/authz-matrix")
-async def interpret_authz_matrix(
-    request: AuthorizationMatrixRequest,
-    llm_service: LLMService = Depends(get_llm_service),
-) -> Dict[str, Any]:
-    """
-    AI-powered interpretation of Authorization Matrix results.
-
-    Analyzes RBAC configuration for security anomalies and misconfigurations.
-    The authorization matrix maps API operations to their required scopes/roles.
-
-    Key anomaly patterns detected:
-    - Privilege escalation: DELETE/PUT accessible with read-only scopes
-    - Missing authorization: Public endpoints that should be protected
-    - Overly permissive: Single scope grants too broad access
-    - Role confusion: Admin operations accessible to regular users
-
-    Request body:
-        scopes (List[str]): All OAuth2 scopes/roles defined in the API
-        matrix (Dict[str, List[str]]): Maps "METHOD /path" to required scopes
-        spec_text (str, optional): OpenAPI specification for context
+# Top-level fields of the taint answer, surfaced as soon as each is complete
+_TAINT_STREAMED_FIELDS = (
+    "executive_summary",
+    "risk_level",
+    "business_impact",
+    "top_issues",
+    "remediation_priorities",
+    "compliance_recommendations",
+)
 
-    Returns:
-        Dict containing:
-            - executive_summary: Authorization security overview
-            - risk_level: CRITICAL | HIGH | MEDIUM | LOW
-            - anomalies_detected: List of authorization issues found
-            - best_practice_violations: RBAC best practice deviations
-            - recommendations: Prioritized fixes
 
-    Security Considerations:
-        - BOLA (Broken Object Level Authorization) detection
-        - BFLA (Broken Function Level Authorization) detection
-        - Excessive Data Exposure via authorization gaps
+@router.post("/taint-analysis/stream")
+async def stream_taint_analysis(
+    request: TaintAnalysisRequest,
+    llm_service: LLMService = Depends(get_llm_service),
+    cache: "ICacheRepository" = Depends(get_cache_repository),
+) -> StreamingResponse:
+    """
+    Stream the taint analysis interpretation as NDJSON.
+
+    Emits ``{"type": "chunk", "content": ...}`` lines as the LLM generates
+    tokens, a ``{"type": "field", "name": ..., "value": ...}`` line as soon as
+    each top-level field (``executive_summary`` first) is complete, then a
+    single ``{"type": "result", "interpretation": {...}}`` line with the same
+    payload /taint-analysis returns. Cached or empty analyses emit only the
+    result line. Failures after streaming has started are reported as a
+    ``{"type": "error", ...}`` line.
     """
     correlation_id = set_correlation_id()
 
-    logger.info(
-        "Interpreting authz matrix results",
-        extra={"correlation_id": correlation_id},
-    )
+    logger.info("Streaming taint analysis interpretation")
+
+    cache_key = _generate_cache_key("taint", request)
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        try:
+            cached = await cache.get(cache_key)
+            if cached:
+                yield ndjson_line(
+                    {
+                        "type": "result",
+                        "interpretation": {
+                            **cached,
+                            "cached": True,
+                            "correlation_id": correlation_id,
+                            "generated_at": _utc_now_iso(),
+                        },
+                    }
+                )
+                return
+
+            if not request.vulnerabilities:
+                yield ndjson_line(
+                    {
+                        "type": "result",
+                        "interpretation": _empty_taint_interpretation(correlation_id),
+                    }
+                )
+                return
+
+            if not _llm_breaker.allow():
+                raise RuntimeError("LLM circuit breaker open")
+
+            taint_prompt, counts = _build_taint_prompt(request)
+            payload = _build_interpretation_payload(
+                taint_prompt, _TAINT_MAX_TOKENS, stream=True
+            )
 
-    try:
-        scopes = request.scopes
-        matrix = request.matrix
+            parts: List[str] = []
+            try:
+                async for event in stream_chat_events(
+                    llm_service.client,
+                    llm_service.chat_endpoint,
+                    payload,
+                    _TAINT_STREAMED_FIELDS,
+                    parts,
+                    on_status=_record_llm_status,
+                ):
+                    yield event
+            except httpx.HTTPError:
+                _llm_breaker.record_failure()
+                raise
+
+            llm_response = "".join(parts)
+            try:
+                interpretation = orjson.loads(llm_response)
+            except orjson.JSONDecodeError:
+                interpretation = {
+                    "error": "PARSE_ERROR",
+                    "message": "AI response was not valid JSON",
+                    "raw_response_preview": llm_response[:500],
+                }
 
-        if not matrix:
-            return {
-                "summary": "No authorization matrix data available.",
-                "anomalies": [],
+            result = {
+                **interpretation,
+                **counts,
                 "correlation_id": correlation_id,
+                "generated_at": _utc_now_iso(),
             }
+            await _cache_interpretation(
+                cache, cache_key, result, _TAINT_REQUIRED_FIELDS
+            )
+            yield ndjson_line({"type": "result", "interpretation": result})
+
+        except Exception as e:
+            logger.error(
+                f"Taint analysis streaming failed: {str(e)}",
+                exc_info=True,
+            )
+            yield ndjson_line(
+                {
+                    "type": "error",
+                    "error": "TAINT_INTERPRETATION_FAILED",
+                    "message": f"Failed to interpret taint analysis: {str(e)}",
+                    "correlation_id": correlation_id,
+                }
+            )
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="application/x-ndjson",
+        headers=STREAM_HEADERS,
+    )
 
-        authz_prompt = f"""You are an API security expert analyzing RBAC authorization matrix.
+
+_AUTHZ_PROMPT_TEMPLATE = """You are an API security expert in RBAC and authorization, analyzing an authorization matrix.
 
 AUTHORIZATION MATRIX:
-Total Endpoints: {len(matrix)}
-Available Scopes/Roles: {', '.join(scopes) if scopes else 'None defined'}
+Total Endpoints: {total_endpoints}
+Available Scopes/Roles: {scopes}
 
 MATRIX DATA:
-{_safe_json_truncate(matrix)}
+{matrix_json}
 
 Analyze this authorization matrix for security anomalies. Look for:
 1. Destructive operations (DELETE, PUT) accessible with read-only scopes
@@ -385,96 +842,197 @@ Provide analysis in JSON format:
   ]
 }}"""
 
-        interpretation = await _call_llm_for_interpretation(
-            llm_service,
-            "You are an expert in RBAC and authorization security. Respond only with valid JSON.",
-            authz_prompt,
-            correlation_id,
-        )
+_AUTHZ_REQUIRED_FIELDS = {
+    "executive_summary": str,
+    "risk_level": str,
+    "anomalies_detected": list,
+    "recommendations": list,
+}
+
+
+# Only the most suspicious entries are sent verbatim; slicing the raw JSON
+# would cut the matrix mid-object and spend tokens on low-risk endpoints
+_AUTHZ_PROMPT_TOP_ENDPOINTS = 30
+_SIMILARITY_PROMPT_TOP_CLUSTERS = 20
+
+_DESTRUCTIVE_METHODS = frozenset({"DELETE", "PUT", "PATCH", "POST"})
+
+
+def _authz_anomaly_score(
+    operation: str, scopes: List[str], scope_usage: Counter, total: int
+) -> int:
+    """Heuristic risk score for one "METHOD /path" entry of the matrix."""
+    method, _, path = operation.partition(" ")
+    destructive = method.upper() in _DESTRUCTIVE_METHODS
+    score = 0
+
+    if not scopes:
+        score += 5 if destructive else 2
+    elif destructive and all("read" in scope.lower() for scope in scopes):
+        score += 4
+
+    if "admin" in path.lower() and not any(
+        "admin" in scope.lower() for scope in scopes
+    ):
+        score += 3
+
+    # A scope guarding most of the API grants broad access on its own
+    if len(scopes) == 1 and scope_usage[scopes[0]] * 2 > total:
+        score += 1
+    return score
+
+
+def _rank_authz_matrix(matrix: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Keep the highest-risk matrix entries and summarize the rest."""
+    if len(matrix) <= _AUTHZ_PROMPT_TOP_ENDPOINTS:
+        return matrix
+
+    scope_usage = Counter(scope for scopes in matrix.values() for scope in scopes)
+    total = len(matrix)
+    ranked = sorted(
+        matrix.items(),
+        key=lambda item: _authz_anomaly_score(item[0], item[1], scope_usage, total),
+        reverse=True,
+    )
+    others = ranked[_AUTHZ_PROMPT_TOP_ENDPOINTS:]
+    return {
+        "most_suspicious_endpoints": dict(ranked[:_AUTHZ_PROMPT_TOP_ENDPOINTS]),
+        "other_endpoints_summary": {
+            "count": len(others),
+            "method_distribution": dict(
+                Counter(operation.partition(" ")[0].upper() for operation, _ in others)
+            ),
+            "public_count": sum(1 for _, scopes in others if not scopes),
+        },
+    }
+
+
+def _rank_similarity_clusters(
+    clusters: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Keep the clusters with the most duplication: similarity times size."""
+    if len(clusters) <= _SIMILARITY_PROMPT_TOP_CLUSTERS:
+        return clusters
+    return sorted(
+        clusters,
+        key=lambda cluster: cluster["similarity_score"] * len(cluster["schemas"]),
+        reverse=True,
+    )[:_SIMILARITY_PROMPT_TOP_CLUSTERS]
+
+
+async def _interpret_authz(
+    request: AuthorizationMatrixRequest,
+    llm_service: LLMService,
+    correlation_id: str,
+) -> Dict[str, Any]:
+    """Interpret an authorization matrix with the LLM."""
+    scopes = request.scopes
+    matrix = request.matrix
 
+    if not matrix:
         return {
-            **interpretation,
-            "total_endpoints": len(matrix),
-            "total_scopes": len(scopes),
+            "summary": "No authorization matrix data available.",
+            "anomalies": [],
             "correlation_id": correlation_id,
-            "generated_at": datetime.utcnow().isoformat(),
         }
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            f"Authz matrix interpretation failed: {str(e)}",
-            extra={"correlation_id": correlation_id},
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "AUTHZ_INTERPRETATION_FAILED",
-                "message": f"Failed to interpret authorization matrix: {str(e)}",
-                "correlation_id": correlation_id,
-            },
-        )
+    authz_prompt = _AUTHZ_PROMPT_TEMPLATE.format(
+        total_endpoints=len(matrix),
+        scopes=", ".join(scopes) if scopes else "None defined",
+        matrix_json=_safe_json_truncate(_rank_authz_matrix(matrix)),
+    )
 
+    interpretation = await _call_llm_for_interpretation(
+        llm_service,
+        authz_prompt,
+        correlation_id,
+        _REPORT_MAX_TOKENS,
+        _AUTHZ_REQUIRED_FIELDS,
+    )
 
-@router.post("/schema-similarity")
-async def interpret_schema_similarity(
-    request: SchemaSimilarityRequest,
+    return {
+        **interpretation,
+        "total_endpoints": len(matrix),
+        "total_scopes": len(scopes),
+        "correlation_id": correlation_id,
+        "generated_at": _utc_now_iso(),
+    }
+
+
+@router.post("/authz-matrix")
+async def interpret_authz_matrix(
+    request: AuthorizationMatrixRequest,
     llm_service: LLMService = Depends(get_llm_service),
+    cache: "ICacheRepository" = Depends(get_cache_repository),
 ) -> Dict[str, Any]:
     """
-    AI-powered interpretation of Schema Similarity Clustering results.
+    AI-powered interpretation of Authorization Matrix results.
 
-    Provides refactoring recommendations for duplicate/similar schemas.
-    Schema duplication is a common API design smell that increases:
-    - Maintenance burden (changes in multiple places)
-    - Inconsistency risk (schemas drift apart over time)
-    - Documentation confusion (users unsure which schema to use)
+    Analyzes RBAC configuration for security anomalies and misconfigurations.
+    The authorization matrix maps API operations to their required scopes/roles.
 
-    Refactoring strategies recommended:
-    - MERGE: Combine identical schemas into one
-    - BASE_SCHEMA_WITH_INHERITANCE: Use allOf for shared base
-    - COMPOSITION: Use $ref for shared components
+    Key anomaly patterns detected:
+    - Privilege escalation: DELETE/PUT accessible with read-only scopes
+    - Missing authorization: Public endpoints that should be protected
+    - Overly permissive: Single scope grants too broad access
+    - Role confusion: Admin operations accessible to regular users
 
     Request body:
-        clusters (List[Dict]): Schema clusters from similarity analyzer
-            - Each cluster contains: schemas, similarity_score, shared_fields
+        scopes (List[str]): All OAuth2 scopes/roles defined in the API
+        matrix (Dict[str, List[str]]): Maps "METHOD /path" to required scopes
         spec_text (str, optional): OpenAPI specification for context
 
     Returns:
         Dict containing:
-            - executive_summary: Schema organization overview
-            - code_health_score: 0-100 quality score
-            - refactoring_opportunities: Detailed refactoring recommendations
-            - quick_wins: Low-effort, high-impact improvements
-            - architectural_recommendations: Long-term improvements
+            - executive_summary: Authorization security overview
+            - risk_level: CRITICAL | HIGH | MEDIUM | LOW
+            - anomalies_detected: List of authorization issues found
+            - best_practice_violations: RBAC best practice deviations
+            - recommendations: Prioritized fixes
+
+    Security Considerations:
+        - BOLA (Broken Object Level Authorization) detection
+        - BFLA (Broken Function Level Authorization) detection
+        - Excessive Data Exposure via authorization gaps
     """
     correlation_id = set_correlation_id()
 
-    logger.info(
-        "Interpreting schema similarity results",
-        extra={"correlation_id": correlation_id},
-    )
+    logger.info("Interpreting authz matrix results")
 
     try:
-        # Convert Pydantic models to dicts for processing
-        clusters = [c.model_dump() for c in request.clusters]
-
-        if not clusters:
-            return {
-                "summary": "No duplicate or similar schemas detected. Your schema design is well-organized.",
-                "refactoring_opportunities": [],
+        return await _cached_interpretation(
+            cache,
+            "authz",
+            request,
+            llm_service,
+            correlation_id,
+            _interpret_authz,
+            _AUTHZ_REQUIRED_FIELDS,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(
+            f"Authz matrix interpretation failed: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "AUTHZ_INTERPRETATION_FAILED",
+                "message": f"Failed to interpret authorization matrix: {str(e)}",
                 "correlation_id": correlation_id,
-            }
+            },
+        )
+
 
-        similarity_prompt = f"""You are an API design expert analyzing schema similarity clustering results.
+_SIMILARITY_PROMPT_TEMPLATE = """You are an API design expert in schema architecture, analyzing schema similarity clustering results.
 
 SCHEMA SIMILARITY CLUSTERS:
-Total Clusters Found: {len(clusters)}
+Total Clusters Found: {total_clusters}
 
 CLUSTER DATA:
-{_safe_json_truncate(clusters)}
+{clusters_json}
 
 Analyze these clusters and provide refactoring recommendations in JSON format:
 {{
@@ -510,102 +1068,124 @@ Analyze these clusters and provide refactoring recommendations in JSON format:
   ]
 }}"""
 
-        interpretation = await _call_llm_for_interpretation(
-            llm_service,
-            "You are an expert in API design and schema architecture. Respond only with valid JSON.",
-            similarity_prompt,
-            correlation_id,
-        )
+_SIMILARITY_REQUIRED_FIELDS = {
+    "executive_summary": str,
+    "refactoring_opportunities": list,
+}
+
+
+async def _interpret_similarity(
+    request: SchemaSimilarityRequest,
+    llm_service: LLMService,
+    correlation_id: str,
+) -> Dict[str, Any]:
+    """Interpret schema similarity clusters with the LLM."""
+    # One serializer pass over the whole list instead of one per cluster
+    clusters = request.model_dump(include={"clusters"})["clusters"]
 
+    if not clusters:
         return {
-            **interpretation,
-            "total_clusters": len(clusters),
+            "summary": "No duplicate or similar schemas detected. Your schema design is well-organized.",
+            "refactoring_opportunities": [],
             "correlation_id": correlation_id,
-            "generated_at": datetime.utcnow().isoformat(),
         }
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            f"Schema similarity interpretation failed: {str(e)}",
-            extra={"correlation_id": correlation_id},
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "SIMILARITY_INTERPRETATION_FAILED",
-                "message": f"Failed to interpret schema similarity: {str(e)}",
-                "correlation_id": correlation_id,
-            },
-        )
+    similarity_prompt = _SIMILARITY_PROMPT_TEMPLATE.format(
+        total_clusters=len(clusters),
+        clusters_json=_safe_json_truncate(_rank_similarity_clusters(clusters)),
+    )
 
+    interpretation = await _call_llm_for_interpretation(
+        llm_service,
+        similarity_prompt,
+        correlation_id,
+        _REPORT_MAX_TOKENS,
+        _SIMILARITY_REQUIRED_FIELDS,
+    )
 
-@router.post("/zombie-apis")
-async def interpret_zombie_apis(
-    request: ZombieApiRequest,
+    return {
+        **interpretation,
+        "total_clusters": len(clusters),
+        "correlation_id": correlation_id,
+        "generated_at": _utc_now_iso(),
+    }
+
+
+@router.post("/schema-similarity")
+async def interpret_schema_similarity(
+    request: SchemaSimilarityRequest,
     llm_service: LLMService = Depends(get_llm_service),
+    cache: "ICacheRepository" = Depends(get_cache_repository),
 ) -> Dict[str, Any]:
     """
-    AI-powered interpretation of Zombie API Detection results.
+    AI-powered interpretation of Schema Similarity Clustering results.
 
-    Analyzes unreachable, shadowed, and orphaned endpoints.
-    Zombie APIs are technical debt that:
-    - Confuse developers trying to understand the API
-    - Create security risks (unpatched, unmaintained code)
-    - Waste infrastructure resources
-    - Bloat documentation
+    Provides refactoring recommendations for duplicate/similar schemas.
+    Schema duplication is a common API design smell that increases:
+    - Maintenance burden (changes in multiple places)
+    - Inconsistency risk (schemas drift apart over time)
+    - Documentation confusion (users unsure which schema to use)
 
-    Types of zombies detected:
-    - Shadowed: Routes unreachable due to path conflicts
-    - Orphaned: Operations with no params/body/response defined
-    - Deprecated: Marked deprecated but still present
-    - Unreferenced: Never called by any client (if usage data available)
+    Refactoring strategies recommended:
+    - MERGE: Combine identical schemas into one
+    - BASE_SCHEMA_WITH_INHERITANCE: Use allOf for shared base
+    - COMPOSITION: Use $ref for shared components
 
     Request body:
-        shadowedEndpoints (List[Dict]): Shadowed endpoints from analyzer
-        orphanedOperations (List[Dict]): Orphaned operations from analyzer
+        clusters (List[Dict]): Schema clusters from similarity analyzer
+            - Each cluster contains: schemas, similarity_score, shared_fields
         spec_text (str, optional): OpenAPI specification for context
 
     Returns:
         Dict containing:
-            - executive_summary: API hygiene overview
-            - code_health_score: 0-100 maintenance score
-            - shadowed_endpoint_analysis: Details on route conflicts
-            - orphaned_operation_analysis: Details on incomplete operations
-            - cleanup_priorities: Prioritized cleanup tasks
-            - architectural_improvements: Preventive measures
+            - executive_summary: Schema organization overview
+            - code_health_score: 0-100 quality score
+            - refactoring_opportunities: Detailed refactoring recommendations
+            - quick_wins: Low-effort, high-impact improvements
+            - architectural_recommendations: Long-term improvements
     """
     correlation_id = set_correlation_id()
 
-    logger.info(
-        "Interpreting zombie API results",
-        extra={"correlation_id": correlation_id},
-    )
+    logger.info("Interpreting schema similarity results")
 
     try:
-        shadowed = request.shadowedEndpoints
-        orphaned = request.orphanedOperations
-
-        if not shadowed and not orphaned:
-            return {
-                "summary": "No zombie APIs detected. All endpoints appear reachable and properly defined.",
-                "cleanup_recommendations": [],
+        return await _cached_interpretation(
+            cache,
+            "similarity",
+            request,
+            llm_service,
+            correlation_id,
+            _interpret_similarity,
+            _SIMILARITY_REQUIRED_FIELDS,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(
+            f"Schema similarity interpretation failed: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "SIMILARITY_INTERPRETATION_FAILED",
+                "message": f"Failed to interpret schema similarity: {str(e)}",
                 "correlation_id": correlation_id,
-            }
+            },
+        )
+
 
-        zombie_prompt = f"""You are an API maintenance expert analyzing zombie API detection results.
+_ZOMBIE_PROMPT_TEMPLATE = """You are an API design and maintenance expert analyzing zombie API detection results.
 
 ZOMBIE API FINDINGS:
-Shadowed Endpoints: {len(shadowed)}
-Orphaned Operations: {len(orphaned)}
+Shadowed Endpoints: {shadowed_count}
+Orphaned Operations: {orphaned_count}
 
 SHADOWED ENDPOINTS (unreachable due to routing conflicts):
-{_safe_json_truncate(shadowed, 2000)}
+{shadowed_json}
 
 ORPHANED OPERATIONS (no params/body/response):
-{_safe_json_truncate(orphaned, 1000)}
+{orphaned_json}
 
 Analyze these zombie APIs and provide cleanup recommendations in JSON format:
 {{
@@ -643,120 +1223,142 @@ Analyze these zombie APIs and provide cleanup recommendations in JSON format:
   ]
 }}"""
 
-        interpretation = await _call_llm_for_interpretation(
-            llm_service,
-            "You are an expert in API design and maintenance. Respond only with valid JSON.",
-            zombie_prompt,
-            correlation_id,
-        )
+_ZOMBIE_REQUIRED_FIELDS = {
+    "executive_summary": str,
+    "shadowed_endpoint_analysis": list,
+    "orphaned_operation_analysis": list,
+    "cleanup_priorities": list,
+}
+
 
+async def _interpret_zombies(
+    request: ZombieApiRequest,
+    llm_service: LLMService,
+    correlation_id: str,
+) -> Dict[str, Any]:
+    """Interpret zombie API findings with the LLM."""
+    shadowed = request.shadowedEndpoints
+    orphaned = request.orphanedOperations
+
+    if not shadowed and not orphaned:
         return {
-            **interpretation,
-            "total_shadowed": len(shadowed),
-            "total_orphaned": len(orphaned),
+            "summary": "No zombie APIs detected. All endpoints appear reachable and properly defined.",
+            "cleanup_recommendations": [],
             "correlation_id": correlation_id,
-            "generated_at": datetime.utcnow().isoformat(),
         }
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            f"Zombie API interpretation failed: {str(e)}",
-            extra={"correlation_id": correlation_id},
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "ZOMBIE_INTERPRETATION_FAILED",
-                "message": f"Failed to interpret zombie API detection: {str(e)}",
-                "correlation_id": correlation_id,
-            },
-        )
+    zombie_prompt = _ZOMBIE_PROMPT_TEMPLATE.format(
+        shadowed_count=len(shadowed),
+        orphaned_count=len(orphaned),
+        shadowed_json=_safe_json_truncate(shadowed, 2000),
+        orphaned_json=_safe_json_truncate(orphaned, 1000),
+    )
 
+    interpretation = await _call_llm_for_interpretation(
+        llm_service,
+        zombie_prompt,
+        correlation_id,
+        _REPORT_MAX_TOKENS,
+        _ZOMBIE_REQUIRED_FIELDS,
+    )
 
-@router.post("/comprehensive-architecture")
-async def comprehensive_architecture_analysis(
-    request: ComprehensiveAnalysisRequest,
+    return {
+        **interpretation,
+        "total_shadowed": len(shadowed),
+        "total_orphaned": len(orphaned),
+        "correlation_id": correlation_id,
+        "generated_at": _utc_now_iso(),
+    }
+
+
+@router.post("/zombie-apis")
+async def interpret_zombie_apis(
+    request: ZombieApiRequest,
     llm_service: LLMService = Depends(get_llm_service),
+    cache: "ICacheRepository" = Depends(get_cache_repository),
 ) -> Dict[str, Any]:
     """
-    Comprehensive architectural analysis combining all 4 advanced analyzers.
-
-    This endpoint provides a holistic view of API health by synthesizing:
-    - Security (Taint Analysis + Authorization Matrix)
-    - Code Quality (Schema Similarity + Zombie APIs)
-    - Overall API health score with breakdown
+    AI-powered interpretation of Zombie API Detection results.
 
-    Use this for executive reporting and architectural reviews.
-    The analysis provides a single "API Health Score" that combines
-    all dimensions weighted by their impact on production readiness.
+    Analyzes unreachable, shadowed, and orphaned endpoints.
+    Zombie APIs are technical debt that:
+    - Confuse developers trying to understand the API
+    - Create security risks (unpatched, unmaintained code)
+    - Waste infrastructure resources
+    - Bloat documentation
 
-    Scoring methodology:
-    - Security Score (40% weight): Data exposure + access control
-    - Access Control Score (20% weight): Authorization configuration
-    - Code Quality Score (20% weight): Schema organization
-    - Maintenance Score (20% weight): Zombie API burden
+    Types of zombies detected:
+    - Shadowed: Routes unreachable due to path conflicts
+    - Orphaned: Operations with no params/body/response defined
+    - Deprecated: Marked deprecated but still present
+    - Unreferenced: Never called by any client (if usage data available)
 
     Request body:
-        taint_analysis (Dict): Results from taint analyzer
-        authz_matrix (Dict): Results from authz matrix analyzer
-        schema_similarity (Dict): Results from similarity analyzer
-        zombie_apis (Dict): Results from zombie API detector
-        spec_text (str, optional): OpenAPI specification
+        shadowedEndpoints (List[Dict]): Shadowed endpoints from analyzer
+        orphanedOperations (List[Dict]): Orphaned operations from analyzer
+        spec_text (str, optional): OpenAPI specification for context
 
     Returns:
         Dict containing:
-            - overall_health_score: 0-100 composite score
-            - health_breakdown: Scores by dimension
-            - executive_summary: Business-focused summary
-            - critical_issues: Issues requiring immediate attention
-            - 30_day_roadmap: Prioritized improvement plan
-            - risk_assessment: Overall risk profile
+            - executive_summary: API hygiene overview
+            - code_health_score: 0-100 maintenance score
+            - shadowed_endpoint_analysis: Details on route conflicts
+            - orphaned_operation_analysis: Details on incomplete operations
+            - cleanup_priorities: Prioritized cleanup tasks
+            - architectural_improvements: Preventive measures
     """
     correlation_id = set_correlation_id()
 
-    logger.info(
-        "Performing comprehensive architecture analysis",
-        extra={"correlation_id": correlation_id},
-    )
+    logger.info("Interpreting zombie API results")
 
     try:
-        taint = request.taint_analysis or {}
-        authz = request.authz_matrix or {}
-        similarity = request.schema_similarity or {}
-        zombie = request.zombie_apis or {}
+        return await _cached_interpretation(
+            cache,
+            "zombie",
+            request,
+            llm_service,
+            correlation_id,
+            _interpret_zombies,
+            _ZOMBIE_REQUIRED_FIELDS,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(
+            f"Zombie API interpretation failed: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "ZOMBIE_INTERPRETATION_FAILED",
+                "message": f"Failed to interpret zombie API detection: {str(e)}",
+                "correlation_id": correlation_id,
+            },
+        )
 
-        # Calculate input statistics for the prompt
-        taint_vulns = len(taint.get("vulnerabilities", []))
-        authz_endpoints = len(authz.get("matrix", {}))
-        authz_scopes = len(authz.get("scopes", []))
-        similarity_clusters = len(similarity.get("clusters", []))
-        zombie_shadowed = len(zombie.get("shadowedEndpoints", []))
-        zombie_orphaned = len(zombie.get("orphanedOperations", []))
 
-        comprehensive_prompt = f"""You are a senior API architect performing a comprehensive analysis.
+_COMPREHENSIVE_PROMPT_TEMPLATE = """You are a senior API architect performing a comprehensive, executive-level analysis.
 
 ANALYSIS RESULTS:
 
 1. TAINT ANALYSIS (Data Security):
-Vulnerabilities: {taint_vulns}
-{_safe_json_truncate(taint, 1200)}
+Vulnerabilities: {taint_vulnerabilities}
+{taint_json}
 
 2. AUTHORIZATION MATRIX (Access Control):
 Endpoints: {authz_endpoints}
 Scopes: {authz_scopes}
-{_safe_json_truncate(authz, 1200)}
+{authz_json}
 
 3. SCHEMA SIMILARITY (Code Quality):
 Duplicate Clusters: {similarity_clusters}
-{_safe_json_truncate(similarity, 1200)}
+{similarity_json}
 
 4. ZOMBIE API DETECTION (Maintenance):
 Shadowed: {zombie_shadowed}
 Orphaned: {zombie_orphaned}
-{_safe_json_truncate(zombie, 1200)}
+{zombie_json}
 
 Provide a comprehensive executive report in JSON format:
 {{
@@ -796,33 +1398,319 @@ Provide a comprehensive executive report in JSON format:
   }}
 }}"""
 
-        interpretation = await _call_llm_for_interpretation(
+_COMPREHENSIVE_REQUIRED_FIELDS = {
+    "overall_health_score": (int, float),
+    "executive_summary": str,
+    "risk_assessment": dict,
+    "critical_issues": list,
+}
+
+
+def _count(data: Dict[str, Any], key: str) -> int:
+    """Size of an analyzer result field, treating missing or null as empty."""
+    value = data.get(key)
+    return len(value) if value else 0
+
+
+async def _interpret_comprehensive(
+    request: ComprehensiveAnalysisRequest,
+    llm_service: LLMService,
+    correlation_id: str,
+) -> Dict[str, Any]:
+    """Synthesize raw analyzer output into an architecture report with the LLM."""
+    taint = request.taint_analysis or {}
+    authz = request.authz_matrix or {}
+    similarity = request.schema_similarity or {}
+    zombie = request.zombie_apis or {}
+
+    # Input statistics, computed once for both the prompt and the response
+    analysis_inputs = {
+        "taint_vulnerabilities": _count(taint, "vulnerabilities"),
+        "authz_endpoints": _count(authz, "matrix"),
+        "authz_scopes": _count(authz, "scopes"),
+        "similarity_clusters": _count(similarity, "clusters"),
+        "zombie_shadowed": _count(zombie, "shadowedEndpoints"),
+        "zombie_orphaned": _count(zombie, "orphanedOperations"),
+    }
+
+    comprehensive_prompt = _COMPREHENSIVE_PROMPT_TEMPLATE.format(
+        **analysis_inputs,
+        taint_json=_safe_json_truncate(taint, 1200),
+        authz_json=_safe_json_truncate(authz, 1200),
+        similarity_json=_safe_json_truncate(similarity, 1200),
+        zombie_json=_safe_json_truncate(zombie, 1200),
+    )
+
+    interpretation = await _call_llm_for_interpretation(
+        llm_service,
+        comprehensive_prompt,
+        correlation_id,
+        _COMPREHENSIVE_MAX_TOKENS,
+        _COMPREHENSIVE_REQUIRED_FIELDS,
+    )
+
+    return {
+        **interpretation,
+        "analysis_inputs": analysis_inputs,
+        "correlation_id": correlation_id,
+        "generated_at": _utc_now_iso(),
+    }
+
+
+@router.post("/comprehensive-architecture")
+async def comprehensive_architecture_analysis(
+    request: ComprehensiveAnalysisRequest,
+    llm_service: LLMService = Depends(get_llm_service),
+    cache: "ICacheRepository" = Depends(get_cache_repository),
+) -> Dict[str, Any]:
+    """
+    Comprehensive architectural analysis combining all 4 advanced analyzers.
+
+    This endpoint provides a holistic view of API health by synthesizing:
+    - Security (Taint Analysis + Authorization Matrix)
+    - Code Quality (Schema Similarity + Zombie APIs)
+    - Overall API health score with breakdown
+
+    Use this for executive reporting and architectural reviews.
+    The analysis provides a single "API Health Score" that combines
+    all dimensions weighted by their impact on production readiness.
+
+    Scoring methodology:
+    - Security Score (40% weight): Data exposure + access control
+    - Access Control Score (20% weight): Authorization configuration
+    - Code Quality Score (20% weight): Schema organization
+    - Maintenance Score (20% weight): Zombie API burden
+
+    Request body:
+        taint_analysis (Dict): Results from taint analyzer
+        authz_matrix (Dict): Results from authz matrix analyzer
+        schema_similarity (Dict): Results from similarity analyzer
+        zombie_apis (Dict): Results from zombie API detector
+        spec_text (str, optional): OpenAPI specification
+
+    Returns:
+        Dict containing:
+            - overall_health_score: 0-100 composite score
+            - health_breakdown: Scores by dimension
+            - executive_summary: Business-focused summary
+            - critical_issues: Issues requiring immediate attention
+            - 30_day_roadmap: Prioritized improvement plan
+            - risk_assessment: Overall risk profile
+    """
+    correlation_id = set_correlation_id()
+
+    logger.info("Performing comprehensive architecture analysis")
+
+    try:
+        return await _cached_interpretation(
+            cache,
+            "comprehensive",
+            request,
             llm_service,
-            "You are a senior API architect providing executive-level analysis. Respond only with valid JSON.",
-            comprehensive_prompt,
             correlation_id,
+            _interpret_comprehensive,
+            _COMPREHENSIVE_REQUIRED_FIELDS,
         )
-
-        return {
-            **interpretation,
-            "analysis_inputs": {
-                "taint_vulnerabilities": taint_vulns,
-                "authz_endpoints": authz_endpoints,
-                "authz_scopes": authz_scopes,
-                "similarity_clusters": similarity_clusters,
-                "zombie_shadowed": zombie_shadowed,
-                "zombie_orphaned": zombie_orphaned,
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(
+            f"Comprehensive architecture analysis failed: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "COMPREHENSIVE_ANALYSIS_FAILED",
+                "message": f"Failed to perform comprehensive analysis: {str(e)}",
+                "correlation_id": correlation_id,
             },
-            "correlation_id": correlation_id,
-            "generated_at": datetime.utcnow().isoformat(),
-        }
+        )
+
+
+# Interpretation fields forwarded to the synthesis prompt; the detailed
+# per-endpoint lists stay in the sub-results returned to the caller
+_SUMMARY_KEYS = (
+    "executive_summary",
+    "summary",
+    "risk_level",
+    "code_health_score",
+    "business_impact",
+    "maintenance_burden",
+    "potential_savings",
+    "total_vulnerabilities",
+    "critical_count",
+    "warning_count",
+    "total_endpoints",
+    "total_scopes",
+    "total_clusters",
+    "total_shadowed",
+    "total_orphaned",
+)
+
+
+def _summarize_interpretation(interpretation: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a sub-interpretation to the fields the synthesis prompt needs."""
+    return {key: interpretation[key] for key in _SUMMARY_KEYS if key in interpretation}
+
+
+async def _no_interpretation() -> Dict[str, Any]:
+    """Placeholder for analyzers the caller did not supply."""
+    return {}
+
+
+async def _interpret_full(
+    request: FullArchitectureAnalysisRequest,
+    llm_service: LLMService,
+    correlation_id: str,
+    cache: "ICacheRepository",
+) -> Dict[str, Any]:
+    """Interpret each analyzer concurrently, then synthesize their summaries."""
+    taint_i, authz_i, similarity_i, zombie_i = await asyncio.gather(
+        (
+            _cached_interpretation(
+                cache,
+                "taint",
+                request.taint_analysis,
+                llm_service,
+                correlation_id,
+                _interpret_taint,
+                _TAINT_REQUIRED_FIELDS,
+            )
+            if request.taint_analysis
+            else _no_interpretation()
+        ),
+        (
+            _cached_interpretation(
+                cache,
+                "authz",
+                request.authz_matrix,
+                llm_service,
+                correlation_id,
+                _interpret_authz,
+                _AUTHZ_REQUIRED_FIELDS,
+            )
+            if request.authz_matrix
+            else _no_interpretation()
+        ),
+        (
+            _cached_interpretation(
+                cache,
+                "similarity",
+                request.schema_similarity,
+                llm_service,
+                correlation_id,
+                _interpret_similarity,
+                _SIMILARITY_REQUIRED_FIELDS,
+            )
+            if request.schema_similarity
+            else _no_interpretation()
+        ),
+        (
+            _cached_interpretation(
+                cache,
+                "zombie",
+                request.zombie_apis,
+                llm_service,
+                correlation_id,
+                _interpret_zombies,
+                _ZOMBIE_REQUIRED_FIELDS,
+            )
+            if request.zombie_apis
+            else _no_interpretation()
+        ),
+    )
+
+    taint = request.taint_analysis
+    authz = request.authz_matrix
+    similarity = request.schema_similarity
+    zombie = request.zombie_apis
+
+    analysis_inputs = {
+        "taint_vulnerabilities": len(taint.vulnerabilities) if taint else 0,
+        "authz_endpoints": len(authz.matrix) if authz else 0,
+        "authz_scopes": len(authz.scopes) if authz else 0,
+        "similarity_clusters": len(similarity.clusters) if similarity else 0,
+        "zombie_shadowed": len(zombie.shadowedEndpoints) if zombie else 0,
+        "zombie_orphaned": len(zombie.orphanedOperations) if zombie else 0,
+    }
 
+    comprehensive_prompt = _COMPREHENSIVE_PROMPT_TEMPLATE.format(
+        **analysis_inputs,
+        taint_json=_safe_json_truncate(_summarize_interpretation(taint_i), 1200),
+        authz_json=_safe_json_truncate(_summarize_interpretation(authz_i), 1200),
+        similarity_json=_safe_json_truncate(
+            _summarize_interpretation(similarity_i), 1200
+        ),
+        zombie_json=_safe_json_truncate(_summarize_interpretation(zombie_i), 1200),
+    )
+
+    interpretation = await _call_llm_for_interpretation(
+        llm_service,
+        comprehensive_prompt,
+        correlation_id,
+        _COMPREHENSIVE_MAX_TOKENS,
+        _COMPREHENSIVE_REQUIRED_FIELDS,
+    )
+
+    return {
+        **interpretation,
+        "analysis_inputs": analysis_inputs,
+        "interpretations": {
+            "taint_analysis": taint_i,
+            "authz_matrix": authz_i,
+            "schema_similarity": similarity_i,
+            "zombie_apis": zombie_i,
+        },
+        "correlation_id": correlation_id,
+        "generated_at": _utc_now_iso(),
+    }
+
+
+@router.post("/comprehensive-architecture/full")
+async def comprehensive_architecture_full(
+    request: FullArchitectureAnalysisRequest,
+    llm_service: LLMService = Depends(get_llm_service),
+    cache: "ICacheRepository" = Depends(get_cache_repository),
+) -> Dict[str, Any]:
+    """
+    Comprehensive analysis that interprets each analyzer before synthesizing.
+
+    Replaces the chatty pattern of calling the four interpretation endpoints
+    and then /comprehensive-architecture one after another. The taint, authz,
+    similarity and zombie interpretations run concurrently; the synthesis
+    prompt then receives only their summaries instead of the raw analyzer
+    output, which keeps it a fraction of the size.
+
+    Request body:
+        taint_analysis (TaintAnalysisRequest, optional)
+        authz_matrix (AuthorizationMatrixRequest, optional)
+        schema_similarity (SchemaSimilarityRequest, optional)
+        zombie_apis (ZombieApiRequest, optional)
+
+    Returns:
+        The /comprehensive-architecture report plus the full sub-interpretations
+        under "interpretations".
+    """
+    correlation_id = set_correlation_id()
+
+    logger.info("Performing full comprehensive architecture analysis")
+
+    try:
+        return await _cached_interpretation(
+            cache,
+            "comprehensive-full",
+            request,
+            llm_service,
+            correlation_id,
+            partial(_interpret_full, cache=cache),
+            _COMPREHENSIVE_REQUIRED_FIELDS,
+        )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
-            f"Comprehensive architecture analysis failed: {str(e)}",
-            extra={"correlation_id": correlation_id},
+            f"Full comprehensive architecture analysis failed: {str(e)}",
             exc_info=True,
         )
         raise HTTPException(
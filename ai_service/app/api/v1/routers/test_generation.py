@@ -12,20 +12,43 @@ Uses LLM to create realistic, framework-agnostic test cases that can be
 exported to Jest, Postman, Newman, or Python requests.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
-import uuid
-from datetime import datetime
-from typing import Any, Dict
+import re
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
+import orjson
 import yaml
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from openapi_spec_validator import validate as validate_openapi_spec
 from prance import ResolvingParser
 
-from app.api.deps import get_llm_service, get_test_case_generator
+from app.api.deps import (
+    get_cache_repository,
+    get_llm_service,
+    get_test_case_generator,
+)
 from app.api.v1.endpoints import sanitize_openapi_spec
 from app.core.config import settings
 from app.core.logging import set_correlation_id
+from app.core.streaming import STREAM_HEADERS, ndjson_line
 from app.schemas.ai_schemas import (
     AIRequest,
     LLMParameters,
@@ -45,65 +68,24 @@ from app.services.cache_service import cache_service
 from app.services.llm_service import LLMService
 from app.services.test_case_generator import TestCaseGeneratorService
 
-logger = logging.getLogger(__name__)
-
-router = APIRouter(tags=["Test Generation"])
+if TYPE_CHECKING:
+    from app.domain.interfaces.cache_repository import ICacheRepository
 
+logger = logging.getLogger(__name__)
 
-def _map_test_type_to_priority(test_type: str) -> str:
-    """Map a test type string to its corresponding priority level."""
-    try:
-        test_type_enum = TestType(test_type)
-        return TEST_TYPE_TO_PRIORITY.get(test_type_enum, TestPriority.MEDIUM).value
-    except ValueError:
-        return TestPriority.MEDIUM.value
+router = APIRouter(tags=["Test Generation"], default_response_class=ORJSONResponse)
 
 
-@router.post("/ai/test-cases/generate")
-async def generate_test_cases_for_single_operation(
-    request: TestCaseGenerationRequest,
-    llm_service: LLMService = Depends(get_llm_service),
-) -> Dict[str, Any]:
-    """
-    Generate comprehensive test cases for a single API operation using AI.
+# Filled with str.format; literal braces in the JSON example are doubled
+_TEST_CASE_PROMPT_TEMPLATE = """Generate comprehensive test cases for this API operation:
 
-    Creates both positive and negative test scenarios with realistic data.
-    Uses LLM to generate diverse test cases based on the operation's
-    purpose and constraints.
-
-    Args:
-        request: Validated request containing spec_text, path, method, and test options.
-
-    Returns:
-        Dictionary with test cases, summary, and metadata.
-    """
-    correlation_id = set_correlation_id()
-
-    logger.info(
-        "Generating test cases for API operation",
-        extra={
-            "correlation_id": correlation_id,
-            "operation": request.operation_summary or "unknown",
-        },
-    )
-
-    try:
-        spec_text = request.spec_text
-        operation_path = request.path
-        operation_method = request.method
-        operation_summary = request.operation_summary
-        test_types = request.test_types
-
-        # Build comprehensive test generation prompt
-        test_generation_prompt = f"""Generate comprehensive test cases for this API operation:
-
-OPERATION: {operation_method.upper()} {operation_path}
-SUMMARY: {operation_summary}
+OPERATION: {method} {path}
+SUMMARY: {summary}
 
 SPECIFICATION EXCERPT:
-{spec_text[:1000] if spec_text else "No specification provided"}
+{spec_excerpt}
 
-TEST TYPES TO GENERATE: {', '.join(test_types)}
+TEST TYPES TO GENERATE: {test_types}
 
 Generate test cases as a JSON array with the following structure:
 {{
@@ -143,74 +125,432 @@ REQUIREMENTS:
 
 Return only the JSON structure, no explanations."""
 
-        # Create AI request for test generation
-        ai_request = AIRequest(
-            spec_text=spec_text,
-            prompt=test_generation_prompt,
-            operation_type=OperationType.GENERATE,
-            streaming=StreamingMode.DISABLED,
-            llm_parameters=LLMParameters(
-                temperature=0.4, max_tokens=3000  # Moderate creativity for test variety
+
+# Raw type string -> priority string, so the per-case lookup skips the enums
+_PRIORITY_BY_TEST_TYPE: Dict[str, str] = {
+    test_type.value: TEST_TYPE_TO_PRIORITY.get(test_type, TestPriority.MEDIUM).value
+    for test_type in TestType
+}
+
+# Operations the bulk endpoints generate tests for
+_TESTED_METHODS = ("get", "post", "put", "patch", "delete")
+
+# Endpoints whose AI scenarios the bulk endpoints request in a single prompt
+_AI_TEST_BATCH_SIZE = 5
+
+# Moderate creativity for test variety
+_TEST_CASE_TEMPERATURE = 0.4
+
+# LLM answers for an identical prompt are replayed instead of regenerated
+_LLM_CACHE_PREFIX = "test_generation:"
+_LLM_CACHE_TTL = timedelta(seconds=settings.cache_ttl)
+
+
+def _generate_llm_cache_key(spec_text: str, prompt: str) -> str:
+    """Generate cache key for an LLM answer from everything that shapes it."""
+    # The LLM service embeds the full spec in the request, not just the excerpt
+    key_data = (
+        f"{settings.default_model}:{_TEST_CASE_TEMPERATURE}:{prompt}\0{spec_text}"
+    )
+    digest = hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
+    return f"{_LLM_CACHE_PREFIX}{digest}"
+
+
+def _map_test_type_to_priority(test_type: str) -> str:
+    """Map a test type string to its corresponding priority level."""
+    try:
+        return _PRIORITY_BY_TEST_TYPE.get(test_type, TestPriority.MEDIUM.value)
+    except TypeError:
+        # LLM output can put an unhashable value in "type"
+        return TestPriority.MEDIUM.value
+
+
+_TRAILING_COMMA = re.compile(r",\s*([\]}])")
+# A JSON null value; a bare "null" substring also matches "nullable"
+_JSON_NULL_VALUE = re.compile(r"[:\[,]\s*null\b")
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _salvage_test_cases(llm_text: str) -> Dict[str, Any]:
+    """
+    Recover test cases from LLM output that is not valid JSON as a whole.
+
+    The outermost object is cut out of any surrounding prose or code fence
+    with trailing commas dropped; if the answer was truncated mid-array, the
+    complete test case objects before the cut are kept.
+
+    Raises:
+        ValueError: If no test cases can be recovered.
+    """
+    start = llm_text.find("{")
+    end = llm_text.rfind("}") + 1
+    if 0 <= start < end:
+        try:
+            salvaged = orjson.loads(_TRAILING_COMMA.sub(r"\1", llm_text[start:end]))
+            if isinstance(salvaged, dict) and "test_cases" in salvaged:
+                return salvaged
+        except orjson.JSONDecodeError:
+            pass
+
+    # Decode the array element by element so a cut-off tail costs only the
+    # last, incomplete test case
+    key_at = llm_text.find('"test_cases"')
+    array_at = llm_text.find("[", key_at) if key_at >= 0 else -1
+    if array_at < 0:
+        raise ValueError("No test cases found in LLM response")
+
+    test_cases = []
+    position = array_at + 1
+    while True:
+        while position < len(llm_text) and llm_text[position] in ", \t\r\n":
+            position += 1
+        try:
+            test_case, position = _JSON_DECODER.raw_decode(llm_text, position)
+        except ValueError:
+            break
+        test_cases.append(test_case)
+
+    if not test_cases:
+        raise ValueError("No complete test cases in LLM response")
+    return {"test_cases": test_cases}
+
+
+def _parse_spec_text(spec_text: str) -> Dict[str, Any]:
+    """
+    Parse and, when needed, resolve an OpenAPI specification.
+
+    The test generators read schemas inline, so prance is only needed when
+    the spec actually contains a $ref; a ref-free spec is validated with
+    openapi-spec-validator directly and used as parsed. Pure CPU work, run
+    off the event loop.
+    """
+    # First, parse the spec text to dict and sanitize it
+    try:
+        spec_dict = orjson.loads(spec_text)
+        is_json = True
+    except orjson.JSONDecodeError:
+        spec_dict = yaml.safe_load(spec_text)
+        is_json = False
+
+    if is_json and not _JSON_NULL_VALUE.search(spec_text):
+        # JSON without a single null has no None schema to replace and
+        # already has string keys, so it is used exactly as sent
+        sanitized_spec_text = spec_text
+        spec = spec_dict
+    else:
+        # Sanitize the spec to replace None schemas with {}
+        sanitized_spec = sanitize_openapi_spec(spec_dict)
+
+        # Convert back to JSON string for ResolvingParser (YAML specs
+        # can carry integer keys such as unquoted status codes)
+        sanitized_spec_text = orjson.dumps(
+            sanitized_spec, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+        spec = None
+
+    if "$ref" in spec_text:
+        # Now parse with ResolvingParser
+        parser = ResolvingParser(
+            spec_string=sanitized_spec_text, backend="openapi-spec-validator"
+        )
+        spec = parser.specification
+    else:
+        # Nothing to resolve; reload sanitized text so keys match what
+        # prance would have produced
+        if spec is None:
+            spec = orjson.loads(sanitized_spec_text)
+        # Same validation prance's openapi-spec-validator backend runs
+        validate_openapi_spec(spec)
+    return spec
+
+
+async def _get_or_parse_spec(
+    spec_text: str, spec_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Return the resolved specification, parsing it only on a cache miss.
+
+    Shared by every endpoint so a spec parsed for one of them is reused by
+    the others. Parsing runs in the threadpool so a large spec does not stall
+    other requests on the event loop. Callers that already hashed the spec
+    pass its ``spec_key`` so it is not digested again.
+
+    Raises:
+        HTTPException: 400 if the specification cannot be parsed.
+    """
+    if spec_key is None:
+        spec_key = cache_service.spec_key(spec_text)
+    spec = cache_service.get_parsed_spec(spec_key)
+    if spec:
+        return spec
+
+    try:
+        spec = await run_in_threadpool(_parse_spec_text, spec_text)
+    except Exception as e:
+        logger.error("Invalid OpenAPI specification: %s", e)
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_SPEC",
+                "message": f"Failed to parse OpenAPI specification: {str(e)}",
+            },
+        )
+
+    cache_service.cache_parsed_spec(spec_key, spec)
+    return spec
+
+
+def _collect_endpoints(
+    spec: Dict[str, Any], max_endpoints: int
+) -> List[Tuple[str, str]]:
+    """List the (path, method) pairs to generate tests for, capped at max_endpoints."""
+    all_endpoints = (
+        (path, method)
+        for path, path_item in (spec.get("paths") or {}).items()
+        for method in _TESTED_METHODS
+        if method in path_item
+    )
+    # One past the limit tells us whether anything was cut off without
+    # walking the rest of a large spec
+    endpoints = list(islice(all_endpoints, max_endpoints + 1))
+    if len(endpoints) > max_endpoints:
+        logger.warning("Reached max_endpoints limit (%s)", max_endpoints)
+        endpoints.pop()
+    return endpoints
+
+
+def _batch_runner(
+    test_case_generator: TestCaseGeneratorService,
+    spec: Dict[str, Any],
+    endpoints: List[Tuple[str, str]],
+    include_ai_tests: bool,
+) -> Tuple[List[List[Tuple[str, str]]], Callable[..., Awaitable[List[Any]]]]:
+    """
+    Group endpoints and build the coroutine that generates one group.
+
+    Each group's AI scenarios come from one LLM request, and groups share a
+    semaphore sized by max_concurrent_requests so a large spec stays within
+    the LLM client's connection pool.
+    """
+    semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
+    batches = [
+        endpoints[start : start + _AI_TEST_BATCH_SIZE]
+        for start in range(0, len(endpoints), _AI_TEST_BATCH_SIZE)
+    ]
+
+    async def generate_batch(batch: List[Tuple[str, str]]) -> List[Any]:
+        async with semaphore:
+            return await test_case_generator.generate_test_cases_batch(
+                spec=spec,
+                endpoints=batch,
+                include_ai_tests=include_ai_tests,
+            )
+
+    return batches, generate_batch
+
+
+def _endpoint_entries(
+    batch: List[Tuple[str, str]], batch_result: Any
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Pair a group's endpoints with their tests, or an error entry on failure."""
+    if isinstance(batch_result, Exception):
+        batch_result = [batch_result] * len(batch)
+
+    entries = []
+    for (path, method), result in zip(batch, batch_result):
+        endpoint_key = f"{method.upper()} {path}"
+        if isinstance(result, Exception):
+            logger.error("Failed to generate tests for %s: %s", endpoint_key, result)
+            result = {"error": str(result), "endpoint": endpoint_key}
+        entries.append((endpoint_key, result))
+    return entries
+
+
+async def _generate_tests_for_endpoints(
+    test_case_generator: TestCaseGeneratorService,
+    spec: Dict[str, Any],
+    endpoints: List[Tuple[str, str]],
+    include_ai_tests: bool,
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Generate tests for several endpoints concurrently.
+
+    A failing endpoint is reported in place rather than failing the whole
+    suite.
+
+    Returns:
+        Tests keyed by "METHOD /path" and the total test count.
+    """
+    batches, generate_batch = _batch_runner(
+        test_case_generator, spec, endpoints, include_ai_tests
+    )
+    batch_results = await asyncio.gather(
+        *(generate_batch(batch) for batch in batches),
+        return_exceptions=True,
+    )
+
+    all_tests = {}
+    total_test_count = 0
+    for batch, batch_result in zip(batches, batch_results):
+        for endpoint_key, result in _endpoint_entries(batch, batch_result):
+            all_tests[endpoint_key] = result
+            total_test_count += result.get("total_tests", 0)
+
+    return all_tests, total_test_count
+
+
+async def _stream_tests_for_endpoints(
+    test_case_generator: TestCaseGeneratorService,
+    spec: Dict[str, Any],
+    endpoints: List[Tuple[str, str]],
+    include_ai_tests: bool,
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield (endpoint, tests) pairs as soon as each group finishes.
+
+    Same concurrency and error handling as _generate_tests_for_endpoints,
+    but in completion order and without holding the whole suite in memory.
+    """
+    batches, generate_batch = _batch_runner(
+        test_case_generator, spec, endpoints, include_ai_tests
+    )
+
+    async def run(batch: List[Tuple[str, str]]) -> List[Tuple[str, Dict[str, Any]]]:
+        try:
+            return _endpoint_entries(batch, await generate_batch(batch))
+        except Exception as e:
+            return _endpoint_entries(batch, e)
+
+    tasks = [asyncio.ensure_future(run(batch)) for batch in batches]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            for entry in await next_done:
+                yield entry
+    finally:
+        # Client went away mid-stream: stop generating for nobody
+        for task in tasks:
+            task.cancel()
+
+
+@router.post("/ai/test-cases/generate", response_model=None)
+async def generate_test_cases_for_single_operation(
+    request: TestCaseGenerationRequest,
+    llm_service: LLMService = Depends(get_llm_service),
+    cache: "ICacheRepository" = Depends(get_cache_repository),
+) -> ORJSONResponse:
+    """
+    Generate comprehensive test cases for a single API operation using AI.
+
+    Creates both positive and negative test scenarios with realistic data.
+    Uses LLM to generate diverse test cases based on the operation's
+    purpose and constraints.
+
+    Args:
+        request: Validated request containing spec_text, path, method, and test options.
+
+    Returns:
+        Dictionary with test cases, summary, and metadata.
+    """
+    correlation_id = set_correlation_id()
+
+    logger.info(
+        "Generating test cases for API operation",
+        extra={
+            "correlation_id": correlation_id,
+            "operation": request.operation_summary or "unknown",
+        },
+    )
+
+    try:
+        spec_text = request.spec_text
+        operation_path = request.path
+        operation_method = request.method
+        operation_summary = request.operation_summary
+        test_types = request.test_types
+        operation = f"{operation_method.upper()} {operation_path}"
+
+        # Build comprehensive test generation prompt
+        test_generation_prompt = _TEST_CASE_PROMPT_TEMPLATE.format(
+            method=operation_method.upper(),
+            path=operation_path,
+            summary=operation_summary,
+            spec_excerpt=(
+                spec_text[:1000] if spec_text else "No specification provided"
             ),
-            validate_output=False,
-            tags=["test_generation", "quality_assurance"],
+            test_types=", ".join(test_types),
         )
 
-        # Get test cases from LLM
-        result = await llm_service.process_ai_request(ai_request)
+        cache_key = _generate_llm_cache_key(spec_text, test_generation_prompt)
+        llm_text = await cache.get(cache_key)
+        cached = llm_text is not None
+
+        if not cached:
+            # Create AI request for test generation
+            ai_request = AIRequest(
+                spec_text=spec_text,
+                prompt=test_generation_prompt,
+                operation_type=OperationType.GENERATE,
+                streaming=StreamingMode.DISABLED,
+                llm_parameters=LLMParameters(
+                    temperature=_TEST_CASE_TEMPERATURE, max_tokens=3000
+                ),
+                validate_output=False,
+                tags=["test_generation", "quality_assurance"],
+            )
+
+            # Get test cases from LLM
+            result = await llm_service.process_ai_request(ai_request)
+            llm_text = result.updated_spec_text
+        else:
+            logger.info("Returning cached test cases for %s", operation)
+
+        # One timestamp for every test case and the summary
+        generated_at = datetime.now(timezone.utc).isoformat()
 
         # Try to parse the JSON response
+        salvaged = False
         try:
-            test_cases_data = json.loads(result.updated_spec_text)
+            try:
+                test_cases_data = orjson.loads(llm_text)
+            except orjson.JSONDecodeError:
+                test_cases_data = _salvage_test_cases(llm_text)
+                salvaged = True
+                logger.info(
+                    "Salvaged %d test cases from malformed LLM JSON",
+                    len(test_cases_data["test_cases"]),
+                )
             if (
                 not isinstance(test_cases_data, dict)
                 or "test_cases" not in test_cases_data
             ):
                 raise ValueError("Invalid test cases format")
 
-            # Enhance test cases with additional metadata
-            enhanced_test_cases = []
-            for i, test_case in enumerate(test_cases_data["test_cases"]):
-                enhanced_test_case = {
-                    **test_case,
-                    "id": f"test_{i+1}",
-                    "operation": f"{operation_method.upper()} {operation_path}",
-                    "generated_at": datetime.utcnow().isoformat(),
-                    "priority": _map_test_type_to_priority(
-                        test_case.get("type", "positive")
-                    ),
-                    "estimated_execution_time": "< 1s",
-                }
-                enhanced_test_cases.append(enhanced_test_case)
+            # Enhance test cases with additional metadata, counting types
+            # in the same pass. The parsed answer belongs to this request, so
+            # each case is annotated in place instead of copied.
+            enhanced_test_cases = test_cases_data["test_cases"]
+            type_counts = Counter()
+            for i, test_case in enumerate(enhanced_test_cases):
+                test_type = test_case.get("type", "positive")
+                if isinstance(test_type, str):
+                    type_counts[test_type] += 1
+                test_case["id"] = f"test_{i+1}"
+                test_case["operation"] = operation
+                test_case["generated_at"] = generated_at
+                test_case["priority"] = _map_test_type_to_priority(test_type)
+                test_case["estimated_execution_time"] = "< 1s"
 
             response = {
                 "test_cases": enhanced_test_cases,
                 "summary": {
                     "total_tests": len(enhanced_test_cases),
-                    "positive_tests": len(
-                        [
-                            tc
-                            for tc in enhanced_test_cases
-                            if tc.get("type") == "positive"
-                        ]
-                    ),
-                    "negative_tests": len(
-                        [
-                            tc
-                            for tc in enhanced_test_cases
-                            if tc.get("type") == "negative"
-                        ]
-                    ),
-                    "edge_case_tests": len(
-                        [
-                            tc
-                            for tc in enhanced_test_cases
-                            if tc.get("type") == "edge_case"
-                        ]
-                    ),
-                    "operation": f"{operation_method.upper()} {operation_path}",
-                    "generated_at": datetime.utcnow().isoformat(),
+                    "positive_tests": type_counts["positive"],
+                    "negative_tests": type_counts["negative"],
+                    "edge_case_tests": type_counts["edge_case"],
+                    "operation": operation,
+                    "generated_at": generated_at,
                 },
+                "cached": cached,
                 "metadata": {
                     "correlation_id": correlation_id,
                     "generation_method": "ai_powered",
@@ -224,12 +564,17 @@ Return only the JSON structure, no explanations."""
                 },
             }
 
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
-            logger.warning(f"Failed to parse structured test cases: {str(e)}")
+            # Only answers that parsed cleanly are worth replaying; a salvaged
+            # one may be a truncated suite, so the next request retries the LLM
+            if not cached and not salvaged:
+                await cache.set(cache_key, llm_text, ttl=_LLM_CACHE_TTL)
+
+        except (orjson.JSONDecodeError, ValueError, KeyError) as e:
+            logger.warning("Failed to parse structured test cases: %s", e)
             # Fallback: create a simple test case from the text response
             fallback_test_case = {
                 "id": "test_1",
-                "name": f"Basic test for {operation_method.upper()} {operation_path}",
+                "name": f"Basic test for {operation}",
                 "type": "positive",
                 "description": "Generated test case",
                 "request": {
@@ -240,8 +585,8 @@ Return only the JSON structure, no explanations."""
                 },
                 "expected_response": {"status_code": 200, "body": {}},
                 "assertions": ["Response status should be successful"],
-                "operation": f"{operation_method.upper()} {operation_path}",
-                "generated_at": datetime.utcnow().isoformat(),
+                "operation": operation,
+                "generated_at": generated_at,
                 "priority": "medium",
                 "notes": "Fallback test case - original AI response was not parseable",
             }
@@ -253,25 +598,24 @@ Return only the JSON structure, no explanations."""
                     "positive_tests": 1,
                     "negative_tests": 0,
                     "edge_case_tests": 0,
-                    "operation": f"{operation_method.upper()} {operation_path}",
-                    "generated_at": datetime.utcnow().isoformat(),
+                    "operation": operation,
+                    "generated_at": generated_at,
                     "fallback_mode": True,
                 },
                 "metadata": {
                     "correlation_id": correlation_id,
                     "generation_method": "ai_powered_fallback",
-                    "original_response": result.updated_spec_text[:500],
+                    "original_response": llm_text[:500],
                 },
             }
 
         logger.info(
-            f"Generated {len(response['test_cases'])} test cases for "
-            f"{operation_method.upper()} {operation_path}"
+            "Generated %d test cases for %s", len(response["test_cases"]), operation
         )
-        return response
+        return ORJSONResponse(response)
 
     except Exception as e:
-        logger.error(f"Test case generation failed: {str(e)}")
+        logger.error("Test case generation failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -282,11 +626,11 @@ Return only the JSON structure, no explanations."""
         )
 
 
-@router.post("/ai/test-suite/generate")
+@router.post("/ai/test-suite/generate", response_model=None)
 async def generate_test_suite_for_entire_spec(
     request: TestSuiteGenerationRequest,
     test_case_generator: TestCaseGeneratorService = Depends(get_test_case_generator),
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Generate a complete test suite for an entire API specification.
 
@@ -317,82 +661,95 @@ async def generate_test_suite_for_entire_spec(
             raise ValueError("OpenAPI specification is required")
 
         # Parse the specification to extract operations
-        try:
-            parser = ResolvingParser(
-                spec_string=spec_text, backend="openapi-spec-validator"
-            )
-            spec = parser.specification
-        except Exception as e:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "INVALID_SPEC",
-                    "message": f"Failed to parse OpenAPI specification: {str(e)}",
-                },
-            )
+        spec = await _get_or_parse_spec(spec_text)
 
         # Generate tests for all endpoints
-        all_tests = {}
-        total_test_count = 0
-        endpoint_count = 0
         include_ai_tests = test_options.get("include_ai_tests", True)
         max_endpoints = test_options.get("max_endpoints", 50)
-
-        for path, path_item in spec.get("paths", {}).items():
-            for method in ["get", "post", "put", "patch", "delete"]:
-                if method in path_item:
-                    endpoint_count += 1
-
-                    if endpoint_count > max_endpoints:
-                        logger.warning(f"Reached max_endpoints limit ({max_endpoints})")
-                        break
-
-                    try:
-                        result = await test_case_generator.generate_test_cases(
-                            spec=spec,
-                            path=path,
-                            method=method,
-                            include_ai_tests=include_ai_tests,
-                        )
-
-                        endpoint_key = f"{method.upper()} {path}"
-                        all_tests[endpoint_key] = result
-                        total_test_count += result.get("total_tests", 0)
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to generate tests for {method.upper()} {path}: {e}"
-                        )
-                        all_tests[f"{method.upper()} {path}"] = {
-                            "error": str(e),
-                            "endpoint": f"{method.upper()} {path}",
-                        }
-
-            if endpoint_count > max_endpoints:
-                break
+        endpoints = _collect_endpoints(spec, max_endpoints)
+        endpoint_count = len(endpoints)
+        all_tests, total_test_count = await _generate_tests_for_endpoints(
+            test_case_generator, spec, endpoints, include_ai_tests
+        )
 
         logger.info(
-            f"Generated {total_test_count} tests across {endpoint_count} endpoints",
+            "Generated %d tests across %d endpoints",
+            total_test_count,
+            endpoint_count,
             extra={"correlation_id": correlation_id},
         )
 
-        return {
-            "test_suite": all_tests,
-            "summary": {
-                "total_endpoints": endpoint_count,
-                "total_tests": total_test_count,
-                "include_ai_tests": include_ai_tests,
-                "api_title": spec.get("info", {}).get("title", "Unknown API"),
-                "api_version": spec.get("info", {}).get("version", "1.0.0"),
+        info = spec.get("info") or {}
+        return ORJSONResponse(
+            {
+                "test_suite": all_tests,
+                "summary": {
+                    "total_endpoints": endpoint_count,
+                    "total_tests": total_test_count,
+                    "include_ai_tests": include_ai_tests,
+                    "api_title": info.get("title", "Unknown API"),
+                    "api_version": info.get("version", "1.0.0"),
+                },
+                "correlation_id": correlation_id,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Test suite generation failed: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "TEST_SUITE_GENERATION_FAILED",
+                "message": f"Failed to generate test suite: {str(e)}",
             },
+        )
+
+
+@router.post("/ai/test-suite/generate/stream", response_model=None)
+async def stream_test_suite_for_entire_spec(
+    request: TestSuiteGenerationRequest,
+    test_case_generator: TestCaseGeneratorService = Depends(get_test_case_generator),
+) -> StreamingResponse:
+    """
+    Stream a complete test suite as NDJSON, one line per endpoint.
+
+    Emits a "start" event listing the endpoints, an "endpoint" event as each
+    endpoint's tests are ready (in completion order), and a closing
+    "summary" event, so clients can render results before the whole suite
+    is done. Spec errors are reported before streaming starts, with the
+    same status codes as /ai/test-suite/generate.
+
+    Args:
+        request: Validated request containing spec_text and generation options.
+
+    Returns:
+        NDJSON stream of start, endpoint, and summary events.
+    """
+    correlation_id = set_correlation_id()
+
+    logger.info(
+        "Streaming complete test suite",
+        extra={
             "correlation_id": correlation_id,
-            "generated_at": datetime.utcnow().isoformat(),
-        }
+            "spec_size": len(request.spec_text),
+        },
+    )
 
+    try:
+        test_options = request.options.model_dump() if request.options else {}
+        spec = await _get_or_parse_spec(request.spec_text)
+
+        include_ai_tests = test_options.get("include_ai_tests", True)
+        max_endpoints = test_options.get("max_endpoints", 50)
+        endpoints = _collect_endpoints(spec, max_endpoints)
+        info = spec.get("info") or {}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Test suite generation failed: {str(e)}")
+        logger.error("Test suite streaming setup failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -401,12 +758,71 @@ async def generate_test_suite_for_entire_spec(
             },
         )
 
+    async def event_stream():
+        yield ndjson_line(
+            {
+                "type": "start",
+                "endpoints": [f"{method.upper()} {path}" for path, method in endpoints],
+                "api_title": info.get("title", "Unknown API"),
+                "api_version": info.get("version", "1.0.0"),
+                "correlation_id": correlation_id,
+            }
+        )
 
-@router.post("/tests/generate")
+        total_test_count = 0
+        try:
+            async for endpoint_key, result in _stream_tests_for_endpoints(
+                test_case_generator, spec, endpoints, include_ai_tests
+            ):
+                total_test_count += result.get("total_tests", 0)
+                yield ndjson_line(
+                    {"type": "endpoint", "endpoint": endpoint_key, "tests": result}
+                )
+        except Exception as e:
+            logger.error("Test suite streaming failed: %s", e)
+            yield ndjson_line(
+                {
+                    "type": "error",
+                    "error": "TEST_SUITE_GENERATION_FAILED",
+                    "message": f"Failed to generate test suite: {str(e)}",
+                    "correlation_id": correlation_id,
+                }
+            )
+            return
+
+        logger.info(
+            "Streamed %d tests across %d endpoints",
+            total_test_count,
+            len(endpoints),
+            extra={"correlation_id": correlation_id},
+        )
+        yield ndjson_line(
+            {
+                "type": "summary",
+                "summary": {
+                    "total_endpoints": len(endpoints),
+                    "total_tests": total_test_count,
+                    "include_ai_tests": include_ai_tests,
+                    "api_title": info.get("title", "Unknown API"),
+                    "api_version": info.get("version", "1.0.0"),
+                },
+                "correlation_id": correlation_id,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="application/x-ndjson",
+        headers=STREAM_HEADERS,
+    )
+
+
+@router.post("/tests/generate", response_model=None)
 async def generate_test_cases_with_caching(
     request: SingleEndpointTestRequest,
     test_case_generator: TestCaseGeneratorService = Depends(get_test_case_generator),
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Generate comprehensive test cases for an OpenAPI endpoint with caching.
 
@@ -419,8 +835,7 @@ async def generate_test_cases_with_caching(
     Returns:
         Generated test cases with metadata.
     """
-    correlation_id = str(uuid.uuid4())
-    set_correlation_id(correlation_id)
+    correlation_id = set_correlation_id()
 
     logger.info("Generating test cases", extra={"correlation_id": correlation_id})
 
@@ -429,72 +844,48 @@ async def generate_test_cases_with_caching(
         path = request.path
         method = request.method.upper()
         include_ai_tests = request.include_ai_tests
+        spec_key = cache_service.spec_key(spec_text)
 
         # Check cache first
         cached_tests = cache_service.get_test_cases(
-            spec_text, path, method, include_ai_tests
+            spec_key, path, method, include_ai_tests
         )
         if cached_tests:
-            logger.info(f"Returning cached test cases for {method} {path}")
-            return {
-                **cached_tests,
-                "cached": True,
-                "correlation_id": correlation_id,
-                "generated_at": datetime.utcnow().isoformat(),
-            }
+            logger.info("Returning cached test cases for %s %s", method, path)
+            return ORJSONResponse(
+                {
+                    **cached_tests,
+                    "cached": True,
+                    "correlation_id": correlation_id,
+                    "generated_at": datetime.now(timezone.utc).isoformat(),
+                }
+            )
 
         # Parse specification (with caching)
-        spec = cache_service.get_parsed_spec(spec_text)
-        if not spec:
-            try:
-                # First, parse the spec text to dict and sanitize it
-                try:
-                    spec_dict = json.loads(spec_text)
-                except json.JSONDecodeError:
-                    spec_dict = yaml.safe_load(spec_text)
-
-                # Sanitize the spec to replace None schemas with {}
-                sanitized_spec = sanitize_openapi_spec(spec_dict)
-
-                # Convert back to JSON string for ResolvingParser
-                sanitized_spec_text = json.dumps(sanitized_spec)
-
-                # Now parse with ResolvingParser
-                parser = ResolvingParser(
-                    spec_string=sanitized_spec_text, backend="openapi-spec-validator"
-                )
-                spec = parser.specification
-                cache_service.cache_parsed_spec(spec_text, spec)
-            except Exception as e:
-                logger.error(f"Invalid OpenAPI specification: {str(e)}")
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "error": "INVALID_SPEC",
-                        "message": f"Failed to parse OpenAPI specification: {str(e)}",
-                    },
-                )
+        spec = await _get_or_parse_spec(spec_text, spec_key)
+        paths = spec.get("paths") or {}
 
         # Validate path exists
-        if path not in spec.get("paths", {}):
+        if path not in paths:
             raise HTTPException(
                 status_code=404,
                 detail={
                     "error": "PATH_NOT_FOUND",
                     "message": f"Path '{path}' not found in specification",
-                    "available_paths": list(spec.get("paths", {}).keys()),
+                    "available_paths": list(paths.keys()),
                 },
             )
 
         # Validate method exists
         method_lower = method.lower()
-        if method_lower not in spec["paths"][path]:
+        path_item = paths[path]
+        if method_lower not in path_item:
             raise HTTPException(
                 status_code=404,
                 detail={
                     "error": "METHOD_NOT_FOUND",
                     "message": f"Method '{method}' not found for path '{path}'",
-                    "available_methods": list(spec["paths"][path].keys()),
+                    "available_methods": list(path_item.keys()),
                 },
             )
 
@@ -504,26 +895,30 @@ async def generate_test_cases_with_caching(
         )
 
         # Cache the results
-        cache_service.cache_test_cases(
-            spec_text, path, method_lower, include_ai_tests, result
-        )
+        # Same key as the lookup above, which uses the upper-cased method
+        cache_service.cache_test_cases(spec_key, path, method, include_ai_tests, result)
 
         logger.info(
-            f"Generated {result['total_tests']} test cases for {method} {path}",
+            "Generated %d test cases for %s %s",
+            result["total_tests"],
+            method,
+            path,
             extra={"correlation_id": correlation_id},
         )
 
-        return {
-            **result,
-            "cached": False,
-            "correlation_id": correlation_id,
-            "generated_at": datetime.utcnow().isoformat(),
-        }
+        return ORJSONResponse(
+            {
+                **result,
+                "cached": False,
+                "correlation_id": correlation_id,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Test case generation failed: {str(e)}", exc_info=True)
+        logger.error("Test case generation failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
@@ -534,11 +929,11 @@ async def generate_test_cases_with_caching(
         )
 
 
-@router.post("/tests/generate/all")
+@router.post("/tests/generate/all", response_model=None)
 async def generate_bulk_test_cases(
     request: BulkTestGenerationRequest,
     test_case_generator: TestCaseGeneratorService = Depends(get_test_case_generator),
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Generate test cases for all endpoints in an OpenAPI specification.
 
@@ -548,8 +943,7 @@ async def generate_bulk_test_cases(
     Returns:
         Test cases for all endpoints with summary.
     """
-    correlation_id = str(uuid.uuid4())
-    set_correlation_id(correlation_id)
+    correlation_id = set_correlation_id()
 
     logger.info(
         "Generating test cases for all endpoints",
@@ -561,79 +955,40 @@ async def generate_bulk_test_cases(
         include_ai_tests = request.include_ai_tests
         max_endpoints = request.max_endpoints
 
-        # Parse specification
-        try:
-            parser = ResolvingParser(
-                spec_string=spec_text, backend="openapi-spec-validator"
-            )
-            spec = parser.specification
-        except Exception as e:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "INVALID_SPEC",
-                    "message": f"Failed to parse OpenAPI specification: {str(e)}",
-                },
-            )
+        # Parse specification (with caching)
+        spec = await _get_or_parse_spec(spec_text)
 
         # Generate tests for all endpoints
-        all_tests = {}
-        total_test_count = 0
-        endpoint_count = 0
-
-        for path, path_item in spec.get("paths", {}).items():
-            for method in ["get", "post", "put", "patch", "delete"]:
-                if method in path_item:
-                    endpoint_count += 1
-
-                    if endpoint_count > max_endpoints:
-                        logger.warning(f"Reached max_endpoints limit ({max_endpoints})")
-                        break
-
-                    try:
-                        result = await test_case_generator.generate_test_cases(
-                            spec=spec,
-                            path=path,
-                            method=method,
-                            include_ai_tests=include_ai_tests,
-                        )
-
-                        endpoint_key = f"{method.upper()} {path}"
-                        all_tests[endpoint_key] = result
-                        total_test_count += result["total_tests"]
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to generate tests for {method.upper()} {path}: {e}"
-                        )
-                        all_tests[f"{method.upper()} {path}"] = {
-                            "error": str(e),
-                            "endpoint": f"{method.upper()} {path}",
-                        }
-
-            if endpoint_count > max_endpoints:
-                break
+        endpoints = _collect_endpoints(spec, max_endpoints)
+        endpoint_count = len(endpoints)
+        all_tests, total_test_count = await _generate_tests_for_endpoints(
+            test_case_generator, spec, endpoints, include_ai_tests
+        )
 
         logger.info(
-            f"Generated {total_test_count} tests across {endpoint_count} endpoints",
+            "Generated %d tests across %d endpoints",
+            total_test_count,
+            endpoint_count,
             extra={"correlation_id": correlation_id},
         )
 
-        return {
-            "endpoints": all_tests,
-            "summary": {
-                "total_endpoints": endpoint_count,
-                "total_tests": total_test_count,
-                "include_ai_tests": include_ai_tests,
-            },
-            "correlation_id": correlation_id,
-            "generated_at": datetime.utcnow().isoformat(),
-        }
+        return ORJSONResponse(
+            {
+                "endpoints": all_tests,
+                "summary": {
+                    "total_endpoints": endpoint_count,
+                    "total_tests": total_test_count,
+                    "include_ai_tests": include_ai_tests,
+                },
+                "correlation_id": correlation_id,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Bulk test generation failed: {str(e)}", exc_info=True)
+        logger.error("Bulk test generation failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
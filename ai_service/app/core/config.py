@@ -3,7 +3,6 @@ Core configuration management for SchemaSculpt AI Service.
 Provides centralized configuration with environment variable support.
 """
 
-from functools import lru_cache
 from typing import List, Optional
 
 from pydantic import Field
@@ -30,6 +29,9 @@ class Settings(BaseSettings):
     model_temperature: float = Field(default=0.1, env="MODEL_TEMPERATURE")
     max_tokens: int = Field(default=2048, env="MAX_TOKENS")
     request_timeout: int = Field(default=120, env="REQUEST_TIMEOUT")
+    hedge_requests: int = Field(
+        default=1, env="HEDGE_REQUESTS"
+    )  # concurrent identical calls for idempotent interpretations; 1 disables
 
     # Ollama Configuration
     ollama_base_url: str = Field(
@@ -59,6 +61,9 @@ class Settings(BaseSettings):
     explanation_cache_ttl_hours: int = Field(
         default=24, env="EXPLANATION_CACHE_TTL_HOURS"
     )  # 24 hours
+    explanation_context_tokens: int = Field(
+        default=200, env="EXPLANATION_CONTEXT_TOKENS"
+    )  # knowledge base budget per explanation prompt
     max_concurrent_requests: int = Field(default=10, env="MAX_CONCURRENT_REQUESTS")
 
     # Prompt Engineering
@@ -133,11 +138,10 @@ class Settings(BaseSettings):
         extra = "ignore"  # Allow extra environment variables
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    """Get cached application settings."""
-    return Settings()
+# Global settings instance
+settings = Settings()
 
 
-# Global settings instance
-settings = get_settings()
+def get_settings() -> Settings:
+    """Get the application settings instance."""
+    return settings
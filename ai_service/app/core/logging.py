@@ -33,9 +33,10 @@ class StructuredFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add correlation ID if available
-        if correlation_id.get():
-            log_entry["correlation_id"] = correlation_id.get()
+        # Add correlation ID if available (attached by CorrelationIdFilter)
+        cid = getattr(record, "correlation_id", None)
+        if cid:
+            log_entry["correlation_id"] = cid
 
         # Add extra fields
         if hasattr(record, "extra"):
@@ -48,6 +49,14 @@ class StructuredFormatter(logging.Formatter):
         return json.dumps(log_entry, default=str)
 
 
+class CorrelationIdFilter(logging.Filter):
+    """Attach the current request's correlation ID to every log record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id.get()
+        return True
+
+
 def setup_logging() -> None:
     """Configure application logging."""
 
@@ -69,6 +78,7 @@ def setup_logging() -> None:
         )
 
     console_handler.setFormatter(formatter)
+    console_handler.addFilter(CorrelationIdFilter())
     logger.addHandler(console_handler)
 
     # Set library log levels
@@ -11,6 +11,7 @@ Configuration (from settings):
 - jwt_secret: Secret for JWT token validation
 """
 
+import hmac
 import logging
 from typing import Callable, List, Optional
 
@@ -40,15 +41,17 @@ class RequestAuthenticator(BaseHTTPMiddleware):
         )
     """
 
-    DEFAULT_PATHS_WITHOUT_AUTHENTICATION = [
-        "/",
-        "/ai/health",
-        "/health",
-        "/metrics",
-        "/docs",
-        "/openapi.json",
-        "/redoc",
-    ]
+    DEFAULT_PATHS_WITHOUT_AUTHENTICATION = frozenset(
+        {
+            "/",
+            "/ai/health",
+            "/health",
+            "/metrics",
+            "/docs",
+            "/openapi.json",
+            "/redoc",
+        }
+    )
 
     def __init__(
         self,
@@ -66,11 +69,19 @@ class RequestAuthenticator(BaseHTTPMiddleware):
                                    (request proceeds even if auth fails).
         """
         super().__init__(app)
-        self.paths_without_authentication = (
-            paths_that_skip_authentication or self.DEFAULT_PATHS_WITHOUT_AUTHENTICATION
-        )
+        # Stored in normalized form so each request is a single set lookup;
+        # the root path ("") is always open.
+        self.paths_without_authentication = frozenset(
+            path.rstrip("/")
+            for path in (
+                paths_that_skip_authentication
+                or self.DEFAULT_PATHS_WITHOUT_AUTHENTICATION
+            )
+        ) | {""}
         self.require_authentication = require_authentication
         self.api_key = settings.api_key
+        self._api_key_configured = bool(self.api_key)
+        self._api_key_bytes = self.api_key.encode() if self.api_key else b""
 
         logger.info(
             f"Request authenticator initialized. "
@@ -109,10 +120,14 @@ class RequestAuthenticator(BaseHTTPMiddleware):
     def _path_does_not_require_authentication(self, request: Request) -> bool:
         """Check if the request path is excluded from authentication."""
         path = self._normalize_request_path(request)
-        return path in self.paths_without_authentication or path == ""
+        return path in self.paths_without_authentication
 
-    def _normalize_request_path(self, request: Request):
-        return request.url.path.rstrip("/")
+    def _normalize_request_path(self, request: Request) -> str:
+        path = request.url.path
+        # Most paths carry no trailing slash; only strip when there is one
+        if path.endswith("/"):
+            return path.rstrip("/")
+        return path
 
     async def _authenticate_request(self, request: Request) -> "AuthenticationResult":
         """
@@ -138,22 +153,22 @@ class RequestAuthenticator(BaseHTTPMiddleware):
 
     def _validate_api_key(self, request: Request) -> "AuthenticationResult":
         """Validate the X-API-Key header."""
-        provided_api_key = request.headers.get("X-API-Key")
-
-        if not provided_api_key:
+        if not self._api_key_configured:
+            # No API key configured on server
             return AuthenticationResult(
                 is_authenticated=False,
-                failure_reason="API key not provided",
+                failure_reason="API key authentication not configured",
             )
 
-        if not self.api_key:
-            # No API key configured on server
+        provided_api_key = request.headers.get("X-API-Key")
+
+        if not provided_api_key:
             return AuthenticationResult(
                 is_authenticated=False,
-                failure_reason="API key authentication not configured",
+                failure_reason="API key not provided",
             )
 
-        if provided_api_key == self.api_key:
+        if hmac.compare_digest(provided_api_key.encode(), self._api_key_bytes):
             logger.debug("Request authenticated via API key")
             return AuthenticationResult(
                 is_authenticated=True,
@@ -0,0 +1,216 @@
+"""
+Helpers for NDJSON streaming of LLM output.
+Shared by the routers that forward Ollama token streams to clients.
+"""
+
+import re
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+import orjson
+
+# What can change nesting inside a value: quotes and brackets outside a
+# string, quotes and escapes inside one
+_STRUCTURAL_CHARS = re.compile(r'["\[\]{}]')
+_STRING_CHARS = re.compile(r'["\\]')
+_SCALAR_END_CHARS = re.compile(r"[,}\]\s]")
+
+# Request headers for chat payloads that are sent pre-encoded with orjson
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Response headers for every streamed endpoint. "Content-Encoding: identity"
+# makes GZipMiddleware pass the body through unbuffered (see app.main).
+STREAM_HEADERS = {"Cache-Control": "no-cache", "Content-Encoding": "identity"}
+
+_FIND_KEY, _FIND_COLON, _FIND_VALUE, _READ_VALUE = range(4)
+
+# Returned for a value that closed but is not valid JSON
+_MALFORMED = object()
+
+
+class _FieldProgress:
+    """How far the scan for one field has got."""
+
+    __slots__ = (
+        "name",
+        "key",
+        "tail",
+        "phase",
+        "value_parts",
+        "scalar",
+        "depth",
+        "in_string",
+        "escape",
+    )
+
+    def __init__(self, name: str):
+        self.name = name
+        self.key = f'"{name}"'
+        self.tail = ""
+        self.phase = _FIND_KEY
+        self.value_parts: List[str] = []
+        self.scalar = False
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, chunk: str) -> Tuple[bool, Any]:
+        """Advance over a chunk; returns (finished, decoded value)."""
+        pos = 0
+        while pos < len(chunk):
+            if self.phase == _FIND_KEY:
+                # Keep the end of the previous chunk so a key split across
+                # chunks is still found
+                window = self.tail + chunk[pos:]
+                key_at = window.find(self.key)
+                if key_at < 0:
+                    self.tail = window[1 - len(self.key) :]
+                    return False, None
+                pos += key_at + len(self.key) - len(self.tail)
+                self.tail = ""
+                self.phase = _FIND_COLON
+            elif self.phase == _FIND_COLON:
+                char = chunk[pos]
+                pos += 1
+                if char == ":":
+                    self.phase = _FIND_VALUE
+                elif not char.isspace():
+                    # The name appeared as a string value, not as a key
+                    self.phase = _FIND_KEY
+            elif self.phase == _FIND_VALUE:
+                char = chunk[pos]
+                if char.isspace():
+                    pos += 1
+                    continue
+                self.scalar = char not in '"[{'
+                self.phase = _READ_VALUE
+            else:
+                return self._read_value(chunk, pos)
+        return False, None
+
+    def _read_value(self, chunk: str, pos: int) -> Tuple[bool, Any]:
+        end = self._value_end(chunk, pos)
+        if end is None:
+            self.value_parts.append(chunk[pos:])
+            return False, None
+        self.value_parts.append(chunk[pos:end])
+        try:
+            return True, orjson.loads("".join(self.value_parts))
+        except orjson.JSONDecodeError:
+            # A closed but malformed value will never decode
+            return True, _MALFORMED
+
+    def _value_end(self, chunk: str, pos: int):
+        """Index just past the end of the value in chunk, or None if still open."""
+        if self.scalar:
+            match = _SCALAR_END_CHARS.search(chunk, pos)
+            return match.start() if match else None
+
+        while pos < len(chunk):
+            if self.escape:
+                self.escape = False
+                pos += 1
+                continue
+            pattern = _STRING_CHARS if self.in_string else _STRUCTURAL_CHARS
+            match = pattern.search(chunk, pos)
+            if match is None:
+                return None
+            char = match.group()
+            pos = match.end()
+            if self.in_string:
+                if char == "\\":
+                    self.escape = True
+                    continue
+                self.in_string = False
+            elif char == '"':
+                self.in_string = True
+                continue
+            elif char in "[{":
+                self.depth += 1
+                continue
+            else:
+                self.depth -= 1
+            if self.depth == 0:
+                return pos
+        return None
+
+
+class CompletedFieldScanner:
+    """
+    Pull fields whose values have fully arrived out of streamed LLM JSON.
+
+    Chunks are fed as they arrive and each one is scanned once per pending
+    field: first for the field's key, then for the string and bracket
+    nesting of its value. A value is decoded exactly once, when it closes,
+    so a large field that is still streaming is never re-parsed.
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        self._fields = [_FieldProgress(name) for name in fields]
+
+    @property
+    def pending(self) -> bool:
+        """Whether any field is still waiting for its value."""
+        return bool(self._fields)
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Scan the next chunk and return the fields it completed."""
+        completed = []
+        for field in list(self._fields):
+            finished, value = field.feed(chunk)
+            if finished:
+                self._fields.remove(field)
+                if value is not _MALFORMED:
+                    completed.append((field.name, value))
+        return completed
+
+
+async def stream_chat_events(
+    client: httpx.AsyncClient,
+    chat_endpoint: str,
+    payload: Dict[str, Any],
+    fields: Iterable[str],
+    parts: List[str],
+    on_status: Optional[Callable[[int], None]] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Stream an Ollama chat reply as NDJSON "chunk" and "field" events.
+
+    Each content token is forwarded as a chunk event and appended to
+    ``parts``, so the caller can join the full reply once the stream ends.
+    A field event is emitted as soon as one of ``fields`` has fully arrived.
+    ``on_status`` sees the response status before it is checked.
+
+    Raises:
+        RuntimeError: If the LLM answers with a non-200 status.
+        httpx.HTTPError: If the request itself fails.
+    """
+    field_scanner = CompletedFieldScanner(fields)
+    async with client.stream(
+        "POST", chat_endpoint, content=orjson.dumps(payload), headers=JSON_HEADERS
+    ) as response:
+        if on_status is not None:
+            on_status(response.status_code)
+        if response.status_code != 200:
+            raise RuntimeError(f"LLM request failed: {response.status_code}")
+
+        async for line in response.aiter_lines():
+            if not line.strip():
+                continue
+            try:
+                chunk = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            content = chunk.get("message", {}).get("content", "")
+            if not content:
+                continue
+            parts.append(content)
+            yield ndjson_line({"type": "chunk", "content": content})
+            if field_scanner.pending:
+                for name, value in field_scanner.feed(content):
+                    yield ndjson_line({"type": "field", "name": name, "value": value})
+
+
+def ndjson_line(event: Dict[str, Any]) -> bytes:
+    """Encode a single NDJSON stream event."""
+    return orjson.dumps(event) + b"\n"
@@ -7,7 +7,9 @@ This is used as a fallback when Redis is not available.
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from datetime import timedelta
 from typing import Any, Dict, List, Optional
 
 from app.domain.interfaces.cache_repository import ICacheRepository
@@ -16,28 +18,32 @@ logger = logging.getLogger(__name__)
 
 
 class CacheEntry:
-    """Internal representation of a cached value."""
+    """Internal representation of a cached value.
+
+    Expiry is a time.monotonic() deadline: float comparisons are far cheaper
+    than building datetimes on every lookup, and wall-clock jumps cannot
+    expire or resurrect entries. Recency is tracked by the cache's ordering.
+    """
+
+    __slots__ = ("value", "expires_at", "hit_count")
 
     def __init__(
         self,
         value: Any,
-        expires_at: Optional[datetime] = None,
+        expires_at: Optional[float] = None,
     ):
         self.value = value
-        self.created_at = datetime.utcnow()
         self.expires_at = expires_at
-        self.last_accessed = datetime.utcnow()
         self.hit_count = 0
 
     def is_expired(self) -> bool:
         """Check if entry has expired."""
         if self.expires_at is None:
             return False
-        return datetime.utcnow() > self.expires_at
+        return time.monotonic() > self.expires_at
 
     def access(self) -> Any:
         """Record access and return value."""
-        self.last_accessed = datetime.utcnow()
         self.hit_count += 1
         return self.value
 
@@ -70,7 +76,8 @@ class InMemoryCacheRepository(ICacheRepository):
             default_ttl: Default time-to-live for cached values.
             max_size: Maximum number of entries before LRU eviction.
         """
-        self._cache: Dict[str, CacheEntry] = {}
+        # Ordered oldest-to-newest access so LRU eviction is a popitem() away
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._default_ttl = default_ttl
         self._max_size = max_size
         self._lock = asyncio.Lock()
@@ -94,6 +101,7 @@ class InMemoryCacheRepository(ICacheRepository):
                 return None
 
             self._hits += 1
+            self._cache.move_to_end(key)
             return entry.access()
 
     async def set(
@@ -104,10 +112,11 @@ class InMemoryCacheRepository(ICacheRepository):
     ) -> None:
         """Store a value in the cache."""
         actual_ttl = ttl or self._default_ttl
-        expires_at = datetime.utcnow() + actual_ttl
+        expires_at = time.monotonic() + actual_ttl.total_seconds()
 
         async with self._lock:
             self._cache[key] = CacheEntry(value, expires_at)
+            self._cache.move_to_end(key)
             await self._evict_if_needed()
 
     async def delete(self, key: str) -> bool:
@@ -186,19 +195,22 @@ class InMemoryCacheRepository(ICacheRepository):
         return True
 
     async def _evict_if_needed(self) -> None:
-        """Evict entries if cache is too large (LRU eviction)."""
-        # First, remove expired entries
-        expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
-        for key in expired_keys:
-            del self._cache[key]
-
-        # If still too large, remove LRU entries
-        if len(self._cache) > self._max_size:
-            # Sort by last_accessed (oldest first)
-            sorted_entries = sorted(
-                self._cache.items(), key=lambda x: x[1].last_accessed
-            )
-            entries_to_remove = len(self._cache) - self._max_size
-            for key, _ in sorted_entries[:entries_to_remove]:
-                del self._cache[key]
-            logger.debug(f"Evicted {entries_to_remove} LRU entries from cache")
+        """Drop expired entries at the cold end, then evict LRU entries if too large.
+
+        Entries that are never requested again drift to the cold end of the
+        ordering, so popping expired ones from there reclaims them without
+        sweeping the whole cache; the walk stops at the first live entry.
+        """
+        evicted = 0
+        while self._cache:
+            oldest_key = next(iter(self._cache))
+            if not self._cache[oldest_key].is_expired():
+                break
+            del self._cache[oldest_key]
+            evicted += 1
+
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+            evicted += 1
+        if evicted:
+            logger.debug(f"Evicted {evicted} expired/LRU entries from cache")
@@ -2,8 +2,9 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
-from app.api.deps import cleanup_dependencies
+from app.api.deps import cleanup_dependencies, get_llm_service
 from app.api.v1.api import api_router
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -32,6 +33,13 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize provider: {str(e)}")
         # Continue anyway - endpoints will handle errors gracefully
 
+    # Startup: Build the shared LLM service so its pooled keep-alive client
+    # exists before the first analysis request instead of during it
+    try:
+        get_llm_service()
+    except Exception as e:
+        logger.error(f"Failed to initialize LLM service: {str(e)}")
+
     # Startup: Initialize RAG knowledge bases
     try:
         logger.info("Initializing RAG knowledge bases...")
@@ -76,6 +84,12 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# Compress large JSON bodies (security and attack path reports shrink 5-10x).
+# Token streams opt out by sending app.core.streaming.STREAM_HEADERS: their
+# "Content-Encoding: identity" makes the middleware pass the body through
+# untouched instead of buffering events into gzip blocks.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include the aggregated v1 API router
 # This includes all domain-specific routers plus legacy endpoints
 app.include_router(api_router)
@@ -0,0 +1,43 @@
+"""
+Pydantic schemas for validation issue explanation endpoints.
+"""
+
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class ExplanationRequest(BaseModel):
+    """Request for an AI explanation of a validation issue or suggestion."""
+
+    rule_id: str = Field(..., description="The validation rule identifier")
+    message: str = Field(..., description="The validation error message")
+    category: str = Field(
+        default="general",
+        description="Category of the issue (e.g., 'security', 'style')",
+    )
+    spec_text: str = Field(default="", description="Relevant spec excerpt")
+    context: Dict[str, Any] = Field(
+        default_factory=dict, description="Additional context information"
+    )
+
+    @field_validator("category", "spec_text", "context", mode="before")
+    @classmethod
+    def null_to_default(cls, v, info):
+        """The Java backend sends explicit nulls for unset optional fields"""
+        if v is None:
+            return cls.model_fields[info.field_name].get_default(
+                call_default_factory=True
+            )
+        return v
+
+
+class ExplanationBatchRequest(BaseModel):
+    """Request for explanations of several validation issues at once."""
+
+    issues: List[ExplanationRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Validation issues to explain, answered in the same order",
+    )
@@ -2,9 +2,16 @@
 JSON Patch (RFC 6902) schemas for precise spec modifications.
 """
 
-from typing import Any, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 
 class JsonPatchOperation(BaseModel):
@@ -21,35 +28,43 @@ class JsonPatchOperation(BaseModel):
         None, alias="from", description="Source path for move/copy operations"
     )
 
-    @validator("path")
+    model_config = ConfigDict(populate_by_name=True)
+
+    @field_validator("path")
+    @classmethod
     def validate_path(cls, v):
         """Ensure path starts with /"""
         if not v.startswith("/"):
             raise ValueError("JSON Pointer path must start with /")
         return v
 
-    @validator("value")
-    def validate_value_required(cls, v, values):
+    @field_validator("value")
+    @classmethod
+    def validate_value_required(cls, v, info: ValidationInfo):
         """Ensure value is present for operations that require it"""
-        if values.get("op") in ["add", "replace", "test"] and v is None:
-            raise ValueError(f"Value is required for {values.get('op')} operation")
+        op = info.data.get("op")
+        if op in ("add", "replace", "test") and v is None:
+            raise ValueError(f"Value is required for {op} operation")
         return v
 
-    @validator("from_path")
-    def validate_from_required(cls, v, values):
+    @field_validator("from_path")
+    @classmethod
+    def validate_from_required(cls, v, info: ValidationInfo):
         """Ensure from is present for operations that require it"""
-        if values.get("op") in ["move", "copy"] and v is None:
-            raise ValueError(f"'from' is required for {values.get('op')} operation")
+        op = info.data.get("op")
+        if op in ("move", "copy") and v is None:
+            raise ValueError(f"'from' is required for {op} operation")
         return v
 
-    class Config:
-        allow_population_by_field_name = True
-
 
 class PatchGenerationRequest(BaseModel):
     """Request to generate JSON Patch for a fix."""
 
-    spec_text: str = Field(..., description="OpenAPI specification")
+    spec_text: Optional[str] = Field(None, description="OpenAPI specification")
+    spec: Optional[Dict[str, Any]] = Field(
+        None,
+        description="OpenAPI specification as a JSON object (used instead of spec_text)",
+    )
     rule_id: str = Field(..., description="Rule identifier for the fix")
     context: dict = Field(
         default_factory=dict, description="Additional context for the fix"
@@ -58,6 +73,13 @@ class PatchGenerationRequest(BaseModel):
         None, description="The suggestion message"
     )
 
+    @model_validator(mode="after")
+    def require_spec(self):
+        """Ensure the spec is provided either as text or as an object"""
+        if self.spec is None and self.spec_text is None:
+            raise ValueError("Either 'spec' or 'spec_text' is required")
+        return self
+
 
 class PatchGenerationResponse(BaseModel):
     """Response containing JSON Patch operations."""
@@ -80,7 +102,13 @@ class PatchGenerationResponse(BaseModel):
 class PatchApplicationRequest(BaseModel):
     """Request to apply JSON Patch to spec."""
 
-    spec_text: str = Field(..., description="OpenAPI specification to modify")
+    spec_text: Optional[str] = Field(
+        None, description="OpenAPI specification to modify"
+    )
+    spec: Optional[Dict[str, Any]] = Field(
+        None,
+        description="OpenAPI specification to modify as a JSON object (used instead of spec_text)",
+    )
     patches: List[JsonPatchOperation] = Field(
         ..., description="Patch operations to apply"
     )
@@ -88,6 +116,13 @@ class PatchApplicationRequest(BaseModel):
         default=True, description="Validate spec after applying patch"
     )
 
+    @model_validator(mode="after")
+    def require_spec(self):
+        """Ensure the spec is provided either as text or as an object"""
+        if self.spec is None and self.spec_text is None:
+            raise ValueError("Either 'spec' or 'spec_text' is required")
+        return self
+
 
 class PatchApplicationResponse(BaseModel):
     """Response after applying JSON Patch."""
@@ -8,7 +8,11 @@ requests, ensuring all required analysis data is present and properly formatted.
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Analyzer payloads are read-only inputs: freezing them rules out accidental
+# mutation between the cache key being computed and the prompt being built
+_ANALYSIS_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 
 class RiskLevel(str, Enum):
@@ -23,6 +27,8 @@ class RiskLevel(str, Enum):
 class TaintVulnerability(BaseModel):
     """A single taint analysis vulnerability."""
 
+    model_config = _ANALYSIS_MODEL_CONFIG
+
     endpoint: str = Field(..., description="The affected API endpoint")
     severity: str = Field(..., description="Vulnerability severity (CRITICAL, WARNING)")
     source: Optional[str] = Field(default=None, description="Data source location")
@@ -35,6 +41,8 @@ class TaintVulnerability(BaseModel):
 class TaintAnalysisRequest(BaseModel):
     """Request model for AI-powered taint analysis interpretation."""
 
+    model_config = _ANALYSIS_MODEL_CONFIG
+
     vulnerabilities: List[TaintVulnerability] = Field(
         default_factory=list,
         description="List of taint vulnerabilities from backend analyzer",
@@ -48,6 +56,8 @@ class TaintAnalysisRequest(BaseModel):
 class AuthorizationMatrixRequest(BaseModel):
     """Request model for AI-powered authorization matrix interpretation."""
 
+    model_config = _ANALYSIS_MODEL_CONFIG
+
     scopes: List[str] = Field(
         default_factory=list,
         description="All OAuth2 scopes/roles defined in the API",
@@ -65,6 +75,8 @@ class AuthorizationMatrixRequest(BaseModel):
 class SchemaCluster(BaseModel):
     """A cluster of similar schemas detected by the similarity analyzer."""
 
+    model_config = _ANALYSIS_MODEL_CONFIG
+
     schemas: List[str] = Field(..., description="Names of similar schemas")
     similarity_score: float = Field(
         ..., ge=0.0, le=1.0, description="How similar the schemas are"
@@ -77,6 +89,8 @@ class SchemaCluster(BaseModel):
 class SchemaSimilarityRequest(BaseModel):
     """Request model for AI-powered schema similarity interpretation."""
 
+    model_config = _ANALYSIS_MODEL_CONFIG
+
     clusters: List[SchemaCluster] = Field(
         default_factory=list,
         description="Schema clusters from similarity analyzer",
@@ -90,6 +104,8 @@ class SchemaSimilarityRequest(BaseModel):
 class ZombieApiRequest(BaseModel):
     """Request model for AI-powered zombie API detection interpretation."""
 
+    model_config = _ANALYSIS_MODEL_CONFIG
+
     shadowedEndpoints: List[Dict[str, Any]] = Field(
         default_factory=list,
         description="Endpoints unreachable due to routing conflicts",
@@ -107,6 +123,8 @@ class ZombieApiRequest(BaseModel):
 class ComprehensiveAnalysisRequest(BaseModel):
     """Request model for comprehensive architectural analysis combining all analyzers."""
 
+    model_config = _ANALYSIS_MODEL_CONFIG
+
     taint_analysis: Optional[Dict[str, Any]] = Field(
         default=None,
         description="Results from taint analyzer",
@@ -127,3 +145,26 @@ class ComprehensiveAnalysisRequest(BaseModel):
         default=None,
         description="OpenAPI specification for additional context",
     )
+
+
+class FullArchitectureAnalysisRequest(BaseModel):
+    """Request model for architecture analysis that interprets each analyzer first."""
+
+    model_config = _ANALYSIS_MODEL_CONFIG
+
+    taint_analysis: Optional[TaintAnalysisRequest] = Field(
+        default=None,
+        description="Taint analysis findings to interpret",
+    )
+    authz_matrix: Optional[AuthorizationMatrixRequest] = Field(
+        default=None,
+        description="Authorization matrix to interpret",
+    )
+    schema_similarity: Optional[SchemaSimilarityRequest] = Field(
+        default=None,
+        description="Schema similarity clusters to interpret",
+    )
+    zombie_apis: Optional[ZombieApiRequest] = Field(
+        default=None,
+        description="Zombie API findings to interpret",
+    )
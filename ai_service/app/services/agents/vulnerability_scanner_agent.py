@@ -67,16 +67,13 @@ class VulnerabilityScannerAgent(BaseAgent):
             context.current_activity = "Running security analyzers..."
             context.progress_percentage = 10.0
 
-            # Run the comprehensive security analysis
-            # Convert spec dict back to JSON string for the analyzer
-            import json
-
-            spec_text = json.dumps(context.spec)
-
+            # Run the comprehensive security analysis on the already parsed spec
             logger.info(
                 f"[{self.name}] Analyzing spec with {len(context.spec.get('paths', {}))} endpoints"
             )
-            security_report = await self.security_workflow.analyze(spec_text)
+            security_report = await self.security_workflow.analyze_spec(
+                context.spec, context.spec_hash[:16]
+            )
 
             # Extract all issues from the report
             all_issues: List[SecurityIssue] = security_report.all_issues
@@ -10,6 +10,7 @@ Implements multi-level caching:
 import hashlib
 import json
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -30,10 +31,11 @@ class CacheService:
         self.default_ttl = timedelta(minutes=default_ttl_minutes)
         self.max_cache_size = max_cache_size
 
-        # Separate caches for different data types
-        self._spec_cache: Dict[str, Dict[str, Any]] = {}
-        self._test_cache: Dict[str, Dict[str, Any]] = {}
-        self._mock_cache: Dict[str, Dict[str, Any]] = {}
+        # Separate caches for different data types, each kept in
+        # least-recently-used order so eviction is O(1)
+        self._spec_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._test_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._mock_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
         # Cache metadata
         self._cache_stats = {
@@ -64,87 +66,103 @@ class CacheService:
             return True
         return datetime.utcnow() > cache_entry["expires_at"]
 
-    def _evict_expired(self, cache: Dict[str, Dict[str, Any]]) -> None:
-        """Remove expired entries from cache."""
-        expired_keys = [key for key, entry in cache.items() if self._is_expired(entry)]
-        for key in expired_keys:
-            del cache[key]
-
-    def _evict_lru(self, cache: Dict[str, Dict[str, Any]]) -> None:
+    def _evict_expired(self, cache: "OrderedDict[str, Dict[str, Any]]") -> None:
+        """Remove expired entries from the cold end of the cache.
+
+        Entries that are never requested again drift to the least recently
+        used end, so the walk stops at the first live entry instead of
+        sweeping the whole cache; anything expired further in is dropped
+        when it is next looked up.
+        """
+        while cache:
+            oldest_key = next(iter(cache))
+            if not self._is_expired(cache[oldest_key]):
+                break
+            del cache[oldest_key]
+
+    def _evict_lru(self, cache: "OrderedDict[str, Dict[str, Any]]") -> None:
         """Evict least recently used items if cache is too large."""
-        if len(cache) > self.max_cache_size:
-            # Sort by last accessed time and remove oldest
-            sorted_items = sorted(
-                cache.items(), key=lambda x: x[1].get("last_accessed", datetime.min)
-            )
-            items_to_remove = len(cache) - self.max_cache_size
-            for key, _ in sorted_items[:items_to_remove]:
-                del cache[key]
+        while len(cache) > self.max_cache_size:
+            cache.popitem(last=False)
+
+    def _lookup(
+        self, cache: "OrderedDict[str, Dict[str, Any]]", cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return a live entry and mark it most recently used."""
+        entry = cache.get(cache_key)
+        if entry is None:
+            return None
+        if self._is_expired(entry):
+            del cache[cache_key]
+            return None
+        cache.move_to_end(cache_key)
+        entry["last_accessed"] = datetime.utcnow()
+        return entry
+
+    def spec_key(self, spec_text: str) -> str:
+        """
+        Digest identifying a specification in the caches.
+
+        Compute it once per request and pass it to the spec-keyed methods
+        below so a large spec is only hashed once.
+        """
+        return self._generate_cache_key(spec_text)
 
     # ==================== Spec Parsing Cache ====================
 
-    def get_parsed_spec(self, spec_text: str) -> Optional[Dict[str, Any]]:
+    def get_parsed_spec(self, spec_key: str) -> Optional[Dict[str, Any]]:
         """Retrieve cached parsed specification."""
-        cache_key = self._generate_cache_key(spec_text)
-
-        self._evict_expired(self._spec_cache)
-
-        if cache_key in self._spec_cache:
-            entry = self._spec_cache[cache_key]
-            if not self._is_expired(entry):
-                entry["last_accessed"] = datetime.utcnow()
-                self._cache_stats["spec_hits"] += 1
-                logger.debug(f"Spec cache HIT for key {cache_key}")
-                return entry["data"]
+        entry = self._lookup(self._spec_cache, spec_key)
+        if entry is not None:
+            self._cache_stats["spec_hits"] += 1
+            logger.debug(f"Spec cache HIT for key {spec_key}")
+            return entry["data"]
 
         self._cache_stats["spec_misses"] += 1
-        logger.debug(f"Spec cache MISS for key {cache_key}")
+        logger.debug(f"Spec cache MISS for key {spec_key}")
         return None
 
     def cache_parsed_spec(
         self,
-        spec_text: str,
+        spec_key: str,
         parsed_spec: Dict[str, Any],
         ttl_minutes: Optional[int] = None,
     ) -> None:
         """Cache a parsed specification."""
-        cache_key = self._generate_cache_key(spec_text)
         ttl = timedelta(minutes=ttl_minutes) if ttl_minutes else self.default_ttl
 
-        self._spec_cache[cache_key] = {
+        self._spec_cache[spec_key] = {
             "data": parsed_spec,
             "created_at": datetime.utcnow(),
             "expires_at": datetime.utcnow() + ttl,
             "last_accessed": datetime.utcnow(),
         }
 
+        self._spec_cache.move_to_end(spec_key)
+        self._evict_expired(self._spec_cache)
         self._evict_lru(self._spec_cache)
-        logger.debug(f"Cached parsed spec with key {cache_key}")
+        logger.debug(f"Cached parsed spec with key {spec_key}")
 
     # ==================== Test Case Cache ====================
 
     def get_test_cases(
-        self, spec_text: str, path: str, method: str, include_ai_tests: bool = True
+        self, spec_key: str, path: str, method: str, include_ai_tests: bool = True
     ) -> Optional[Dict[str, Any]]:
         """Retrieve cached test cases for an endpoint."""
         cache_key = self._generate_cache_key(
             {
-                "spec": self._generate_cache_key(spec_text),  # Use spec hash
+                "spec": spec_key,
                 "path": path,
                 "method": method,
                 "include_ai": include_ai_tests,
             }
         )
 
-        self._evict_expired(self._test_cache)
-
-        if cache_key in self._test_cache:
-            entry = self._test_cache[cache_key]
-            if not self._is_expired(entry):
-                entry["last_accessed"] = datetime.utcnow()
-                self._cache_stats["test_hits"] += 1
-                logger.debug(f"Test cache HIT for {method} {path}")
-                return entry["data"]
+        entry = self._lookup(self._test_cache, cache_key)
+        if entry is not None:
+            self._cache_stats["test_hits"] += 1
+            logger.debug(f"Test cache HIT for {method} {path}")
+            return entry["data"]
 
         self._cache_stats["test_misses"] += 1
         logger.debug(f"Test cache MISS for {method} {path}")
@@ -152,7 +170,7 @@ class CacheService:
 
     def cache_test_cases(
         self,
-        spec_text: str,
+        spec_key: str,
         path: str,
         method: str,
         include_ai_tests: bool,
@@ -162,7 +180,7 @@ class CacheService:
         """Cache generated test cases."""
         cache_key = self._generate_cache_key(
             {
-                "spec": self._generate_cache_key(spec_text),
+                "spec": spec_key,
                 "path": path,
                 "method": method,
                 "include_ai": include_ai_tests,
@@ -177,18 +195,20 @@ class CacheService:
             "last_accessed": datetime.utcnow(),
         }
 
+        self._test_cache.move_to_end(cache_key)
+        self._evict_expired(self._test_cache)
         self._evict_lru(self._test_cache)
         logger.debug(f"Cached test cases for {method} {path}")
 
     # ==================== Mock Data Cache ====================
 
     def get_mock_data(
-        self, spec_text: str, path: str, method: str, response_code: str, count: int
+        self, spec_key: str, path: str, method: str, response_code: str, count: int
     ) -> Optional[List[Dict[str, Any]]]:
         """Retrieve cached mock data variations."""
         cache_key = self._generate_cache_key(
             {
-                "spec": self._generate_cache_key(spec_text),
+                "spec": spec_key,
                 "path": path,
                 "method": method,
                 "code": response_code,
@@ -196,15 +216,11 @@ class CacheService:
             }
         )
 
-        self._evict_expired(self._mock_cache)
-
-        if cache_key in self._mock_cache:
-            entry = self._mock_cache[cache_key]
-            if not self._is_expired(entry):
-                entry["last_accessed"] = datetime.utcnow()
-                self._cache_stats["mock_hits"] += 1
-                logger.debug(f"Mock cache HIT for {method} {path} ({response_code})")
-                return entry["data"]
+        entry = self._lookup(self._mock_cache, cache_key)
+        if entry is not None:
+            self._cache_stats["mock_hits"] += 1
+            logger.debug(f"Mock cache HIT for {method} {path} ({response_code})")
+            return entry["data"]
 
         self._cache_stats["mock_misses"] += 1
         logger.debug(f"Mock cache MISS for {method} {path} ({response_code})")
@@ -212,7 +228,7 @@ class CacheService:
 
     def cache_mock_data(
         self,
-        spec_text: str,
+        spec_key: str,
         path: str,
         method: str,
         response_code: str,
@@ -223,7 +239,7 @@ class CacheService:
         """Cache generated mock data."""
         cache_key = self._generate_cache_key(
             {
-                "spec": self._generate_cache_key(spec_text),
+                "spec": spec_key,
                 "path": path,
                 "method": method,
                 "code": response_code,
@@ -239,6 +255,8 @@ class CacheService:
             "last_accessed": datetime.utcnow(),
         }
 
+        self._mock_cache.move_to_end(cache_key)
+        self._evict_expired(self._mock_cache)
         self._evict_lru(self._mock_cache)
         logger.debug(f"Cached mock data for {method} {path} ({response_code})")
 
@@ -253,12 +271,12 @@ class CacheService:
             del self._spec_cache[spec_key]
 
         # Remove related test and mock caches
-        self._test_cache = {
-            k: v for k, v in self._test_cache.items() if not k.startswith(spec_key)
-        }
-        self._mock_cache = {
-            k: v for k, v in self._mock_cache.items() if not k.startswith(spec_key)
-        }
+        self._test_cache = OrderedDict(
+            (k, v) for k, v in self._test_cache.items() if not k.startswith(spec_key)
+        )
+        self._mock_cache = OrderedDict(
+            (k, v) for k, v in self._mock_cache.items() if not k.startswith(spec_key)
+        )
 
         logger.info(f"Invalidated cache for spec {spec_key}")
 
@@ -37,9 +37,16 @@ class LLMService:
 
     def __init__(self, auto_close_client: bool = False):
         self.logger = get_logger("llm_service")
+        # get_llm_service() caches this service, so every Ollama call made
+        # through it shares one pooled keep-alive client
         self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(settings.request_timeout),
-            limits=httpx.Limits(max_connections=settings.max_concurrent_requests),
+            http2=True,
+            timeout=httpx.Timeout(settings.request_timeout, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=settings.max_concurrent_requests,
+                max_keepalive_connections=settings.max_concurrent_requests,
+                keepalive_expiry=30.0,
+            ),
         )
         self.base_url = settings.ollama_base_url
         self.chat_endpoint = f"{self.base_url}{settings.ollama_chat_endpoint}"
@@ -10,9 +10,10 @@ Two Specialized Knowledge Bases:
 Each agent consults its specialized KB, becoming a domain expert.
 """
 
+import asyncio
 import hashlib
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 try:
     import chromadb
@@ -226,6 +227,25 @@ class RAGService:
                 "relevance_scores": [],
             }
 
+    async def embed_text(self, text: str) -> Optional[List[float]]:
+        """
+        Embed text with the local model for similarity lookups.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Unit-length embedding (so a dot product is the cosine similarity),
+            or None if the embedding model is not loaded
+        """
+        if self.embedding_model is None:
+            return None
+
+        embedding = await asyncio.to_thread(
+            self.embedding_model.encode, text, normalize_embeddings=True
+        )
+        return embedding.tolist()
+
     def _format_rag_results(
         self, results: Dict[str, Any], kb_name: str
     ) -> Dict[str, Any]:
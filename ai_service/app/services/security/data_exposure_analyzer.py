@@ -27,28 +27,39 @@ class DataExposureAnalyzer:
     - OWASP API3 and API6 compliance
     """
 
-    # Common PII field patterns
+    # Common PII field patterns (compiled once at class definition)
     PII_PATTERNS = {
-        "email": r"email|e-mail|emailaddress",
-        "phone": r"phone|telephone|mobile|cell",
-        "ssn": r"ssn|social.?security|tax.?id",
-        "passport": r"passport",
-        "license": r"driver.?license|license.?number",
-        "dob": r"birth.?date|dob|date.?of.?birth",
-        "name": r"^name$|first.?name|last.?name|full.?name|given.?name|surname",
-        "address": r"address|street|city|zipcode|postal|zip.?code",
-        "credit_card": r"card.?number|credit.?card|cc.?number|pan",
-        "cvv": r"cvv|cvc|card.?verification",
-        "bank_account": r"account.?number|bank.?account|routing.?number",
+        "email": re.compile(r"email|e-mail|emailaddress", re.IGNORECASE),
+        "phone": re.compile(r"phone|telephone|mobile|cell", re.IGNORECASE),
+        "ssn": re.compile(r"ssn|social.?security|tax.?id", re.IGNORECASE),
+        "passport": re.compile(r"passport", re.IGNORECASE),
+        "license": re.compile(r"driver.?license|license.?number", re.IGNORECASE),
+        "dob": re.compile(r"birth.?date|dob|date.?of.?birth", re.IGNORECASE),
+        "name": re.compile(
+            r"^name$|first.?name|last.?name|full.?name|given.?name|surname",
+            re.IGNORECASE,
+        ),
+        "address": re.compile(
+            r"address|street|city|zipcode|postal|zip.?code", re.IGNORECASE
+        ),
+        "credit_card": re.compile(
+            r"card.?number|credit.?card|cc.?number|pan", re.IGNORECASE
+        ),
+        "cvv": re.compile(r"cvv|cvc|card.?verification", re.IGNORECASE),
+        "bank_account": re.compile(
+            r"account.?number|bank.?account|routing.?number", re.IGNORECASE
+        ),
     }
 
     # Sensitive data patterns
     SENSITIVE_PATTERNS = {
-        "password": r"password|passwd|pwd",
-        "token": r"token|access.?token|refresh.?token|api.?key",
-        "secret": r"secret|private.?key|secret.?key",
-        "auth": r"authorization|bearer",
-        "session": r"session.?id|session.?token",
+        "password": re.compile(r"password|passwd|pwd", re.IGNORECASE),
+        "token": re.compile(
+            r"token|access.?token|refresh.?token|api.?key", re.IGNORECASE
+        ),
+        "secret": re.compile(r"secret|private.?key|secret.?key", re.IGNORECASE),
+        "auth": re.compile(r"authorization|bearer", re.IGNORECASE),
+        "session": re.compile(r"session.?id|session.?token", re.IGNORECASE),
     }
 
     def __init__(self):
@@ -210,7 +221,7 @@ class DataExposureAnalyzer:
 
             # Check for PII
             for pii_type, pattern in self.PII_PATTERNS.items():
-                if re.search(pattern, prop_lower, re.IGNORECASE):
+                if pattern.search(prop_lower):
                     pii_fields.append(
                         {
                             "schema": schema_name,
@@ -223,7 +234,7 @@ class DataExposureAnalyzer:
 
             # Check for sensitive data
             for sensitive_type, pattern in self.SENSITIVE_PATTERNS.items():
-                if re.search(pattern, prop_lower, re.IGNORECASE):
+                if pattern.search(prop_lower):
                     sensitive_fields.append(
                         {
                             "schema": schema_name,
@@ -255,7 +266,7 @@ class DataExposureAnalyzer:
             for prop_name in properties.keys():
                 prop_lower = prop_name.lower()
                 for pattern in self.PII_PATTERNS.values():
-                    if re.search(pattern, prop_lower, re.IGNORECASE):
+                    if pattern.search(prop_lower):
                         return True
 
         return False
@@ -270,7 +281,7 @@ class DataExposureAnalyzer:
         for schema_name, schema_def in schemas.items():
             properties = schema_def.get("properties", {})
             for prop_name, prop_def in properties.items():
-                if re.search(r"password|passwd|pwd", prop_name, re.IGNORECASE):
+                if self.SENSITIVE_PATTERNS["password"].search(prop_name):
                     # Check if it's write-only
                     if not prop_def.get("writeOnly", False):
                         issues.append(
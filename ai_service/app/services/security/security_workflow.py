@@ -5,12 +5,17 @@ Implements multi-agent security analysis with parallel execution.
 
 import asyncio
 import hashlib
-import json
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+
+import orjson
 
 from ...core.logging import get_logger
-from ...schemas.security_schemas import SecurityAnalysisReport, SecuritySeverity
+from ...schemas.security_schemas import (
+    SecurityAnalysisReport,
+    SecuritySeverity,
+    ValidationSuggestion,
+)
 from .authentication_analyzer import AuthenticationAnalyzer
 from .authorization_analyzer import AuthorizationAnalyzer
 from .data_exposure_analyzer import DataExposureAnalyzer
@@ -18,6 +23,29 @@ from .owasp_compliance_validator import OWASPComplianceValidator
 
 logger = get_logger("security.workflow")
 
+# Terms that mark a linter suggestion as security-related
+_SECURITY_KEYWORDS = (
+    "security",
+    "auth",
+    "authorization",
+    "authentication",
+    "oauth",
+    "api-key",
+    "token",
+    "credentials",
+    "password",
+    "secret",
+    "encrypt",
+    "https",
+    "ssl",
+    "tls",
+    "cors",
+    "csrf",
+    "xss",
+    "injection",
+    "vulnerability",
+)
+
 
 class SecurityAnalysisWorkflow:
     """
@@ -36,7 +64,9 @@ class SecurityAnalysisWorkflow:
         self.owasp_validator = OWASPComplianceValidator()
 
     async def analyze(
-        self, spec_text: str, validation_suggestions: list = None
+        self,
+        spec_text: str,
+        validation_suggestions: Optional[List[ValidationSuggestion]] = None,
     ) -> SecurityAnalysisReport:
         """
         Perform comprehensive security analysis on OpenAPI specification.
@@ -45,6 +75,39 @@ class SecurityAnalysisWorkflow:
             spec_text: OpenAPI specification as JSON/YAML string
             validation_suggestions: Optional list of validation suggestions for context
 
+        Returns:
+            SecurityAnalysisReport with complete security analysis
+        """
+        try:
+            # Parse spec
+            spec = orjson.loads(spec_text)
+        except orjson.JSONDecodeError:
+            # Try to handle YAML if needed
+            self.logger.error("Failed to parse spec as JSON")
+            raise ValueError("Invalid OpenAPI specification format")
+
+        # Calculate spec hash for caching
+        spec_hash = hashlib.sha256(spec_text.encode()).hexdigest()[:16]
+
+        return await self.analyze_spec(spec, spec_hash, validation_suggestions)
+
+    async def analyze_spec(
+        self,
+        spec: Dict[str, Any],
+        spec_hash: str,
+        validation_suggestions: Optional[List[ValidationSuggestion]] = None,
+    ) -> SecurityAnalysisReport:
+        """
+        Perform comprehensive security analysis on an already parsed specification.
+
+        Callers that hold the parsed spec (such as the attack path scanner) use
+        this to avoid serializing it back to text only for it to be re-parsed.
+
+        Args:
+            spec: Parsed OpenAPI specification
+            spec_hash: Hash identifying the specification in the report
+            validation_suggestions: Optional list of validation suggestions for context
+
         Returns:
             SecurityAnalysisReport with complete security analysis
         """
@@ -60,17 +123,6 @@ class SecurityAnalysisWorkflow:
                 f"{len(security_suggestions)} are security-related"
             )
 
-        try:
-            # Parse spec
-            spec = json.loads(spec_text)
-        except json.JSONDecodeError:
-            # Try to handle YAML if needed
-            self.logger.error("Failed to parse spec as JSON")
-            raise ValueError("Invalid OpenAPI specification format")
-
-        # Calculate spec hash for caching
-        spec_hash = hashlib.sha256(spec_text.encode()).hexdigest()[:16]
-
         # Run all analyzers in parallel for better performance
         self.logger.info("Running security analyzers in parallel")
 
@@ -293,33 +345,11 @@ class SecurityAnalysisWorkflow:
 
         return " ".join(summary_parts)
 
-    def _is_security_related(self, suggestion: Dict[str, Any]) -> bool:
+    def _is_security_related(self, suggestion: ValidationSuggestion) -> bool:
         """Check if a validation suggestion is security-related."""
         if not suggestion:
             return False
 
-        security_keywords = [
-            "security",
-            "auth",
-            "authorization",
-            "authentication",
-            "oauth",
-            "api-key",
-            "token",
-            "credentials",
-            "password",
-            "secret",
-            "encrypt",
-            "https",
-            "ssl",
-            "tls",
-            "cors",
-            "csrf",
-            "xss",
-            "injection",
-            "vulnerability",
-        ]
-
-        search_text = f"{suggestion.get('rule_id', '')} {suggestion.get('message', '')} {suggestion.get('category', '')}".lower()
-
-        return any(keyword in search_text for keyword in security_keywords)
+        search_text = f"{suggestion.rule_id or ''} {suggestion.message} {suggestion.category or ''}".lower()
+
+        return any(keyword in search_text for keyword in _SECURITY_KEYWORDS)
@@ -10,11 +10,7 @@ import time
 from typing import Tuple
 
 from app.schemas.ai_schemas import AIRequest, OperationType
-from app.schemas.patch_schemas import (
-    PatchGenerationRequest,
-    SmartAIFixRequest,
-    SmartAIFixResponse,
-)
+from app.schemas.patch_schemas import SmartAIFixRequest, SmartAIFixResponse
 from app.services.llm_service import LLMService
 from app.services.patch_generator import PatchGenerator, apply_json_patch
 
@@ -52,16 +48,15 @@ class SmartFixService:
             logger.error(f"Invalid JSON spec: {e}")
             raise ValueError(f"Invalid OpenAPI spec JSON: {e}")
 
-        # Decide which method to use
-        use_patches, reasoning = self._should_use_patches(request, spec)
-
-        logger.info(
-            f"Decision: {'PATCHES' if use_patches else 'FULL REGENERATION'} - {reasoning}"
-        )
-
+        # Decide which method to use; a forced regeneration skips the heuristics
         if request.force_full_regeneration:
             logger.info("Force full regeneration requested by user")
             use_patches = False
+        else:
+            use_patches, reasoning = self._should_use_patches(request)
+            logger.info(
+                f"Decision: {'PATCHES' if use_patches else 'FULL REGENERATION'} - {reasoning}"
+            )
 
         # Execute the appropriate method
         if use_patches:
@@ -71,9 +66,7 @@ class SmartFixService:
 
         return result
 
-    def _should_use_patches(
-        self, request: SmartAIFixRequest, spec: dict
-    ) -> Tuple[bool, str]:
+    def _should_use_patches(self, request: SmartAIFixRequest) -> Tuple[bool, str]:
         """
         Intelligently decide whether to use patches or full regeneration.
 
@@ -160,8 +153,9 @@ class SmartFixService:
         if patch_score > 0:
             return True, f"Targeted fix detected (patch indicators: {patch_score})"
 
-        # Rule 4: Check spec size - small specs can use full regen efficiently
-        spec_size = len(json.dumps(spec))
+        # Rule 4: Check spec size - small specs can use full regen efficiently.
+        # The raw text length is close enough and avoids re-serializing the spec.
+        spec_size = len(request.spec_text)
         if spec_size < 5000:  # < 5KB
             return False, f"Small spec ({spec_size} bytes), full regen is fast"
 
@@ -186,13 +180,6 @@ class SmartFixService:
         rule_id = self._infer_rule_from_prompt(request.prompt)
 
         # Generate patches
-        _ = PatchGenerationRequest(
-            spec_text=request.spec_text,
-            rule_id=rule_id,
-            context=context,
-            suggestion_message=request.prompt,
-        )
-
         patch_response = await self.patch_generator.generate_patch(
             spec=spec,
             rule_id=rule_id,
@@ -3,15 +3,49 @@ Test Case Generator Service.
 Generates comprehensive test cases for OpenAPI endpoints including happy paths and sad paths.
 """
 
+import asyncio
 import json
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.logging import get_logger
 from ..schemas.ai_schemas import AIRequest, OperationType
 
 logger = get_logger("test_case_generator")
 
+# One prompt covering several endpoints; filled with str.format, so literal
+# braces are doubled
+_BATCH_AI_PROMPT_TEMPLATE = """Generate advanced test case scenarios for each of these {count} API endpoints.
+
+{endpoints}
+
+For each endpoint, generate 3-5 creative test scenarios that test:
+1. Race conditions or concurrent access
+2. State transition edge cases
+3. Business logic validation
+4. Data consistency scenarios
+5. Performance/load edge cases
+
+For each test case, provide:
+- name: Short descriptive name
+- description: What this test validates
+- scenario: Detailed test scenario
+- expected_behavior: What should happen
+
+Return a JSON object keyed by the endpoint exactly as written in the headings
+above (for example "GET /users"), each value being a JSON array of test
+scenarios for that endpoint: {{"GET /users": [...], ...}}
+"""
+
+_BATCH_AI_ENDPOINT_TEMPLATE = """### {label}
+**Summary**: {summary}
+**Description**: {description}
+
+**Operation Details**:
+```json
+{operation}
+```"""
+
 
 class TestCaseType(str, Enum):
     """Types of test cases."""
@@ -101,7 +135,7 @@ class TestCaseGeneratorService:
         Returns:
             Dictionary containing happy path, sad path, and edge case tests
         """
-        self.logger.info(f"Generating test cases for {method.upper()} {path}")
+        self.logger.info("Generating test cases for %s %s", method.upper(), path)
 
         operation = spec["paths"][path][method.lower()]
 
@@ -137,11 +171,77 @@ class TestCaseGeneratorService:
                 result["ai_generated_tests"] = [t.to_dict() for t in ai_tests]
                 result["total_tests"] += len(ai_tests)
             except Exception as e:
-                self.logger.warning(f"AI test generation failed: {e}")
+                self.logger.warning("AI test generation failed: %s", e)
                 result["ai_generated_tests"] = []
 
         return result
 
+    async def generate_test_cases_batch(
+        self,
+        spec: Dict[str, Any],
+        endpoints: List[Tuple[str, str]],
+        include_ai_tests: bool = True,
+    ) -> List[Any]:
+        """
+        Generate test cases for several endpoints with one AI request.
+
+        Deterministic tests are built per endpoint exactly as in
+        generate_test_cases, but the AI scenarios for all endpoints come from a
+        single LLM call, so the spec and prompt are sent once rather than once
+        per endpoint. Endpoints the batched answer does not cover fall back to
+        their own AI request.
+
+        Args:
+            spec: Full OpenAPI specification
+            endpoints: (path, method) pairs to generate tests for
+            include_ai_tests: Whether to include AI-generated advanced tests
+
+        Returns:
+            One entry per endpoint, in order: its result dictionary, or the
+            exception raised while generating it
+        """
+        results: List[Any] = []
+        for path, method in endpoints:
+            try:
+                results.append(
+                    await self.generate_test_cases(
+                        spec, path, method, include_ai_tests=False
+                    )
+                )
+            except Exception as e:
+                results.append(e)
+
+        if not include_ai_tests:
+            return results
+
+        generated = [
+            (path, method, result)
+            for (path, method), result in zip(endpoints, results)
+            if not isinstance(result, Exception)
+        ]
+        batch_scenarios = await self._generate_ai_scenarios_batch(
+            spec, [(path, method) for path, method, _ in generated]
+        )
+
+        async def ai_tests_for(path: str, method: str, label: str) -> List[TestCase]:
+            scenarios = batch_scenarios.get(label)
+            if scenarios is not None:
+                return self._scenarios_to_tests(scenarios, path, method)
+            operation = spec["paths"][path][method.lower()]
+            return await self._generate_ai_test_cases(spec, path, method, operation)
+
+        all_ai_tests = await asyncio.gather(
+            *(
+                ai_tests_for(path, method, result["endpoint"])
+                for path, method, result in generated
+            )
+        )
+        for (_, _, result), ai_tests in zip(generated, all_ai_tests):
+            result["ai_generated_tests"] = [t.to_dict() for t in ai_tests]
+            result["total_tests"] += len(ai_tests)
+
+        return results
+
     async def _generate_happy_path_tests(
         self, spec: Dict[str, Any], path: str, method: str, operation: Dict[str, Any]
     ) -> List[TestCase]:
@@ -155,7 +255,7 @@ class TestCaseGeneratorService:
         )
 
         if not success_response:
-            self.logger.warning(f"No success response defined for {method} {path}")
+            self.logger.warning("No success response defined for %s %s", method, path)
             return tests
 
         expected_status = (
@@ -541,39 +641,113 @@ Return as a JSON array of test scenarios.
             result = await self.llm_service.process_ai_request(ai_request)
 
             # Parse AI response
-            response_text = result.updated_spec_text.strip()
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                response_text = "\n".join(lines[1:-1])
-                if response_text.startswith("json"):
-                    response_text = response_text[4:].strip()
-
-            scenarios = json.loads(response_text)
+            scenarios = self._parse_ai_json(result.updated_spec_text)
 
             # Convert to TestCase objects
-            tests = []
-            for i, scenario in enumerate(scenarios):
-                test = TestCase(
-                    name=f"AI Test - {scenario.get('name', f'Scenario {i+1}')}",
-                    description=scenario.get("description", ""),
-                    test_type=TestCaseType.EDGE_CASE,
-                    method=method.upper(),
-                    path=path,
-                    expected_status=200,
-                    assertions=[
-                        scenario.get("expected_behavior", "Test should pass"),
-                        "AI-generated advanced scenario",
-                    ],
-                )
-                tests.append(test)
+            tests = self._scenarios_to_tests(scenarios, path, method)
 
-            self.logger.info(f"Generated {len(tests)} AI test cases")
+            self.logger.info("Generated %d AI test cases", len(tests))
             return tests
 
         except Exception as e:
-            self.logger.error(f"AI test generation failed: {e}")
+            self.logger.error("AI test generation failed: %s", e)
             return []
 
+    async def _generate_ai_scenarios_batch(
+        self, spec: Dict[str, Any], endpoints: List[Tuple[str, str]]
+    ) -> Dict[str, List[Any]]:
+        """
+        Ask for AI test scenarios for several endpoints in one request.
+
+        Returns:
+            Scenario lists keyed by "METHOD /path"; empty when the answer
+            cannot be used, so every endpoint falls back to its own request
+        """
+        # A single endpoint gains nothing from the batch prompt
+        if len(endpoints) < 2:
+            return {}
+
+        self.logger.info(
+            "Generating AI-powered test cases for %d endpoints", len(endpoints)
+        )
+
+        sections = []
+        for path, method in endpoints:
+            operation = spec["paths"][path][method.lower()]
+            sections.append(
+                _BATCH_AI_ENDPOINT_TEMPLATE.format(
+                    label=f"{method.upper()} {path}",
+                    summary=operation.get("summary", "N/A"),
+                    description=operation.get("description", "N/A"),
+                    operation=json.dumps(operation, indent=2),
+                )
+            )
+        prompt = _BATCH_AI_PROMPT_TEMPLATE.format(
+            count=len(endpoints), endpoints="\n\n".join(sections)
+        )
+
+        try:
+            ai_request = AIRequest(
+                spec_text=json.dumps(spec, indent=2),
+                prompt=prompt,
+                operation_type=OperationType.GENERATE,
+            )
+            result = await self.llm_service.process_ai_request(ai_request)
+            answer = self._parse_ai_json(result.updated_spec_text)
+        except Exception as e:
+            self.logger.warning(
+                "Batched AI test generation failed, falling back per endpoint: %s", e
+            )
+            return {}
+
+        if not isinstance(answer, dict):
+            self.logger.warning(
+                "Batched AI test generation returned no endpoint mapping, "
+                "falling back per endpoint"
+            )
+            return {}
+
+        return {
+            label: scenarios
+            for label, scenarios in answer.items()
+            if isinstance(scenarios, list)
+        }
+
+    @staticmethod
+    def _parse_ai_json(response_text: str) -> Any:
+        """Parse an LLM JSON answer, tolerating a surrounding code fence."""
+        response_text = response_text.strip()
+        if response_text.startswith("```"):
+            lines = response_text.split("\n")
+            response_text = "\n".join(lines[1:-1])
+            if response_text.startswith("json"):
+                response_text = response_text[4:].strip()
+        return json.loads(response_text)
+
+    @staticmethod
+    def _scenarios_to_tests(
+        scenarios: List[Any], path: str, method: str
+    ) -> List[TestCase]:
+        """Convert AI test scenarios into edge case TestCase objects."""
+        tests = []
+        for i, scenario in enumerate(scenarios):
+            if not isinstance(scenario, dict):
+                continue
+            test = TestCase(
+                name=f"AI Test - {scenario.get('name', f'Scenario {i+1}')}",
+                description=scenario.get("description", ""),
+                test_type=TestCaseType.EDGE_CASE,
+                method=method.upper(),
+                path=path,
+                expected_status=200,
+                assertions=[
+                    scenario.get("expected_behavior", "Test should pass"),
+                    "AI-generated advanced scenario",
+                ],
+            )
+            tests.append(test)
+        return tests
+
     def _generate_valid_request_body(
         self, schema: Dict[str, Any], spec: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]: